@@ -0,0 +1,223 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Battle Simulator Module
+
+Monte Carlo balance testing: runs thousands of battles at once as NumPy
+arrays, following the same rules as combat_system.BattleEngine. Requires
+NumPy (the game itself does not).
+"""
+
+import numpy as np
+
+import character_manager
+import combat_system
+
+CHARACTER_CLASSES = ["Warrior", "Mage", "Rogue", "Cleric"]
+SIMULATED_POLICIES = ["attack", "ability", "random"]
+
+ATTACK, ABILITY, FLEE = 0, 1, 2
+
+# ============================================================================
+# BATTLE PARAMETERS
+# ============================================================================
+
+class _AlwaysHit:
+    def random(self):
+        return 0.0
+
+def _ability_effect(character, enemy):
+    """
+    (enemy damage, self heal, hit chance) of one use of the class ability,
+    measured by calling the combat_system ability on scratch copies
+    """
+    target = dict(enemy, health=10 ** 9)
+    user = dict(character, health=0, max_health=10 ** 9)
+    if character['class'] == "Rogue":
+        combat_system.rogue_critical_strike(user, target, _AlwaysHit())
+        hit_chance = 0.5
+    else:
+        combat_system.use_special_ability(user, target)
+        hit_chance = 1.0
+    return 10 ** 9 - target['health'], user['health'], hit_chance
+
+def battle_parameters(character, enemy):
+    """The per-battle constants the vectorized simulation needs"""
+    engine = combat_system.BattleEngine(character, enemy, None, record_events=False)
+    ability_damage, ability_heal, hit_chance = _ability_effect(character, enemy)
+    return {
+        'character_health': character['health'],
+        'max_health': character['max_health'],
+        'enemy_health': enemy['health'],
+        'attack_damage': engine.calculate_damage(character, enemy),
+        'enemy_damage': engine.calculate_damage(enemy, character),
+        'ability_damage': ability_damage,
+        'ability_heal': ability_heal,
+        'ability_hit_chance': hit_chance,
+    }
+
+# ============================================================================
+# VECTORIZED SIMULATION
+# ============================================================================
+
+def simulate_battles(character, enemy, battles=10000, policy="ability", rng=None,
+                     max_turns=combat_system.MAX_BATTLE_TURNS):
+    """
+    Run many independent battles of character against enemy at once
+
+    Each turn is applied to every battle still in progress with array
+    operations: the policy's action, basic attack damage, the class
+    ability (with cooldown and the rogue's 50% critical roll), the 50%
+    escape roll and the enemy's attack. Finished battles drop out of the
+    working arrays. Neither character nor enemy is modified.
+
+    Args:
+        policy: "attack", "ability" or "random" (as combat_system.POLICIES)
+        rng: numpy Generator or seed
+
+    Returns: dict of arrays, one entry per battle: 'player_won',
+             'escaped', 'draw' (bool), 'turns', 'character_health'
+    Raises: ValueError for an unknown policy
+    """
+    if policy not in SIMULATED_POLICIES:
+        raise ValueError(f"Unknown policy: {policy}")
+    rng = np.random.default_rng(rng)
+    params = battle_parameters(character, enemy)
+
+    player_won = np.zeros(battles, dtype=bool)
+    escaped = np.zeros(battles, dtype=bool)
+    draw = np.zeros(battles, dtype=bool)
+    turns = np.zeros(battles, dtype=np.int64)
+    final_health = np.zeros(battles, dtype=np.int64)
+
+    index = np.arange(battles)
+    character_health = np.full(battles, params['character_health'], dtype=np.int64)
+    enemy_health = np.full(battles, params['enemy_health'], dtype=np.int64)
+    cooldown = np.zeros(battles, dtype=np.int64)
+
+    def finish(done, turn):
+        ended = index[done]
+        turns[ended] = turn
+        final_health[ended] = character_health[done]
+        return ~done
+
+    turn = 1
+    while index.size:
+        count = index.size
+        cooldown = np.maximum(cooldown - 1, 0)
+        ready = cooldown == 0
+        if policy == "attack":
+            action = np.full(count, ATTACK)
+        elif policy == "ability":
+            action = np.where(ready, ABILITY, ATTACK)
+        else:
+            action = rng.integers(0, 3, size=count)
+
+        attacking = action == ATTACK
+        enemy_health -= np.where(attacking, params['attack_damage'], 0)
+
+        using = (action == ABILITY) & ready
+        hits = using
+        if params['ability_hit_chance'] < 1.0:
+            hits = using & (rng.random(count) < params['ability_hit_chance'])
+        enemy_health -= np.where(hits, params['ability_damage'], 0)
+        character_health = np.where(
+            using, np.minimum(character_health + params['ability_heal'], params['max_health']), character_health)
+        cooldown = np.where(using, combat_system.ABILITY_COOLDOWN, cooldown)
+        np.maximum(enemy_health, 0, out=enemy_health)
+
+        fled = (action == FLEE) & (rng.random(count) < 0.5)
+        won = enemy_health <= 0
+        player_won[index[won]] = True
+        escaped[index[fled & ~won]] = True
+        keep = finish(won | fled, turn)
+        index, character_health, enemy_health, cooldown = (
+            index[keep], character_health[keep], enemy_health[keep], cooldown[keep])
+
+        character_health -= params['enemy_damage']
+        np.maximum(character_health, 0, out=character_health)
+        lost = character_health <= 0
+        out_of_turns = ~lost if turn >= max_turns else np.zeros(index.size, dtype=bool)
+        draw[index[out_of_turns]] = True
+        keep = finish(lost | out_of_turns, turn)
+        index, character_health, enemy_health, cooldown = (
+            index[keep], character_health[keep], enemy_health[keep], cooldown[keep])
+        turn += 1
+
+    return {
+        'player_won': player_won,
+        'escaped': escaped,
+        'draw': draw,
+        'turns': turns,
+        'character_health': final_health,
+    }
+
+# ============================================================================
+# BALANCE SWEEPS
+# ============================================================================
+
+SUMMARY_COLUMNS = ["class", "level", "enemy", "policy", "battles", "win_rate", "escape_rate",
+                   "mean_turns_to_kill", "hp_left_mean", "hp_left_p10", "hp_left_p50", "hp_left_p90"]
+
+def summarize(outcomes):
+    """Win/escape rates, mean turns of won battles and final HP percentiles of won battles"""
+    won = outcomes['player_won']
+    health = outcomes['character_health'][won]
+    if health.size:
+        p10, p50, p90 = np.percentile(health, [10, 50, 90])
+        mean_turns = float(outcomes['turns'][won].mean())
+        mean_health = float(health.mean())
+    else:
+        p10 = p50 = p90 = mean_turns = mean_health = float("nan")
+    return {
+        'battles': int(won.size),
+        'win_rate': float(won.mean()),
+        'escape_rate': float(outcomes['escaped'].mean()),
+        'mean_turns_to_kill': mean_turns,
+        'hp_left_mean': mean_health,
+        'hp_left_p10': float(p10),
+        'hp_left_p50': float(p50),
+        'hp_left_p90': float(p90),
+    }
+
+def balance_sweep(levels=range(1, 51), classes=CHARACTER_CLASSES, enemy_types=None,
+                  policy="ability", battles=2000, seed=0):
+    """
+    Simulate every (class, level, enemy) combination
+
+    Every cell gets its own random stream spawned from seed, so a cell's
+    numbers do not depend on which other cells are in the sweep.
+    enemy_types defaults to every enemy in data/enemies.txt.
+
+    Returns: List of dicts with the SUMMARY_COLUMNS keys
+    """
+    if enemy_types is None:
+        enemy_types = combat_system.get_enemy_types()
+    cells = [(character_class, level, enemy_type)
+             for character_class in classes for level in levels for enemy_type in enemy_types]
+    streams = np.random.SeedSequence(seed).spawn(len(cells))
+    rows = []
+    for (character_class, level, enemy_type), stream in zip(cells, streams):
+        character = character_manager.create_character_at_level(character_class, character_class, level)
+        outcomes = simulate_battles(character, combat_system.create_enemy(enemy_type),
+                                    battles, policy, np.random.default_rng(stream))
+        row = {'class': character_class, 'level': level, 'enemy': enemy_type, 'policy': policy}
+        row.update(summarize(outcomes))
+        rows.append(row)
+    return rows
+
+def format_summary_table(rows):
+    """Render balance_sweep rows as an aligned text table"""
+    def cell(value):
+        return f"{value:.3f}" if isinstance(value, float) else str(value)
+
+    table = [SUMMARY_COLUMNS] + [[cell(row[column]) for column in SUMMARY_COLUMNS] for row in rows]
+    widths = [max(len(line[i]) for line in table) for i in range(len(SUMMARY_COLUMNS))]
+    return "\n".join("  ".join(value.rjust(width) for value, width in zip(line, widths)) for line in table)
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== BATTLE SIMULATOR TEST ===")
+    print(format_summary_table(balance_sweep(levels=[1, 5, 10], battles=1000)))
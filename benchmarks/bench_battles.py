@@ -0,0 +1,55 @@
+"""
+Benchmark: headless BattleEngine throughput (battles per second)
+
+Usage: python benchmarks/bench_battles.py [battles_per_case]
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import combat_system
+
+
+def run_battles(character_class, enemy_type, policy, count, record_events):
+    rng = random.Random(1)
+    template = character_manager.create_character("Bench", character_class)
+    start = time.perf_counter()
+    for _ in range(count):
+        character = dict(template)
+        enemy = combat_system.create_enemy(enemy_type)
+        combat_system.BattleEngine(character, enemy, policy, rng=rng, record_events=record_events).run()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print(f"{count} battles per case")
+    for policy_name, policy_class in combat_system.POLICIES.items():
+        for character_class, enemy_type in [("Warrior", "goblin"), ("Mage", "orc"), ("Rogue", "dragon")]:
+            silent = run_battles(character_class, enemy_type, policy_class(), count, False)
+            logged = run_battles(character_class, enemy_type, policy_class(), count, True)
+            print(f"{policy_name:>7} {character_class:>7} vs {enemy_type:<6}: "
+                  f"{silent:9.0f} battles/s ({logged:9.0f} with events)")
+
+    for character_class, enemy_type in [("Warrior", "goblin"), ("Mage", "orc"), ("Rogue", "dragon")]:
+        template = character_manager.create_character("Bench", character_class)
+        start = time.perf_counter()
+        for _ in range(count):
+            combat_system.auto_resolve(dict(template), combat_system.create_enemy(enemy_type))
+        resolved = count / (time.perf_counter() - start)
+        print(f"   auto {character_class:>7} vs {enemy_type:<6}: {resolved:9.0f} battles/s (closed form)")
+
+    start = time.perf_counter()
+    for level in range(count):
+        combat_system.get_random_enemy_for_level(level % 10)
+    spawned = count / (time.perf_counter() - start)
+    print(f"  spawn enemy for level: {spawned:9.0f} enemies/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Benchmark: memory used by 100k characters, dict form vs. Character slots
+
+Usage: python benchmarks/bench_character_memory.py [character_count]
+"""
+
+import os
+import sys
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+CLASSES = ["Warrior", "Mage", "Rogue", "Cleric"]
+
+
+def as_dict(character):
+    return {field: character[field] for field in character_manager.CHARACTER_FIELDS}
+
+
+def measure(build, count):
+    tracemalloc.start()
+    characters = [build(i) for i in range(count)]
+    used, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return characters, used
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+
+    def build_character(i):
+        return character_manager.create_character(f"hero_{i}", CLASSES[i % 4])
+
+    def build_dict(i):
+        return as_dict(build_character(i))
+
+    _, dict_bytes = measure(build_dict, count)
+    _, slot_bytes = measure(build_character, count)
+
+    # Both forms share the same name strings and list objects, so the
+    # difference is the per-character container itself.
+    print(f"{count} characters")
+    print(f"dict form:      {dict_bytes / 1e6:8.1f} MB ({dict_bytes / count:.0f} B/character)")
+    print(f"Character form: {slot_bytes / 1e6:8.1f} MB ({slot_bytes / count:.0f} B/character)")
+    print(f"saved:          {(dict_bytes - slot_bytes) / 1e6:8.1f} MB ({1 - slot_bytes / dict_bytes:.0%})")
+
+
+if __name__ == "__main__":
+    main()
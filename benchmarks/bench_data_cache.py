@@ -0,0 +1,53 @@
+"""
+Benchmark: cold text parsing vs. warm compiled cache for game_data
+
+Usage: python benchmarks/bench_data_cache.py [quest_count]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game_data
+
+
+def write_quests(filename, count):
+    with open(filename, "w") as file:
+        for i in range(count):
+            prerequisite = f"quest_{i - 1}" if i else "NONE"
+            file.write(f"QUEST_ID: quest_{i}\n")
+            file.write(f"TITLE: Quest {i}\n")
+            file.write(f"DESCRIPTION: Generated quest number {i}\n")
+            file.write(f"REWARD_XP: {50 + i % 100}\n")
+            file.write(f"REWARD_GOLD: {25 + i % 50}\n")
+            file.write(f"REQUIRED_LEVEL: {1 + i % 50}\n")
+            file.write(f"PREREQUISITE: {prerequisite}\n\n")
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    with tempfile.TemporaryDirectory() as directory:
+        filename = os.path.join(directory, "quests.txt")
+        write_quests(filename, count)
+
+        _, parse_time = timed(lambda: game_data.load_quests(filename))
+        _, build_time = timed(lambda: game_data.load_quests(filename, use_cache=True))
+        quests, warm_time = timed(lambda: game_data.load_quests(filename, use_cache=True))
+
+        print(f"{len(quests)} quests")
+        print(f"cold parse (no cache):   {parse_time:.3f}s")
+        print(f"cold parse + cache write: {build_time:.3f}s")
+        print(f"warm cache load:          {warm_time:.3f}s ({parse_time / warm_time:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Benchmark: durable saves with one fsync per save vs. group commit
+
+Usage: python benchmarks/bench_group_commit.py [save_count ...] [--batch N]
+Default counts: 1000 10000 100000 (run the larger ones on a real disk;
+tmpfs makes fsync free)
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+
+def build_characters(count):
+    return [character_manager.create_character(f"Hero_{i}", "Warrior") for i in range(count)]
+
+
+def per_save_fsync(characters, directory, batch):
+    backend = character_manager.FileSaveBackend(durable=True, manifest=False)
+    for character in characters:
+        backend.save(character, directory)
+
+
+def group_commit(characters, directory, batch):
+    backend = character_manager.FileSaveBackend(durable=True, manifest=False)
+    for start in range(0, len(characters), batch):
+        with backend.group_commit():
+            for character in characters[start:start + batch]:
+                backend.save(character, directory)
+
+
+def timed(function, characters, batch):
+    with tempfile.TemporaryDirectory(dir=".") as directory:
+        start = time.perf_counter()
+        function(characters, directory, batch)
+        return time.perf_counter() - start
+
+
+def main():
+    arguments = sys.argv[1:]
+    batch = 1000
+    if "--batch" in arguments:
+        index = arguments.index("--batch")
+        batch = int(arguments[index + 1])
+        del arguments[index:index + 2]
+    counts = [int(argument) for argument in arguments] or [1000, 10000, 100000]
+
+    print(f"group commit batch size: {batch}")
+    for count in counts:
+        characters = build_characters(count)
+        single = timed(per_save_fsync, characters, batch)
+        grouped = timed(group_commit, characters, batch)
+        print(f"{count:>7} saves: per-save fsync {count / single:9.0f} saves/s, "
+              f"group commit {count / grouped:9.0f} saves/s ({single / grouped:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark: save directory on disk vs. a compressed export archive
+
+Usage: python benchmarks/bench_save_archive.py [character_count]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+
+def build_character(i):
+    character = character_manager.create_character(f"Hero_{i}", ["Warrior", "Mage", "Rogue", "Cleric"][i % 4])
+    character['level'] = 1 + i % 50
+    character['gold'] = 17 * i
+    for j in range(i % 10):
+        character['inventory'].add(f"item_{j}", 1 + j % 3)
+    character['completed_quests'].extend(f"quest_{j}" for j in range(i % 40))
+    return character
+
+
+def directory_size(directory):
+    total = 0
+    for root, _, files in os.walk(directory):
+        total += sum(os.path.getsize(os.path.join(root, name)) for name in files)
+    return total
+
+
+def timed(function):
+    start = time.perf_counter()
+    result = function()
+    return result, time.perf_counter() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    with tempfile.TemporaryDirectory() as directory:
+        saves = os.path.join(directory, "saves")
+        list(character_manager.save_characters((build_character(i) for i in range(count)), saves))
+        raw_size = directory_size(saves)
+        print(f"{count} characters, {raw_size} bytes in {count} save files")
+
+        for codec in character_manager.ARCHIVE_CODECS:
+            archive = os.path.join(directory, f"saves.{codec}")
+            restored = os.path.join(directory, f"restored_{codec}")
+            _, export_time = timed(lambda: character_manager.export_characters(archive, saves, codec))
+            _, import_time = timed(lambda: character_manager.import_characters(archive, restored))
+            size = os.path.getsize(archive)
+            print(f"{codec:>5}: {size:9d} bytes ({size / raw_size:.1%} of raw), "
+                  f"export {export_time:.2f}s, import {import_time:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Benchmark: text vs. binary save format (round-trip time and bytes on disk)
+
+Usage: python benchmarks/bench_save_format.py [completed_quests] [rounds]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+
+
+def build_veteran(completed_count):
+    character = character_manager.create_character("Veteran", "Warrior")
+    character['level'] = 50
+    character['gold'] = 123456
+    for i in range(200):
+        character['inventory'].add(f"item_{i}", 1 + i % 5)
+    character['completed_quests'].extend(f"quest_{i}" for i in range(completed_count))
+    character['active_quests'].extend(f"quest_{completed_count + i}" for i in range(20))
+    return character
+
+
+def round_trip(backend, character, directory, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        backend.save(character, directory)
+        loaded = backend.load(character['name'], directory)
+    elapsed = time.perf_counter() - start
+    assert loaded == character
+    size = os.path.getsize(backend.path(character['name'], directory))
+    return elapsed / rounds, size
+
+
+def main():
+    completed_count = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 200
+    character = build_veteran(completed_count)
+
+    print(f"{completed_count} completed quests, {len(character['inventory'])} items, {rounds} rounds")
+    results = {}
+    for save_format in character_manager.FileSaveBackend.FORMATS:
+        backend = character_manager.FileSaveBackend(save_format)
+        with tempfile.TemporaryDirectory() as directory:
+            results[save_format] = round_trip(backend, character, directory, rounds)
+        seconds, size = results[save_format]
+        print(f"{save_format:>6}: {seconds * 1e3:7.3f} ms per save+load, {size:8d} bytes")
+
+    text_seconds, text_size = results["text"]
+    binary_seconds, binary_size = results["binary"]
+    print(f"binary: {text_seconds / binary_seconds:.1f}x faster, {binary_size / text_size:.0%} of text size")
+
+
+if __name__ == "__main__":
+    main()
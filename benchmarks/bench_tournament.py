@@ -0,0 +1,40 @@
+"""
+Benchmark: tournament throughput against the number of worker processes
+
+Usage: python benchmarks/bench_tournament.py [battles_per_cell] [max_workers]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tournament
+
+
+def main():
+    battles = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    most_workers = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+    levels = range(1, 11)
+    cell_count = len(tournament.tournament_cells(levels=levels))
+    print(f"{cell_count} cells x {battles} battles, {os.cpu_count()} CPUs")
+
+    baseline = None
+    workers = 1
+    while workers <= most_workers:
+        with tempfile.TemporaryDirectory() as directory:
+            start = time.perf_counter()
+            tournament.run_tournament(os.path.join(directory, "matrix.csv"), levels=levels,
+                                      battles=battles, max_workers=workers)
+            elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        battles_per_second = cell_count * battles / elapsed
+        print(f"{workers:>3} workers: {elapsed:6.2f}s, {battles_per_second:9.0f} battles/s "
+              f"(speedup {baseline / elapsed:.2f}x)")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
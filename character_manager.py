@@ -9,8 +9,20 @@ AI Usage: Used ChatGPT and Copilot to help check for errors on my saving and loa
 This module handles character creation, loading, and saving.
 """
 
+import hashlib
+import lzma
 import os
+import sqlite3
+import struct
+import threading
+import zlib
+from contextlib import contextmanager, nullcontext
+from itertools import count, islice
+from collections import Counter, OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from collections.abc import MutableMapping, MutableSequence
 from custom_exceptions import (
+    GameError,
     InvalidCharacterClassError,
     CharacterNotFoundError,
     SaveFileCorruptedError,
@@ -18,6 +30,375 @@ from custom_exceptions import (
     CharacterDeadError
 )
 
+# ============================================================================
+# INDEXED LISTS
+# ============================================================================
+
+class IndexedList(list):
+    """
+    A list that keeps a Counter of its items next to the ordered list
+    
+    Membership tests (`in`) and count() are O(1) instead of a scan, which
+    matters for characters with thousands of completed quests. Every list
+    mutator is overridden so the counter never drifts, whether the list is
+    changed through quest_handler / inventory_system or edited directly.
+    Saves, equality and slicing behave exactly like a plain list.
+    
+    version increases on every mutation (used for change tracking).
+    """
+    __slots__ = ("_counts", "version")
+
+    def __init__(self, iterable=()):
+        super().__init__(iterable)
+        self._counts = Counter(self)
+        self.version = 0
+
+    def __contains__(self, item):
+        return self._counts[item] > 0
+
+    def count(self, item):
+        return self._counts[item]
+
+    def append(self, item):
+        super().append(item)
+        self._counts[item] += 1
+        self.version += 1
+
+    def extend(self, iterable):
+        items = list(iterable)
+        super().extend(items)
+        self._counts.update(items)
+        self.version += 1
+
+    def __iadd__(self, iterable):
+        self.extend(iterable)
+        return self
+
+    def __imul__(self, times):
+        super().__imul__(times)
+        self._counts = Counter(self)
+        self.version += 1
+        return self
+
+    def insert(self, index, item):
+        super().insert(index, item)
+        self._counts[item] += 1
+        self.version += 1
+
+    def remove(self, item):
+        super().remove(item)
+        self._discard(item)
+
+    def pop(self, index=-1):
+        item = super().pop(index)
+        self._discard(item)
+        return item
+
+    def clear(self):
+        super().clear()
+        self._counts.clear()
+        self.version += 1
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self.version += 1
+
+    def reverse(self):
+        super().reverse()
+        self.version += 1
+
+    def __setitem__(self, index, value):
+        # Change the list first: if the assignment is rejected (e.g. an
+        # extended slice given the wrong number of values) the counts
+        # must still match the untouched list.
+        if isinstance(index, slice):
+            value = list(value)
+            replaced = self[index]
+            super().__setitem__(index, value)
+            self._counts.subtract(replaced)
+            self._counts.update(value)
+            self._counts = +self._counts
+        else:
+            replaced = self[index]
+            super().__setitem__(index, value)
+            self._discard(replaced)
+            self._counts[value] += 1
+        self.version += 1
+
+    def __delitem__(self, index):
+        removed = self[index] if isinstance(index, slice) else [self[index]]
+        super().__delitem__(index)
+        for item in removed:
+            self._discard(item)
+
+    def copy(self):
+        return self.__class__(self)
+
+    def __reduce__(self):
+        return (self.__class__, (list(self),))
+
+    def _discard(self, item):
+        self._counts[item] -= 1
+        if self._counts[item] <= 0:
+            del self._counts[item]
+        self.version += 1
+
+class StackedInventory(MutableSequence):
+    """
+    Inventory stored as item_id -> quantity stacks
+    
+    add, remove, count, `in` and len() are all O(1); len() is the number
+    of slots used, which inventory_system checks against MAX_INVENTORY_SIZE.
+    
+    It also behaves as a list of item IDs for existing callers: iteration
+    yields each item once per unit (grouped by stack, in the order stacks
+    were first added), and append/remove/index/slicing work as usual.
+    Positional access walks the stacks, so prefer the stack methods.
+    
+    The order is always grouped by stack, so it cannot be chosen: insert()
+    and assignment to an index add the item to its stack wherever that
+    is, and reverse() and sort() raise TypeError.
+    
+    version increases on every mutation (used for change tracking).
+    """
+    __slots__ = ("_stacks", "_size", "version")
+
+    def __init__(self, iterable=()):
+        self._stacks = {}
+        self._size = 0
+        self.version = 0
+        for item_id in iterable:
+            self.add(item_id)
+
+    def add(self, item_id, quantity=1):
+        """Add quantity units of item_id"""
+        self._stacks[item_id] = self._stacks.get(item_id, 0) + quantity
+        self._size += quantity
+        self.version += 1
+
+    def remove(self, item_id, quantity=1):
+        """Remove quantity units of item_id; ValueError if there are not enough"""
+        held = self._stacks.get(item_id, 0)
+        if held < quantity:
+            raise ValueError(f"{item_id!r} not in inventory")
+        if held == quantity:
+            del self._stacks[item_id]
+        else:
+            self._stacks[item_id] = held - quantity
+        self._size -= quantity
+        self.version += 1
+
+    def count(self, item_id):
+        return self._stacks.get(item_id, 0)
+
+    def stacks(self):
+        """Read-only view of {item_id: quantity}"""
+        return self._stacks.items()
+
+    def as_list(self):
+        """Plain list copy, for callers that need a real list"""
+        return list(self)
+
+    def __contains__(self, item_id):
+        return item_id in self._stacks
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        for item_id, quantity in self._stacks.items():
+            for _ in range(quantity):
+                yield item_id
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.as_list()[index]
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("inventory index out of range")
+        for item_id, quantity in self._stacks.items():
+            if index < quantity:
+                return item_id
+            index -= quantity
+
+    def __setitem__(self, index, item_id):
+        if isinstance(index, slice):
+            items = self.as_list()
+            items[index] = item_id
+            self.clear()
+            self.extend(items)
+        else:
+            self.remove(self[index])
+            self.add(item_id)
+
+    def __delitem__(self, index):
+        removed = self[index] if isinstance(index, slice) else [self[index]]
+        for item_id in removed:
+            self.remove(item_id)
+
+    def insert(self, index, item_id):
+        """Add item_id to its stack (index is ignored, see the class docstring)"""
+        self.add(item_id)
+
+    def reverse(self):
+        raise TypeError("StackedInventory order is fixed by its stacks and cannot be reversed")
+
+    def sort(self, *args, **kwargs):
+        raise TypeError("StackedInventory order is fixed by its stacks and cannot be sorted")
+
+    def append(self, item_id):
+        self.add(item_id)
+
+    def clear(self):
+        self._stacks.clear()
+        self._size = 0
+        self.version += 1
+
+    def copy(self):
+        duplicate = self.__class__()
+        duplicate._stacks = dict(self._stacks)
+        duplicate._size = self._size
+        return duplicate
+
+    def __eq__(self, other):
+        if isinstance(other, StackedInventory):
+            return self._stacks == other._stacks
+        if isinstance(other, list):
+            return self.as_list() == other
+        return NotImplemented
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({self.as_list()!r})"
+
+    def __reduce__(self):
+        return (self.__class__, (self.as_list(),))
+
+# ============================================================================
+# CHARACTER RECORD
+# ============================================================================
+
+# Character keys, in save-file order, and the slot that stores each one
+CHARACTER_FIELDS = [
+    "name", "class", "level", "health", "max_health", "strength", "magic",
+    "experience", "gold", "inventory", "active_quests", "completed_quests"
+]
+_FIELD_SLOTS = {field: ("character_class" if field == "class" else field) for field in CHARACTER_FIELDS}
+
+class Character(MutableMapping):
+    """
+    Compact character record with dictionary-style access
+    
+    The twelve standard fields live in __slots__ rather than a per-object
+    dict, which cuts memory use when many characters are loaded at once.
+    Any other key (equipped_weapon, ability cooldowns, ...) goes into a
+    small overflow dict that is only created when first needed, so code
+    written for character dictionaries works unchanged:
+    character['health'], character.get('equipped_weapon'), 'x' in character,
+    del character['x'], dict(character), ...
+    
+    Characters also track which saved fields changed since mark_clean()
+    (see changed_fields), so saves can write just the difference.
+    
+    quest_availability holds quest_handler's availability index. It is an
+    attribute, not a key, so iteration, equality, copies and pickling
+    leave it out.
+    """
+    __slots__ = tuple(_FIELD_SLOTS.values()) + ("_extra", "_dirty", "_list_versions", "quest_availability")
+
+    def __init__(self, data=(), **fields):
+        self.quest_availability = None
+        self._extra = None
+        self._dirty = None
+        self._list_versions = None
+        self.update(data, **fields)
+
+    def __getitem__(self, key):
+        slot = _FIELD_SLOTS.get(key)
+        if slot is not None:
+            try:
+                return getattr(self, slot)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key, value):
+        slot = _FIELD_SLOTS.get(key)
+        if slot is not None:
+            setattr(self, slot, value)
+            if self._dirty is not None:
+                self._dirty.add(key)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        slot = _FIELD_SLOTS.get(key)
+        if slot is not None:
+            try:
+                delattr(self, slot)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is None:
+            raise KeyError(key)
+        else:
+            del self._extra[key]
+            if not self._extra:
+                self._extra = None
+
+    def __contains__(self, key):
+        slot = _FIELD_SLOTS.get(key)
+        if slot is not None:
+            return hasattr(self, slot)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self):
+        for field, slot in _FIELD_SLOTS.items():
+            if hasattr(self, slot):
+                yield field
+        if self._extra is not None:
+            yield from list(self._extra)
+
+    def __len__(self):
+        count = sum(1 for slot in _FIELD_SLOTS.values() if hasattr(self, slot))
+        return count + (len(self._extra) if self._extra is not None else 0)
+
+    def copy(self):
+        """Shallow copy (lists are shared, as with dict.copy())"""
+        return self.__class__(self)
+
+    def mark_clean(self):
+        """Record the current state as saved; starts change tracking"""
+        self._dirty = set()
+        self._list_versions = {field: (id(self[field]), getattr(self[field], "version", None))
+                               for field in LIST_SAVE_FIELDS if field in self}
+
+    def changed_fields(self):
+        """
+        Saved fields changed since mark_clean(), in save-file order
+        
+        Returns None if the character has never been marked clean (its
+        state on disk is unknown), so callers must write everything.
+        Lists without a version counter are always reported as changed.
+        """
+        if self._dirty is None:
+            return None
+        changed = set(self._dirty)
+        for field, (list_id, version) in self._list_versions.items():
+            value = self.get(field)
+            if id(value) != list_id or version is None or getattr(value, "version", None) != version:
+                changed.add(field)
+        return [field for field in CHARACTER_FIELDS if field in changed]
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}({dict(self)!r})"
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),))
+
 # ============================================================================
 # CHARACTER MANAGEMENT FUNCTIONS
 # ============================================================================
@@ -35,7 +416,7 @@ def create_character(name, character_class):
 
     stats = base_stats[character_class]
 
-    character = {
+    character = Character({
         "name": name,
         "class": character_class,
         "level": 1,
@@ -45,92 +426,1702 @@ def create_character(name, character_class):
         "magic": stats["magic"],
         "experience": 0,
         "gold": 100,
-        "inventory": [],
-        "active_quests": [],
-        "completed_quests": []
-    }
+        "inventory": StackedInventory(),
+        "active_quests": IndexedList(),
+        "completed_quests": IndexedList()
+    })
     return character
 
-def save_character(character, save_directory="data/save_games"):
-    if not os.path.exists(save_directory):
-        os.makedirs(save_directory)
+def create_character_at_level(name, character_class, level):
+    """
+    Create a character and level it up to level through gain_experience
+    (for simulations and tests that need a higher-level character)
+    """
+    character = create_character(name, character_class)
+    gain_experience(character, sum(100 * past for past in range(1, level)))
+    return character
 
-    filename = os.path.join(save_directory, f"{character['name']}_save.txt")
+def save_character(character, save_directory="data/save_games", delta=False):
+    """
+    Save a character through the active save backend
+    
+    With delta=True only the fields changed since the last save/load are
+    written (for backends that support it, see FileSaveBackend.save_delta);
+    otherwise the whole character is written.
+    
+    Returns: True on success
+    Raises: PermissionError / IOError if the save cannot be written
+    """
     try:
-        with open(filename, 'w') as file:
-            file.write(f"NAME: {character['name']}\n")
-            file.write(f"CLASS: {character['class']}\n")
-            file.write(f"LEVEL: {character['level']}\n")
-            file.write(f"HEALTH: {character['health']}\n")
-            file.write(f"MAX_HEALTH: {character['max_health']}\n")
-            file.write(f"STRENGTH: {character['strength']}\n")
-            file.write(f"MAGIC: {character['magic']}\n")
-            file.write(f"EXPERIENCE: {character['experience']}\n")
-            file.write(f"GOLD: {character['gold']}\n")
-            file.write(f"INVENTORY: {','.join(character['inventory'])}\n")
-            file.write(f"ACTIVE_QUESTS: {','.join(character['active_quests'])}\n")
-            file.write(f"COMPLETED_QUESTS: {','.join(character['completed_quests'])}\n")
-        return True
-    except (PermissionError, IOError) as e:
-        raise e
+        if delta and hasattr(_save_backend, "save_delta"):
+            return _save_backend.save_delta(character, save_directory)
+        return _save_backend.save(character, save_directory)
+    finally:
+        _invalidate_cached(character['name'], save_directory)
 
 def load_character(character_name, save_directory="data/save_games"):
-    if not os.path.exists(save_directory):
-        raise CharacterNotFoundError(f"No save directory found: {save_directory}")
-    filename = os.path.join(save_directory, f"{character_name}_save.txt")
-    if not os.path.isfile(filename):
-        raise CharacterNotFoundError(f"Character save file not found: {filename}")
+    """
+    Load a character through the active save backend
+    
+    Served from the LRU cache when it is enabled (see
+    enable_character_cache); the result is always a private copy.
+    
+    Returns: Character
+    Raises: CharacterNotFoundError, SaveFileCorruptedError, InvalidSaveDataError
+    """
+    if _character_cache is not None:
+        return _character_cache.load(character_name, save_directory)
+    return _save_backend.load(character_name, save_directory)
+
+def list_saved_characters(save_directory="data/save_games", offset=0, limit=None,
+                          sort_by=None, descending=False):
+    """
+    List saved character names
+    
+    offset/limit select one page of the listing. sort_by is None (backend
+    order) or one of SUMMARY_SORT_KEYS ("name", "level", "gold").
+    
+    Returns: List of character names
+    """
+    return _save_backend.list(save_directory, offset, limit, sort_by, descending)
+
+def list_character_summaries(save_directory="data/save_games", offset=0, limit=None,
+                             sort_by=None, descending=False):
+    """
+    Like list_saved_characters, without opening any save file that is
+    unchanged since the manifest last saw it (an unpaged listing opens
+    none, see SaveManifest)
+    
+    Returns: List of dicts with the SUMMARY_FIELDS keys
+    """
+    return _save_backend.summaries(save_directory, offset, limit, sort_by, descending)
+
+def delete_character(character_name, save_directory="data/save_games"):
+    """
+    Delete a saved character
+    
+    Returns: True on success
+    Raises: CharacterNotFoundError if there is no such save
+    """
     try:
-        with open(filename, 'r') as file:
-            lines = file.readlines()
-            character = {}
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-                if ":" not in line:
-                    raise InvalidSaveDataError(f"Invalid line in save file: {line}")
-                key, value = line.split(":", 1)
-                key = key.strip()
-                value = value.strip()
-                if key in ["LEVEL", "HEALTH", "MAX_HEALTH", "STRENGTH", "MAGIC", "EXPERIENCE", "GOLD"]:
-                    character[key.lower()] = int(value)
-                elif key in ["INVENTORY", "ACTIVE_QUESTS", "COMPLETED_QUESTS"]:
-                    character[key.lower()] = value.split(",") if value else []
+        return _save_backend.delete(character_name, save_directory)
+    finally:
+        _invalidate_cached(character_name, save_directory)
+
+# ============================================================================
+# SAVE BACKENDS
+# ============================================================================
+
+# Save fields, in file order, that hold integers / comma-separated ID lists
+NUMERIC_SAVE_FIELDS = ["level", "health", "max_health", "strength", "magic", "experience", "gold"]
+LIST_SAVE_FIELDS = ["inventory", "active_quests", "completed_quests"]
+
+def format_save_lines(character, fields=CHARACTER_FIELDS):
+    """Render a character (or just the given fields) in the "KEY: value" save-file format"""
+    lines = []
+    for field in fields:
+        value = character[field]
+        if field in LIST_SAVE_FIELDS:
+            value = ",".join(value)
+        lines.append(f"{field.upper()}: {value}\n")
+    return lines
+
+def character_from_fields(fields):
+    """
+    Build a Character from {field: value} pairs read from a save
+    
+    Values may be strings (as read from a text save) or already decoded.
+    
+    Raises: InvalidSaveDataError (ValueError/TypeError) for malformed values
+    """
+    character = Character()
+    for field, value in fields.items():
+        if field in NUMERIC_SAVE_FIELDS:
+            character[field] = int(value)
+        elif field == "inventory":
+            character[field] = StackedInventory(_split_ids(value))
+        elif field in LIST_SAVE_FIELDS:
+            character[field] = IndexedList(_split_ids(value))
+        else:
+            character[field] = value
+    return character
+
+def _split_ids(value):
+    if isinstance(value, str):
+        return value.split(",") if value else []
+    return value
+
+def parse_save_lines(lines):
+    """
+    Parse "KEY: value" save-file lines into a Character
+    
+    Raises: InvalidSaveDataError if a line or value is malformed
+    """
+    fields = {}
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+        if ":" not in line:
+            raise InvalidSaveDataError(f"Invalid line in save file: {line}")
+        key, value = line.split(":", 1)
+        fields[key.strip().lower()] = value.strip()
+    try:
+        return character_from_fields(fields)
+    except (ValueError, TypeError) as e:
+        raise InvalidSaveDataError(f"Invalid value in save file: {e}") from e
+
+# ----------------------------------------------------------------------------
+# Binary save format (version 1), all integers little-endian:
+#   header:  magic "QCSV", version (B), the 7 numeric fields (q each)
+#   strings: name, class as  u32 byte length + UTF-8
+#   lists:   active_quests, completed_quests as
+#            u32 item count + u32 byte length + UTF-8 of "\x00".join(ids)
+#   inventory: stack item IDs as a list (above) + one u32 quantity per stack
+# ----------------------------------------------------------------------------
+BINARY_SAVE_MAGIC = b"QCSV"
+BINARY_SAVE_VERSION = 1
+_BINARY_HEADER = struct.Struct("<4sB7q")
+_U32 = struct.Struct("<I")
+_U32_PAIR = struct.Struct("<II")
+
+def encode_character_binary(character):
+    """Encode a character in the binary save format; returns bytes"""
+    parts = [_BINARY_HEADER.pack(BINARY_SAVE_MAGIC, BINARY_SAVE_VERSION,
+                                 *[character[field] for field in NUMERIC_SAVE_FIELDS])]
+    for field in ["name", "class"]:
+        encoded = character[field].encode("utf-8")
+        parts.append(_U32.pack(len(encoded)))
+        parts.append(encoded)
+    for field in ["active_quests", "completed_quests"]:
+        parts.extend(_encode_id_list(character[field]))
+    inventory = character["inventory"]
+    if isinstance(inventory, StackedInventory):
+        stacks = dict(inventory.stacks())
+    else:
+        stacks = dict(Counter(inventory))
+    parts.extend(_encode_id_list(stacks))
+    parts.append(struct.pack(f"<{len(stacks)}I", *stacks.values()))
+    return b"".join(parts)
+
+def _encode_id_list(ids):
+    ids = list(ids)
+    encoded = "\x00".join(ids).encode("utf-8")
+    return [_U32_PAIR.pack(len(ids), len(encoded)), encoded]
+
+def decode_character_binary(data):
+    """
+    Decode bytes written by encode_character_binary into a Character
+    
+    Raises: SaveFileCorruptedError if the data is truncated or not a save
+    """
+    try:
+        magic, version, *numbers = _BINARY_HEADER.unpack_from(data, 0)
+        if magic != BINARY_SAVE_MAGIC:
+            raise SaveFileCorruptedError("Not a binary save file")
+        if version != BINARY_SAVE_VERSION:
+            raise SaveFileCorruptedError(f"Unsupported binary save version: {version}")
+        character = Character(zip(NUMERIC_SAVE_FIELDS, numbers))
+        offset = _BINARY_HEADER.size
+        for field in ["name", "class"]:
+            (length,) = _U32.unpack_from(data, offset)
+            offset += _U32.size
+            character[field] = _take(data, offset, length).decode("utf-8")
+            offset += length
+        for field in ["active_quests", "completed_quests"]:
+            ids, offset = _decode_id_list(data, offset)
+            character[field] = IndexedList(ids)
+        ids, offset = _decode_id_list(data, offset)
+        quantities = struct.unpack_from(f"<{len(ids)}I", data, offset)
+        if offset + 4 * len(ids) != len(data):
+            raise SaveFileCorruptedError("Unexpected data after end of save")
+        inventory = StackedInventory()
+        for item_id, quantity in zip(ids, quantities):
+            inventory.add(item_id, quantity)
+        character["inventory"] = inventory
+        return character
+    except (struct.error, UnicodeDecodeError) as e:
+        raise SaveFileCorruptedError(f"Truncated or damaged binary save: {e}") from e
+
+def _decode_id_list(data, offset):
+    count, length = _U32_PAIR.unpack_from(data, offset)
+    offset += _U32_PAIR.size
+    ids = _take(data, offset, length).decode("utf-8").split("\x00") if count else []
+    if len(ids) != count:
+        raise SaveFileCorruptedError("ID list length does not match its count")
+    return ids, offset + length
+
+def _take(data, offset, length):
+    if offset + length > len(data):
+        raise struct.error("save data ends early")
+    return data[offset:offset + length]
+
+def decode_save_data(data):
+    """Decode a save file's raw bytes, detecting binary vs. legacy text"""
+    if data.startswith(BINARY_SAVE_MAGIC):
+        return decode_character_binary(data)
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError as e:
+        raise SaveFileCorruptedError("Save file is not valid text") from e
+    return parse_save_lines(text.splitlines())
+
+SUMMARY_FIELDS = ["name", "class", "level", "gold", "mtime"]
+SUMMARY_SORT_KEYS = ["name", "level", "gold"]
+
+class SaveManifest:
+    """
+    Summary index of one save directory: <save_directory>/manifest.txt
+    
+    Holds name, class, level, gold and mtime (ns) for every save so that
+    listing, paging and sorting never open the save files themselves.
+    The file is an append-only log of tab-separated lines:
+    
+        S <name> <class> <level> <gold> <mtime> <dir_mtime>   (saved)
+        D <name> <dir_mtime>                                  (deleted)
+        T <dir_mtime>                                         (checkpoint)
+    
+    dir_mtime is the save directory's own mtime just after the change. If
+    the directory has changed since the last line (saves added or removed
+    by something that bypassed the manifest), or the file is missing or
+    unreadable, the manifest is rebuilt by loading every save once. The
+    log is rewritten when it holds more than twice as many lines as there
+    are characters.
+    
+    A save rewritten in place does not change the directory's mtime, so
+    each entry also keeps its save's mtime: refresh() compares it with
+    the backend's stamp() and re-reads that one save when they differ.
+    Paged listings (a limit is given) refresh the entries on the page
+    they return, which costs one stat per listed save; a sorted page can
+    still be ordered by stale values of saves off the page. Unpaged
+    listings touch no save file and trust the manifest. Saves added to
+    shard subdirectories by something other than this backend are not
+    noticed; rebuild_save_manifest() picks them up.
+    """
+
+    FILENAME = "manifest.txt"
+    COMPACT_MINIMUM = 64
+
+    def __init__(self, backend, save_directory):
+        self.backend = backend
+        self.save_directory = save_directory
+        self.path = os.path.join(save_directory, self.FILENAME)
+        self.entries = None
+        self._recorded = None
+        self._lines = 0
+        self._sorted = {}
+
+    def _directory_mtime(self):
+        return os.stat(self.save_directory).st_mtime_ns
+
+    def ensure_loaded(self):
+        """
+        Make entries current: read the manifest if needed, and re-read (or
+        rebuild) it if the directory changed behind the backend's back.
+        Call before the backend itself changes the directory.
+        """
+        if not os.path.isdir(self.save_directory):
+            self.entries = {}
+            self._sorted = {}
+            return
+        if self.entries is not None and self._recorded == self._directory_mtime():
+            return
+        if not self._read():
+            self.rebuild()
+
+    def _read(self):
+        """Load the log into entries; False if it is missing, unreadable or stale"""
+        entries = {}
+        lines = 0
+        recorded = None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as file:
+                for line in file:
+                    if not line.endswith("\n"):
+                        return False
+                    fields = line[:-1].split("\t")
+                    if fields[0] == "S" and len(fields) == 7:
+                        entries[fields[1]] = (fields[2], int(fields[3]), int(fields[4]), int(fields[5]))
+                    elif fields[0] == "D" and len(fields) == 3:
+                        entries.pop(fields[1], None)
+                    elif fields[0] != "T" or len(fields) != 2:
+                        return False
+                    recorded = int(fields[-1])
+                    lines += 1
+        except (OSError, ValueError, UnicodeDecodeError):
+            return False
+        if recorded != self._directory_mtime():
+            return False
+        self.entries = entries
+        self._recorded = recorded
+        self._lines = lines
+        self._sorted = {}
+        return True
+
+    def rebuild(self):
+        """Re-read every save in the directory and rewrite the manifest"""
+        entries = {}
+        for name in self.backend.iter_names(self.save_directory):
+            try:
+                character = self.backend.load(name, self.save_directory)
+                summary = (character['class'], character['level'], character['gold'])
+            except GameError:
+                summary = ("", 0, 0)
+            mtime = max(value or 0 for value in self.backend.stamp(name, self.save_directory)[::2])
+            entries[name] = summary + (mtime,)
+        self.entries = entries
+        self._write()
+
+    def _write(self):
+        """Rewrite the log as one line per character plus a checkpoint"""
+        temp_path = self.path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            for name, (character_class, level, gold, mtime) in self.entries.items():
+                file.write(f"S\t{name}\t{character_class}\t{level}\t{gold}\t{mtime}\t0\n")
+        os.replace(temp_path, self.path)
+        self._lines = len(self.entries)
+        self._sorted = {}
+        self.checkpoint()
+
+    def checkpoint(self):
+        """Record the directory's mtime after a change the backend made itself"""
+        self._append(["T"])
+        self._compact_if_needed()
+
+    def _append(self, fields):
+        if not os.path.exists(self.path):
+            open(self.path, 'a').close()
+        self._recorded = self._directory_mtime()
+        with open(self.path, 'a', encoding='utf-8') as file:
+            file.write("\t".join(str(field) for field in fields + [self._recorded]) + "\n")
+        self._lines += 1
+
+    def put(self, character, mtime):
+        self._set(character['name'], (character['class'], character['level'], character['gold'], mtime))
+
+    def _set(self, name, summary):
+        self.entries[name] = summary
+        self._sorted = {}
+        self._append(["S", name, *summary])
+        self._compact_if_needed()
+
+    def refresh(self, character_name):
+        """
+        Re-read one save if its files changed since its entry was written
+        (or drop the entry if the save is gone)
+        
+        Returns: True if the entry changed
+        """
+        stamp = self.backend.stamp(character_name, self.save_directory)
+        mtime = max(value or 0 for value in stamp[::2])
+        entry = self.entries.get(character_name)
+        if entry is not None and entry[3] == mtime:
+            return False
+        if not mtime:
+            if entry is None:
+                return False
+            self.remove(character_name)
+            return True
+        try:
+            character = self.backend.load(character_name, self.save_directory)
+            summary = (character['class'], character['level'], character['gold'])
+        except GameError:
+            summary = ("", 0, 0)
+        self._set(character_name, summary + (mtime,))
+        return True
+
+    def remove(self, character_name):
+        self.entries.pop(character_name, None)
+        self._sorted = {}
+        self._append(["D", character_name])
+        self._compact_if_needed()
+
+    def _compact_if_needed(self):
+        if self._lines > max(self.COMPACT_MINIMUM, 2 * len(self.entries)):
+            self._write()
+
+    def names(self, sort_by=None, descending=False):
+        """
+        Character names in save order, or sorted by a SUMMARY_SORT_KEYS
+        field; each ordering is computed once and reused until a change
+        """
+        self.ensure_loaded()
+        key = (sort_by, descending)
+        if key not in self._sorted:
+            if sort_by is None:
+                ordered = list(self.entries)
+                if descending:
+                    ordered.reverse()
+            elif sort_by not in SUMMARY_SORT_KEYS:
+                raise ValueError(f"Cannot sort saves by: {sort_by}")
+            elif sort_by == "name":
+                ordered = sorted(self.entries, reverse=descending)
+            else:
+                column = SUMMARY_FIELDS.index(sort_by) - 1
+                ordered = sorted(self.entries, key=lambda name: self.entries[name][column], reverse=descending)
+            self._sorted[key] = ordered
+        return self._sorted[key]
+
+    def summary(self, character_name):
+        return dict(zip(SUMMARY_FIELDS, (character_name,) + self.entries[character_name]))
+
+def _fsync_file(path):
+    with open(path, 'rb') as file:
+        os.fsync(file.fileno())
+
+def _fsync_directory(directory):
+    """fsync a directory so renames and removals in it survive a crash"""
+    try:
+        descriptor = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(descriptor)
+    except OSError:
+        # Directories cannot be fsynced on every platform (e.g. Windows)
+        pass
+    finally:
+        os.close(descriptor)
+
+class FileSaveBackend:
+    """
+    One file per character: <save_directory>/<name>_save.txt
+    
+    save_format selects what save() writes: "text" (the readable
+    "KEY: value" format, <name>_save.txt) or "binary"
+    (encode_character_binary, <name>_save.bin). load() accepts either
+    file, whatever save_format is, and decodes by content, so older
+    binary saves written to a .txt file still load. Saving in one format
+    removes the character's snapshot in the other.
+    
+    save_delta() appends only the changed fields to an append-only
+    journal (<name>_save.journal) next to the snapshot. Each journal entry
+    is a group of "KEY: value" lines ended by "END"; load() applies the
+    complete entries in order on top of the snapshot and ignores a torn
+    final entry. Once the journal reaches journal_limit bytes the next
+    delta save is a full snapshot, which removes the journal (compaction).
+    
+    With sharded=True (or once the directory holds a ".sharded" marker,
+    see migrate_to_sharded) files go two levels down, keyed on the SHA-1
+    of the name: <save_directory>/ab/cd/<name>_save.txt. This keeps every
+    directory small when there are millions of characters. A character
+    whose files are still in the flat directory is found there until it is
+    migrated.
+    
+    With manifest=True (the default) every save and delete also updates
+    the directory's SaveManifest, and list()/summaries() are answered from
+    it instead of walking the directory.
+    
+    Snapshots are written to a temporary file and renamed over the old
+    save with os.replace, so a crash leaves either the old or the new save,
+    never a truncated one. With durable=True each save is also fsynced
+    (file, then directory) before save() returns. Inside group_commit()
+    saves are staged and then fsynced and renamed together when the block
+    ends, paying one directory fsync per batch instead of one per save.
+    """
+
+    SUFFIX = "_save.txt"
+    BINARY_SUFFIX = "_save.bin"
+    SNAPSHOT_SUFFIXES = [SUFFIX, BINARY_SUFFIX]
+    JOURNAL_SUFFIX = "_save.journal"
+    JOURNAL_END = "END\n"
+    SHARD_MARKER = ".sharded"
+    FORMATS = ["text", "binary"]
+
+    def __init__(self, save_format="text", journal_limit=64 * 1024, sharded=False, manifest=True,
+                 durable=False):
+        if save_format not in self.FORMATS:
+            raise ValueError(f"Unknown save format: {save_format}")
+        self.save_format = save_format
+        self.journal_limit = journal_limit
+        self.sharded = sharded
+        self.use_manifest = manifest
+        self.durable = durable
+        self._manifests = {}
+        self._group = None
+        self._temp_ids = count()
+        self._write_lock = threading.RLock()
+
+    def manifest(self, save_directory):
+        """The SaveManifest for a directory (None when manifests are off)"""
+        if not self.use_manifest:
+            return None
+        manifest = self._manifests.get(save_directory)
+        if manifest is None:
+            manifest = self._manifests[save_directory] = SaveManifest(self, save_directory)
+        return manifest
+
+    def rebuild_manifest(self, save_directory):
+        if not self.use_manifest:
+            raise ValueError("This backend keeps no save manifest")
+        with self._write_lock:
+            self.manifest(save_directory).rebuild()
+
+    def _current_manifest(self, save_directory):
+        """The directory's manifest, brought up to date (None when off)"""
+        manifest = self.manifest(save_directory)
+        if manifest is not None:
+            manifest.ensure_loaded()
+        return manifest
+
+    def is_sharded(self, save_directory):
+        return self.sharded or os.path.isfile(os.path.join(save_directory, self.SHARD_MARKER))
+
+    def shard_directory(self, character_name, save_directory):
+        digest = hashlib.sha1(character_name.encode("utf-8")).hexdigest()
+        return os.path.join(save_directory, digest[:2], digest[2:4])
+
+    def _locate(self, character_name, save_directory):
+        """Directory holding the character's files (or where new ones go)"""
+        if not self.is_sharded(save_directory):
+            return save_directory
+        shard = self.shard_directory(character_name, save_directory)
+        if self._snapshots(character_name, shard) or not self._snapshots(character_name, save_directory):
+            return shard
+        return save_directory
+
+    def _snapshots(self, character_name, directory):
+        """Existing snapshot files of a character in one directory"""
+        return [path for path in (os.path.join(directory, character_name + suffix)
+                                  for suffix in self.SNAPSHOT_SUFFIXES)
+                if os.path.isfile(path)]
+
+    def _snapshot_path(self, character_name, directory):
+        """
+        The character's snapshot in directory, or where save() would write
+        it. If a crash left one in each format, the newer one counts.
+        """
+        snapshots = self._snapshots(character_name, directory)
+        if not snapshots:
+            return self._write_path(character_name, directory)
+        return max(snapshots, key=lambda path: os.stat(path).st_mtime_ns)
+
+    def _write_path(self, character_name, directory):
+        suffix = self.BINARY_SUFFIX if self.save_format == "binary" else self.SUFFIX
+        return os.path.join(directory, character_name + suffix)
+
+    def _snapshot_name(self, directory, filename):
+        """The character name if filename is a snapshot, else None"""
+        for suffix in self.SNAPSHOT_SUFFIXES:
+            if filename.endswith(suffix):
+                character_name = filename[:-len(suffix)]
+                # Count a name left with both files by a crash only once
+                if suffix == self.BINARY_SUFFIX and os.path.isfile(
+                        os.path.join(directory, character_name + self.SUFFIX)):
+                    return None
+                return character_name
+        return None
+
+    def path(self, character_name, save_directory):
+        return self._snapshot_path(character_name, self._locate(character_name, save_directory))
+
+    def journal_path(self, character_name, save_directory):
+        return os.path.join(self._locate(character_name, save_directory),
+                            f"{character_name}{self.JOURNAL_SUFFIX}")
+
+    def _encode(self, character):
+        if self.save_format == "binary":
+            return encode_character_binary(character)
+        return "".join(format_save_lines(character)).encode("utf-8")
+
+    def save(self, character, save_directory):
+        with self._write_lock:
+            manifest = self._current_manifest(save_directory)
+            if self.sharded and not os.path.isfile(os.path.join(save_directory, self.SHARD_MARKER)):
+                os.makedirs(save_directory, exist_ok=True)
+                open(os.path.join(save_directory, self.SHARD_MARKER), 'a').close()
+            directory = self._locate(character['name'], save_directory)
+            os.makedirs(directory, exist_ok=True)
+            filename = self._write_path(character['name'], directory)
+            temp_path = f"{filename}.{os.getpid()}.{next(self._temp_ids)}.tmp"
+            staged = False
+            try:
+                with open(temp_path, 'wb') as file:
+                    file.write(self._encode(character))
+                    if self.durable and self._group is None:
+                        file.flush()
+                        os.fsync(file.fileno())
+                if self._group is not None:
+                    summary = {field: character[field] for field in ["name", "class", "level", "gold"]}
+                    replaced = self._group.get(filename)
+                    self._group[filename] = (temp_path, save_directory, summary)
+                    staged = True
+                    if replaced is not None:
+                        os.remove(replaced[0])
+                    if manifest is not None:
+                        manifest.checkpoint()
                 else:
-                    character[key.lower()] = value
+                    self._install(filename, temp_path)
+                    if self.durable:
+                        _fsync_directory(directory)
+                    if manifest is not None:
+                        manifest.put(character, os.stat(filename).st_mtime_ns)
+            except BaseException:
+                if not staged and os.path.exists(temp_path):
+                    os.remove(temp_path)
+                raise
+        if isinstance(character, Character):
+            character.mark_clean()
+        return True
+
+    def _install(self, filename, temp_path):
+        """
+        Rename a written snapshot into place and drop the journal and the
+        other-format snapshot it replaces
+        """
+        os.replace(temp_path, filename)
+        stem = next(filename[:-len(suffix)] for suffix in self.SNAPSHOT_SUFFIXES
+                    if filename.endswith(suffix))
+        for leftover in [stem + suffix for suffix in self.SNAPSHOT_SUFFIXES] + [stem + self.JOURNAL_SUFFIX]:
+            if leftover == filename:
+                continue
+            try:
+                os.remove(leftover)
+            except FileNotFoundError:
+                pass
+
+    @contextmanager
+    def group_commit(self):
+        """
+        Commit the saves made inside the block as one batch
+        
+        Snapshots are written to temporary files as usual, but the rename
+        into place happens when the block ends: every staged file is
+        fsynced, all are renamed, and each directory involved is fsynced
+        once. Until then load() still returns the previous saves. Delta
+        saves become full saves inside the block. Saves from other threads
+        on this backend join the open batch. Nested blocks commit with the
+        outermost one.
+        """
+        with self._write_lock:
+            outermost = self._group is None
+            if outermost:
+                self._group = {}
+        try:
+            yield self
+        finally:
+            if outermost:
+                with self._write_lock:
+                    group, self._group = self._group, None
+                    self._commit(group)
+
+    def _commit(self, group):
+        # Concurrent fsyncs let the filesystem fold them into shared
+        # journal commits instead of waiting for each one in turn.
+        with ThreadPoolExecutor(max_workers=BULK_WORKERS) as executor:
+            list(executor.map(_fsync_file, [temp_path for temp_path, _, _ in group.values()]))
+        directories = set()
+        for filename, (temp_path, save_directory, summary) in group.items():
+            self._install(filename, temp_path)
+            directories.add(os.path.dirname(filename))
+        for directory in directories:
+            _fsync_directory(directory)
+        for filename, (temp_path, save_directory, summary) in group.items():
+            manifest = self.manifest(save_directory)
+            if manifest is not None:
+                manifest.put(summary, os.stat(filename).st_mtime_ns)
+
+    def save_delta(self, character, save_directory, changed=None):
+        """
+        Append the fields changed since the last save/load to the journal
+        
+        changed overrides the character's own change tracking (used when
+        saving a snapshot copy, see SaveQueue).
+        
+        Falls back to a full save() when there is no snapshot yet, the
+        changes are unknown, the name changed, or the journal is over
+        journal_limit (or ends in a torn entry).
+        
+        Returns: True on success
+        """
+        with self._write_lock:
+            if changed is None:
+                changed = character.changed_fields() if isinstance(character, Character) else None
+            if changed is None or "name" in changed or not os.path.isfile(self.path(character['name'], save_directory)):
+                return self.save(character, save_directory)
+            if not changed:
+                return True
+            if self._group is not None:
+                return self.save(character, save_directory)
+            manifest = self._current_manifest(save_directory)
+            journal = self.journal_path(character['name'], save_directory)
+            try:
+                with open(journal, 'rb') as file:
+                    size = file.seek(0, os.SEEK_END)
+                    if size:
+                        file.seek(-len(self.JOURNAL_END), os.SEEK_END)
+                        torn = file.read() != self.JOURNAL_END.encode()
+                    else:
+                        torn = False
+            except FileNotFoundError:
+                size, torn = 0, False
+            if torn or size >= self.journal_limit:
+                return self.save(character, save_directory)
+            entry = "".join(format_save_lines(character, changed)) + self.JOURNAL_END
+            with open(journal, 'a', encoding='utf-8') as file:
+                file.write(entry)
+                if self.durable:
+                    file.flush()
+                    os.fsync(file.fileno())
+            if manifest is not None:
+                manifest.put(character, os.stat(journal).st_mtime_ns)
+            if isinstance(character, Character):
+                character.mark_clean()
+            return True
+
+    def load(self, character_name, save_directory):
+        if not os.path.exists(save_directory):
+            raise CharacterNotFoundError(f"No save directory found: {save_directory}")
+        directory = self._locate(character_name, save_directory)
+        filename = self._snapshot_path(character_name, directory)
+        try:
+            character = self._read(character_name, directory)
+        except FileNotFoundError:
+            character = None
+        if (directory == save_directory and self.is_sharded(save_directory)
+                and (character is None or not self._snapshots(character_name, directory))):
+            # migrate_to_sharded moved the save into its shard while it
+            # was being read (possibly after the snapshot but before the
+            # journal), so read it again from there.
+            directory = self.shard_directory(character_name, save_directory)
+            filename = self._snapshot_path(character_name, directory)
+            try:
+                character = self._read(character_name, directory)
+            except FileNotFoundError:
+                character = None
+        if character is None:
+            raise CharacterNotFoundError(f"Character save file not found: {filename}")
+        character.mark_clean()
+        return character
+
+    def _read(self, character_name, directory):
+        """Decode a snapshot and replay its journal; FileNotFoundError if there is no snapshot"""
+        filename = self._snapshot_path(character_name, directory)
+        try:
+            with open(filename, 'rb') as file:
+                character = decode_save_data(file.read())
+            self._replay_journal(character, os.path.join(directory, f"{character_name}{self.JOURNAL_SUFFIX}"))
             return character
-    except IOError:
-        raise SaveFileCorruptedError(f"Could not read save file: {filename}")
-    except Exception as e:
-        raise InvalidSaveDataError(f"Invalid data in save file: {filename}") from e 
+        except FileNotFoundError:
+            raise
+        except IOError:
+            raise SaveFileCorruptedError(f"Could not read save file: {filename}")
+        except (InvalidSaveDataError, SaveFileCorruptedError):
+            raise
+        except Exception as e:
+            raise InvalidSaveDataError(f"Invalid data in save file: {filename}") from e
+
+    def list(self, save_directory, offset=0, limit=None, sort_by=None, descending=False):
+        """
+        One page of saved names
+        
+        Served from the manifest when it is on (with a limit, each listed
+        save is checked with stamp() and re-read if it changed). Without
+        it the names come from iter_names() in directory order, keeping
+        only the page, and sorting is not available.
+        """
+        stop = None if limit is None else offset + limit
+        manifest = self.manifest(save_directory)
+        if manifest is None:
+            if sort_by is not None:
+                raise ValueError("Sorted listing needs the save manifest")
+            return list(islice(self.iter_names(save_directory), offset, stop))
+        with self._write_lock:
+            return self._current_page(manifest, offset, stop, sort_by, descending)
+
+    def summaries(self, save_directory, offset=0, limit=None, sort_by=None, descending=False):
+        """Like list(), but one SUMMARY_FIELDS dict per character"""
+        manifest = self.manifest(save_directory)
+        if manifest is None:
+            raise ValueError("Save summaries need the save manifest")
+        stop = None if limit is None else offset + limit
+        with self._write_lock:
+            return [manifest.summary(name)
+                    for name in self._current_page(manifest, offset, stop, sort_by, descending)]
+
+    def _current_page(self, manifest, offset, stop, sort_by, descending):
+        """
+        One page of manifest names; with a limit (stop) each entry on the
+        page is first refreshed from disk (see SaveManifest)
+        """
+        if stop is None:
+            return manifest.names(sort_by, descending)[offset:]
+        while True:
+            page = manifest.names(sort_by, descending)[offset:stop]
+            changed = [manifest.refresh(name) for name in page]
+            if not any(changed):
+                return page
+            # A refreshed entry can be dropped or move in a sorted
+            # listing, so the page is taken again.
+
+    def iter_names(self, save_directory):
+        """
+        Yield saved character names one at a time
+        
+        Walks the flat directory and the two shard levels with os.scandir,
+        so memory use does not grow with the number of saves. A name being
+        migrated at the same moment may be yielded twice or not at all.
+        """
+        yield from self._scan(save_directory, 0)
+
+    def _scan(self, directory, depth):
+        try:
+            entries = os.scandir(directory)
+        except FileNotFoundError:
+            return
+        with entries:
+            for entry in entries:
+                character_name = self._snapshot_name(directory, entry.name)
+                if character_name is not None:
+                    if entry.is_file():
+                        yield character_name
+                elif depth < 2 and len(entry.name) == 2 and entry.is_dir():
+                    yield from self._scan(entry.path, depth + 1)
+
+    def stamp(self, character_name, save_directory):
+        """(mtime, size) of the snapshot and journal; changes whenever either is written"""
+        directory = self._locate(character_name, save_directory)
+        stamp = []
+        for path in [self._snapshot_path(character_name, directory),
+                     os.path.join(directory, f"{character_name}{self.JOURNAL_SUFFIX}")]:
+            try:
+                info = os.stat(path)
+                stamp.extend([info.st_mtime_ns, info.st_size])
+            except FileNotFoundError:
+                stamp.extend([None, None])
+        return tuple(stamp)
+
+    def delete(self, character_name, save_directory):
+        if not os.path.exists(save_directory):
+            raise CharacterNotFoundError(f"No save directory found: {save_directory}")
+        with self._write_lock:
+            directory = self._locate(character_name, save_directory)
+            staged = None
+            if self._group is not None:
+                staged = self._group.pop(self._write_path(character_name, directory), None)
+            if staged is not None:
+                os.remove(staged[0])
+            snapshots = self._snapshots(character_name, directory)
+            if not snapshots:
+                if staged is not None:
+                    return True
+                raise CharacterNotFoundError(
+                    f"Character save file not found: {self._write_path(character_name, directory)}")
+            manifest = self._current_manifest(save_directory)
+            for filename in snapshots:
+                os.remove(filename)
+            self._remove_journal(character_name, save_directory)
+            if manifest is not None:
+                manifest.remove(character_name)
+        return True
+
+    def migrate_to_sharded(self, save_directory, progress=None):
+        """
+        Move every flat save in save_directory into the sharded layout
+        
+        Safe to run while the game keeps saving and loading: the marker is
+        written first, so every lookup already checks the shard and then
+        the flat directory, and characters are moved one at a time under
+        the write lock. A plain snapshot is moved with os.replace; one with
+        a journal is first compacted into a single sharded snapshot, and
+        only then are the flat files removed, so a reader never sees a
+        snapshot without its journal.
+        
+        progress, if given, is called as progress(moved_so_far, name).
+        
+        Returns: Number of characters moved
+        """
+        os.makedirs(save_directory, exist_ok=True)
+        with self._write_lock:
+            manifest = self._current_manifest(save_directory)
+            open(os.path.join(save_directory, self.SHARD_MARKER), 'a').close()
+            if manifest is not None:
+                manifest.checkpoint()
+        moved = 0
+        with os.scandir(save_directory) as entries:
+            for entry in entries:
+                character_name = self._snapshot_name(save_directory, entry.name)
+                if character_name is None or not entry.is_file():
+                    continue
+                with self._write_lock:
+                    # A save deleted after the scan listed it is skipped
+                    if not self._migrate_one(character_name, save_directory):
+                        continue
+                    if manifest is not None:
+                        manifest.checkpoint()
+                moved += 1
+                if progress:
+                    progress(moved, character_name)
+        return moved
 
-def list_saved_characters(save_directory="data/save_games"):
-    if not os.path.exists(save_directory):
-        return []
+    def _migrate_one(self, character_name, save_directory):
+        """Move one flat save into its shard; False if it was deleted meanwhile"""
+        snapshot = self._snapshot_path(character_name, save_directory)
+        journal = os.path.join(save_directory, f"{character_name}{self.JOURNAL_SUFFIX}")
+        shard = self.shard_directory(character_name, save_directory)
+        os.makedirs(shard, exist_ok=True)
+        if not os.path.isfile(journal):
+            try:
+                os.replace(snapshot, os.path.join(shard, os.path.basename(snapshot)))
+            except FileNotFoundError:
+                return False
+            self._remove_stale_snapshots(character_name, save_directory)
+            return True
+        target = self._write_path(character_name, shard)
+        try:
+            with open(snapshot, 'rb') as file:
+                character = decode_save_data(file.read())
+            self._replay_journal(character, journal)
+        except FileNotFoundError:
+            return False
+        except OSError:
+            raise SaveFileCorruptedError(f"Could not read save file: {snapshot}")
+        except (InvalidSaveDataError, SaveFileCorruptedError):
+            raise
+        except Exception as e:
+            raise InvalidSaveDataError(f"Invalid data in save file: {snapshot}") from e
+        with open(target + ".tmp", 'wb') as file:
+            file.write(self._encode(character))
+        os.replace(target + ".tmp", target)
+        os.remove(snapshot)
+        os.remove(journal)
+        self._remove_stale_snapshots(character_name, save_directory)
+        return True
+
+    def _remove_stale_snapshots(self, character_name, directory):
+        """Drop older-format snapshots a crash left behind after a migration"""
+        for filename in self._snapshots(character_name, directory):
+            os.remove(filename)
+
+    def _replay_journal(self, character, journal):
+        """Apply each complete journal entry to character, in order"""
+        try:
+            with open(journal, 'r', encoding='utf-8') as file:
+                entry = []
+                for line in file:
+                    if line == self.JOURNAL_END:
+                        character.update(parse_save_lines(entry))
+                        entry = []
+                    else:
+                        entry.append(line)
+        except FileNotFoundError:
+            pass
+
+    def _remove_journal(self, character_name, save_directory):
+        try:
+            os.remove(self.journal_path(character_name, save_directory))
+        except FileNotFoundError:
+            pass
+
+class SqliteSaveBackend:
+    """
+    All characters in one SQLite database: <save_directory>/<database_name>
     
-    character_names = []
+    Characters are rows keyed by name (a B-tree primary key), so lookup
+    is O(log n) and listing pages through the index with LIMIT/OFFSET
+    instead of reading a directory. Lists are stored in the same
+    comma-separated form as text saves. One connection is opened per
+    save directory and shared between threads behind a lock.
+    
+    Each save is its own committed transaction, except inside
+    group_commit(), where all saves share one transaction per database
+    (and so one fsync) committed when the block ends.
+    """
 
-    for filename in os.listdir(save_directory):
-        suffix = "_save.txt"
-        if filename.endswith(suffix):
-            character_name = filename[:-len(suffix)]  # Remove '_save.txt'
-            character_names.append(character_name)
-    return character_names
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS characters (
+            name TEXT PRIMARY KEY,
+            class TEXT NOT NULL,
+            level INTEGER NOT NULL,
+            health INTEGER NOT NULL,
+            max_health INTEGER NOT NULL,
+            strength INTEGER NOT NULL,
+            magic INTEGER NOT NULL,
+            experience INTEGER NOT NULL,
+            gold INTEGER NOT NULL,
+            inventory TEXT NOT NULL,
+            active_quests TEXT NOT NULL,
+            completed_quests TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS characters_by_level ON characters (level);
+    """
 
-def delete_character(character_name, save_directory="data/save_games"):
-    if not os.path.exists(save_directory):
-        raise CharacterNotFoundError(f"No save directory found: {save_directory}")
+    def __init__(self, database_name="saves.db"):
+        self.database_name = database_name
+        self._connections = {}
+        self._grouping = False
+        self._lock = threading.Lock()
+
+    def _transaction(self, connection):
+        """Commit-on-exit context for one write (deferred inside group_commit)"""
+        return nullcontext() if self._grouping else connection
+
+    @contextmanager
+    def group_commit(self):
+        """Commit the saves made inside the block as one transaction per database"""
+        with self._lock:
+            outermost = not self._grouping
+            self._grouping = True
+        try:
+            yield self
+        finally:
+            if outermost:
+                with self._lock:
+                    self._grouping = False
+                    for connection in self._connections.values():
+                        connection.commit()
+
+    def _connect(self, save_directory, create=False):
+        """Return the connection for a directory (None if no database yet)"""
+        path = os.path.join(save_directory, self.database_name)
+        connection = self._connections.get(path)
+        if connection is None:
+            if not create and not os.path.isfile(path):
+                return None
+            os.makedirs(save_directory, exist_ok=True)
+            try:
+                connection = sqlite3.connect(path, check_same_thread=False)
+                connection.executescript(self.SCHEMA)
+            except sqlite3.DatabaseError as e:
+                raise SaveFileCorruptedError(f"Could not open save database: {path}") from e
+            self._connections[path] = connection
+        return connection
+
+    def save(self, character, save_directory):
+        row = []
+        for field in CHARACTER_FIELDS:
+            value = character[field]
+            row.append(",".join(value) if field in LIST_SAVE_FIELDS else value)
+        placeholders = ", ".join("?" * len(CHARACTER_FIELDS))
+        with self._lock:
+            connection = self._connect(save_directory, create=True)
+            with self._transaction(connection):
+                connection.execute(
+                    f"INSERT OR REPLACE INTO characters VALUES ({placeholders})", row)
+        if isinstance(character, Character):
+            character.mark_clean()
+        return True
+
+    def save_delta(self, character, save_directory, changed=None):
+        """UPDATE only the columns changed since the last save/load (or the given fields)"""
+        if changed is None:
+            changed = character.changed_fields() if isinstance(character, Character) else None
+        if changed is None or "name" in changed:
+            return self.save(character, save_directory)
+        if not changed:
+            return True
+        values = [",".join(character[field]) if field in LIST_SAVE_FIELDS else character[field]
+                  for field in changed]
+        assignments = ", ".join(f'"{field}" = ?' for field in changed)
+        with self._lock:
+            connection = self._connect(save_directory, create=True)
+            with self._transaction(connection):
+                cursor = connection.execute(
+                    f"UPDATE characters SET {assignments} WHERE name = ?", values + [character['name']])
+        if cursor.rowcount == 0:
+            return self.save(character, save_directory)
+        if isinstance(character, Character):
+            character.mark_clean()
+        return True
+
+    def load(self, character_name, save_directory):
+        with self._lock:
+            connection = self._connect(save_directory)
+            if connection is None:
+                raise CharacterNotFoundError(f"No save database found in: {save_directory}")
+            try:
+                row = connection.execute(
+                    "SELECT * FROM characters WHERE name = ?", (character_name,)).fetchone()
+            except sqlite3.DatabaseError as e:
+                raise SaveFileCorruptedError(f"Could not read save database for {character_name}") from e
+        if row is None:
+            raise CharacterNotFoundError(f"Character not found: {character_name}")
+        try:
+            character = character_from_fields(dict(zip(CHARACTER_FIELDS, row)))
+            character.mark_clean()
+            return character
+        except (ValueError, TypeError) as e:
+            raise InvalidSaveDataError(f"Invalid data saved for {character_name}") from e
+
+    def list(self, save_directory, offset=0, limit=None, sort_by=None, descending=False):
+        return [row[0] for row in self._select("name", save_directory, offset, limit, sort_by, descending)]
+
+    def summaries(self, save_directory, offset=0, limit=None, sort_by=None, descending=False):
+        """SUMMARY_FIELDS dicts from the table; rows carry no mtime, so it is None"""
+        rows = self._select("name, class, level, gold", save_directory, offset, limit, sort_by, descending)
+        return [dict(zip(SUMMARY_FIELDS, row + (None,))) for row in rows]
+
+    def _select(self, columns, save_directory, offset, limit, sort_by, descending):
+        if sort_by is None:
+            sort_by = "name"
+        if sort_by not in SUMMARY_SORT_KEYS:
+            raise ValueError(f"Cannot sort saves by: {sort_by}")
+        direction = "DESC" if descending else "ASC"
+        with self._lock:
+            connection = self._connect(save_directory)
+            if connection is None:
+                return []
+            return connection.execute(
+                f"SELECT {columns} FROM characters ORDER BY {sort_by} {direction}, name LIMIT ? OFFSET ?",
+                (-1 if limit is None else limit, offset)).fetchall()
+
+    def delete(self, character_name, save_directory):
+        with self._lock:
+            connection = self._connect(save_directory)
+            if connection is None:
+                raise CharacterNotFoundError(f"No save database found in: {save_directory}")
+            with self._transaction(connection):
+                cursor = connection.execute(
+                    "DELETE FROM characters WHERE name = ?", (character_name,))
+        if cursor.rowcount == 0:
+            raise CharacterNotFoundError(f"Character not found: {character_name}")
+        return True
+
+    def close(self):
+        """Close every open database connection"""
+        with self._lock:
+            for connection in self._connections.values():
+                connection.close()
+            self._connections.clear()
+
+# ============================================================================
+# BACKGROUND SAVING
+# ============================================================================
+
+def snapshot_character(character):
+    """Copy a character's saved fields, with its own copies of the ID lists"""
+    snapshot = Character()
+    for field in CHARACTER_FIELDS:
+        value = character[field]
+        snapshot[field] = value.copy() if field in LIST_SAVE_FIELDS else value
+    return snapshot
+
+class SaveQueue:
+    """
+    Saves characters on a dedicated writer thread
     
-    filename = os.path.join(save_directory, f"{character_name}_save.txt")
-    if not os.path.isfile(filename):
-        raise CharacterNotFoundError(f"Character save file not found: {filename}")
+    submit() snapshots the character and returns immediately with a
+    concurrent.futures.Future that completes when the save is on disk
+    (or holds the exception, e.g. PermissionError). While a save for the
+    same character is still waiting, further submits are coalesced into
+    it: only the newest snapshot is written and every caller gets the
+    same future. With delta=True the fields changed since the previous
+    submit are written as a delta save (see save_character).
     
+    flush() blocks until everything submitted so far has been written;
+    call it before exiting or when a character dies. close() flushes and
+    stops the thread.
+    """
+
+    def __init__(self, save_directory="data/save_games", delta=True):
+        self.save_directory = save_directory
+        self.delta = delta
+        self._pending = {}
+        self._needs_full_save = set()
+        self._writing = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="save-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, character, callback=None):
+        """
+        Queue a save of character's current state
+        
+        Args:
+            character: Character to save
+            callback: Optional function called with the Future when done
+        
+        Returns: concurrent.futures.Future (result True, or the save error)
+        """
+        name = character['name']
+        snapshot = snapshot_character(character)
+        changed = character.changed_fields() if self.delta and isinstance(character, Character) else None
+        if isinstance(character, Character):
+            character.mark_clean()
+        with self._condition:
+            if self._closed:
+                raise RuntimeError("SaveQueue is closed")
+            if name in self._needs_full_save:
+                changed = None
+                self._needs_full_save.discard(name)
+            pending = self._pending.get(name)
+            if pending is None:
+                future = Future()
+            else:
+                _, earlier_changed, future = pending
+                if changed is not None and earlier_changed is not None:
+                    changed = [field for field in CHARACTER_FIELDS
+                               if field in changed or field in earlier_changed]
+                else:
+                    changed = None
+            self._pending[name] = (snapshot, changed, future)
+            self._condition.notify()
+        if callback is not None:
+            future.add_done_callback(callback)
+        return future
+
+    def flush(self, timeout=None):
+        """
+        Wait until every submitted save has been written
+        
+        Returns: True if flushed, False if timeout (seconds) expired first
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: not self._pending and not self._writing, timeout)
+
+    def close(self):
+        """Flush outstanding saves and stop the writer thread"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                name = next(iter(self._pending))
+                snapshot, changed, future = self._pending.pop(name)
+                self._writing += 1
+            try:
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    if changed is not None and hasattr(_save_backend, "save_delta"):
+                        result = _save_backend.save_delta(snapshot, self.save_directory, changed)
+                    else:
+                        result = _save_backend.save(snapshot, self.save_directory)
+                except Exception as e:
+                    # These changes never reached disk, so the next save
+                    # of this character must write everything, including
+                    # one that is already queued as a delta.
+                    with self._condition:
+                        pending = self._pending.get(name)
+                        if pending is not None:
+                            self._pending[name] = (pending[0], None, pending[2])
+                        else:
+                            self._needs_full_save.add(name)
+                    future.set_exception(e)
+                else:
+                    future.set_result(result)
+            finally:
+                _invalidate_cached(name, self.save_directory)
+                with self._condition:
+                    self._writing -= 1
+                    self._condition.notify_all()
+
+# ============================================================================
+# CHARACTER CACHE
+# ============================================================================
+
+class CharacterCache:
+    """
+    Bounded LRU cache of loaded characters
+    
+    Entries are keyed by (save directory, name). An entry is dropped when
+    this module saves or deletes that character, and, for backends with a
+    stamp() method (FileSaveBackend: mtime and size of the save and
+    journal), whenever the stamp no longer matches, so edits made by
+    other processes are noticed too. Callers always get their own copy.
+    
+    Each key has a generation that invalidate() bumps. A load that raced
+    with a save of the same character (the generation changed while the
+    backend was reading) is returned but not cached, since it may hold
+    the state from before that save.
+    
+    stats() reports hits, misses, evictions and invalidations.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._generations = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def load(self, character_name, save_directory):
+        key = (os.path.abspath(save_directory), character_name)
+        backend = _save_backend
+        stamp = backend.stamp(character_name, save_directory) if hasattr(backend, "stamp") else None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == stamp:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _private_copy(entry[0])
+            if entry is not None:
+                del self._entries[key]
+                self.invalidations += 1
+            self.misses += 1
+            generation = self._generations.get(key, 0)
+        character = backend.load(character_name, save_directory)
+        with self._lock:
+            if self._generations.get(key, 0) != generation:
+                return character
+            self._entries[key] = (_private_copy(character), stamp)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return character
+
+    def invalidate(self, character_name, save_directory):
+        key = (os.path.abspath(save_directory), character_name)
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """Counters plus current size, as a dictionary"""
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'size': len(self._entries),
+                'maxsize': self.maxsize,
+            }
+
+_character_cache = None
+
+def enable_character_cache(maxsize=128):
+    """
+    Turn on the load_character LRU cache (replacing any existing one)
+    
+    Returns: The CharacterCache
+    """
+    global _character_cache
+    _character_cache = CharacterCache(maxsize)
+    return _character_cache
+
+def disable_character_cache():
+    """Turn off the load_character cache"""
+    global _character_cache
+    _character_cache = None
+
+def character_cache_stats():
+    """Cache counters (see CharacterCache.stats), or None if the cache is off"""
+    if _character_cache is None:
+        return None
+    return _character_cache.stats()
+
+def _invalidate_cached(character_name, save_directory):
+    if _character_cache is not None:
+        _character_cache.invalidate(character_name, save_directory)
+
+def _private_copy(character):
+    copy = snapshot_character(character)
+    copy.mark_clean()
+    return copy
+
+# ============================================================================
+# BULK OPERATIONS
+# ============================================================================
+
+# Default thread count for bulk save/load I/O
+BULK_WORKERS = 8
+
+def load_characters(names, save_directory="data/save_games", max_workers=BULK_WORKERS):
+    """
+    Load many characters using a thread pool
+    
+    Results are yielded as soon as each load finishes (not in input
+    order). A save that cannot be loaded does not stop the batch: its
+    result is the exception (CharacterNotFoundError, SaveFileCorruptedError
+    or InvalidSaveDataError) instead of a Character. Only a bounded number
+    of loads are in flight, so names may be a long-running generator.
+    
+    Yields: (name, Character or exception)
+    """
+    yield from _run_bounded(lambda name: load_character(name, save_directory), names, max_workers)
+
+def save_characters(characters, save_directory="data/save_games", max_workers=BULK_WORKERS):
+    """
+    Save many characters using a thread pool
+    
+    Yields: (name, True or exception) as each save finishes
+    """
+    for character, result in _run_bounded(lambda c: save_character(c, save_directory),
+                                          characters, max_workers):
+        yield character['name'], result
+
+def iter_all_characters(save_directory="data/save_games", max_workers=BULK_WORKERS):
+    """
+    Stream every saved character (see load_characters)
+    
+    Yields: (name, Character or exception)
+    """
+    yield from load_characters(iter_saved_characters(save_directory), save_directory, max_workers)
+
+def iter_saved_characters(save_directory="data/save_games"):
+    """Yield saved character names, streaming if the backend supports it"""
+    if hasattr(_save_backend, "iter_names"):
+        yield from _save_backend.iter_names(save_directory)
+    else:
+        yield from _save_backend.list(save_directory)
+
+def _run_bounded(function, items, max_workers):
+    """
+    Yield (item, result) for function(item) run on a thread pool,
+    keeping at most 2 * max_workers calls queued at once
+    
+    GameError (and OSError, reported as SaveFileCorruptedError) becomes
+    the result instead of being raised.
+    """
+    def call(item):
+        try:
+            return function(item)
+        except GameError as e:
+            return e
+        except OSError as e:
+            error = SaveFileCorruptedError(f"I/O error: {e}")
+            error.__cause__ = e
+            return error
+
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running = {}
+        for item in items:
+            running[executor.submit(call, item)] = item
+            if len(running) >= 2 * max_workers:
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield running.pop(future), future.result()
+        while running:
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield running.pop(future), future.result()
+
+_save_backend = FileSaveBackend()
+
+def set_save_backend(backend):
+    """
+    Route save/load/list/delete through a different backend
+    
+    Returns: The previously active backend
+    """
+    global _save_backend
+    previous = _save_backend
+    _save_backend = backend
+    if _character_cache is not None:
+        _character_cache.clear()
+    return previous
+
+def get_save_backend():
+    """Return the active save backend"""
+    return _save_backend
+
+def group_commit():
+    """
+    Context manager that commits the saves made inside it as one batch
+    (see FileSaveBackend.group_commit); a no-op for backends without one
+    
+    Example:
+        with character_manager.group_commit():
+            for character in party:
+                character_manager.save_character(character)
+    """
+    if hasattr(_save_backend, "group_commit"):
+        return _save_backend.group_commit()
+    return nullcontext()
+
+def rebuild_save_manifest(save_directory="data/save_games"):
+    """
+    Rebuild the save manifest from the save files themselves
+    
+    Raises: ValueError if the active backend keeps no manifest
+    """
+    if not hasattr(_save_backend, "rebuild_manifest"):
+        raise ValueError("The active save backend has no manifest")
+    _save_backend.rebuild_manifest(save_directory)
+
+def migrate_save_directory(save_directory="data/save_games", progress=None):
+    """
+    Move a flat save directory into the sharded layout while the game runs
+    
+    Returns: Number of characters moved
+    Raises: ValueError if the active backend is not file based
+    """
+    if not hasattr(_save_backend, "migrate_to_sharded"):
+        raise ValueError("The active save backend has no sharded layout")
+    return _save_backend.migrate_to_sharded(save_directory, progress)
+
+# ============================================================================
+# ARCHIVES
+# ============================================================================
+
+ARCHIVE_MAGIC = b"QCAR"
+ARCHIVE_VERSION = 1
+ARCHIVE_CODECS = {"zlib": 1, "lzma": 2}
+ARCHIVE_CHUNK_SIZE = 256
+_ARCHIVE_HEADER = struct.Struct("<4sBB")
+_ARCHIVE_FRAME = struct.Struct("<II")
+
+def export_characters(archive_path, save_directory="data/save_games", codec="zlib",
+                      chunk_size=ARCHIVE_CHUNK_SIZE, max_workers=BULK_WORKERS, progress=None):
+    """
+    Write every saved character into one compressed archive file
+    
+    Archive layout: a header (ARCHIVE_MAGIC, version, codec) followed by
+    frames of (record count, compressed length, compressed bytes) and an
+    empty frame at the end. Each frame holds chunk_size characters in the
+    binary save encoding, each prefixed by its length. Characters are
+    streamed from the save directory and chunks are compressed on a thread
+    pool, with only a bounded number of chunks in memory at once. The
+    archive is written under a temporary name and renamed when complete.
+    
+    progress, if given, is called as progress(characters_done, bytes_written)
+    after each frame.
+    
+    Returns: Number of characters exported
+    Raises: ValueError for an unknown codec; the first load error
+            (SaveFileCorruptedError, InvalidSaveDataError, ...) if a save
+            cannot be read
+    """
+    if codec not in ARCHIVE_CODECS:
+        raise ValueError(f"Unknown archive codec: {codec}")
+
+    def chunks():
+        chunk = []
+        for name, result in iter_all_characters(save_directory, max_workers):
+            if isinstance(result, Exception):
+                raise result
+            chunk.append(encode_character_binary(result))
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def pack(chunk):
+        raw = b"".join(_U32.pack(len(record)) + record for record in chunk)
+        return len(chunk), _compress(codec, raw)
+
+    temp_path = archive_path + ".tmp"
+    exported = 0
     try:
-        os.remove(filename)
-        return True
-    except OSError as e:
-        raise e
+        with open(temp_path, 'wb') as file:
+            written = file.write(_ARCHIVE_HEADER.pack(ARCHIVE_MAGIC, ARCHIVE_VERSION, ARCHIVE_CODECS[codec]))
+            for count, data in _map_ordered(pack, chunks(), max_workers):
+                written += file.write(_ARCHIVE_FRAME.pack(count, len(data)))
+                written += file.write(data)
+                exported += count
+                if progress:
+                    progress(exported, written)
+            file.write(_ARCHIVE_FRAME.pack(0, 0))
+        os.replace(temp_path, archive_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+    return exported
+
+def import_characters(archive_path, save_directory="data/save_games",
+                      max_workers=BULK_WORKERS, progress=None):
+    """
+    Save every character from an export_characters archive
+    
+    Frames are read one at a time and decompressed on a thread pool; the
+    decoded characters are saved through save_characters. Characters with
+    the same name as an existing save replace it.
+    
+    progress, if given, is called as progress(characters_done).
+    
+    Returns: Number of characters imported
+    Raises: SaveFileCorruptedError if the archive is damaged or truncated
+    """
+    try:
+        file = open(archive_path, 'rb')
+    except FileNotFoundError:
+        raise SaveFileCorruptedError(f"Archive not found: {archive_path}")
+    with file:
+        try:
+            magic, version, codec_id = _ARCHIVE_HEADER.unpack(file.read(_ARCHIVE_HEADER.size))
+        except struct.error:
+            raise SaveFileCorruptedError(f"Not a save archive: {archive_path}")
+        codecs = {number: name for name, number in ARCHIVE_CODECS.items()}
+        if magic != ARCHIVE_MAGIC or version != ARCHIVE_VERSION or codec_id not in codecs:
+            raise SaveFileCorruptedError(f"Not a supported save archive: {archive_path}")
+        codec = codecs[codec_id]
+
+        def frames():
+            while True:
+                head = file.read(_ARCHIVE_FRAME.size)
+                if len(head) != _ARCHIVE_FRAME.size:
+                    raise SaveFileCorruptedError(f"Archive is truncated: {archive_path}")
+                count, length = _ARCHIVE_FRAME.unpack(head)
+                if count == 0:
+                    return
+                data = file.read(length)
+                if len(data) != length:
+                    raise SaveFileCorruptedError(f"Archive is truncated: {archive_path}")
+                yield count, data
+
+        def unpack(frame):
+            count, data = frame
+            try:
+                raw = _decompress(codec, data)
+                records = []
+                offset = 0
+                for _ in range(count):
+                    (length,) = _U32.unpack_from(raw, offset)
+                    offset += _U32.size
+                    records.append(decode_character_binary(_take(raw, offset, length)))
+                    offset += length
+            except (zlib.error, lzma.LZMAError, struct.error) as e:
+                raise SaveFileCorruptedError(f"Damaged frame in archive: {archive_path}") from e
+            if offset != len(raw):
+                raise SaveFileCorruptedError(f"Damaged frame in archive: {archive_path}")
+            return records
+
+        def characters():
+            for records in _map_ordered(unpack, frames(), max_workers):
+                yield from records
+
+        imported = 0
+        for name, result in save_characters(characters(), save_directory, max_workers):
+            if isinstance(result, Exception):
+                raise result
+            imported += 1
+            if progress:
+                progress(imported)
+    return imported
+
+def _compress(codec, data):
+    if codec == "lzma":
+        return lzma.compress(data)
+    return zlib.compress(data, 6)
+
+def _decompress(codec, data):
+    if codec == "lzma":
+        return lzma.decompress(data)
+    return zlib.decompress(data)
+
+def _map_ordered(function, items, max_workers):
+    """
+    Yield function(item) for each item in input order, run on a thread
+    pool with at most 2 * max_workers calls in flight
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for item in items:
+            pending.append(executor.submit(function, item))
+            if len(pending) >= 2 * max_workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
 
 # ============================================================================
 # CHARACTER OPERATIONS
@@ -180,13 +2171,7 @@ def revive_character(character):
 # ============================================================================
 
 def validate_character_data(character):
-    required_fields = [
-        "name", "class", "level", "health", "max_health",
-        "strength", "magic", "experience", "gold",
-        "inventory", "active_quests", "completed_quests"
-    ]
-
-    for field in required_fields:
+    for field in CHARACTER_FIELDS:
         if field not in character:
             raise InvalidSaveDataError(f"Missing field: {field}")
     if not isinstance(character['level'], int) or character['level'] < 1:
@@ -203,7 +2188,7 @@ def validate_character_data(character):
         raise InvalidSaveDataError("Invalid experience value")
     if not isinstance(character['gold'], int) or character['gold'] < 0:
         raise InvalidSaveDataError("Invalid gold value")
-    if not isinstance(character['inventory'], list):
+    if not isinstance(character['inventory'], (list, StackedInventory)):
         raise InvalidSaveDataError("Invalid inventory value")
     if not isinstance(character['active_quests'], list):
         raise InvalidSaveDataError("Invalid active_quests value")
@@ -9,7 +9,13 @@ AI Usage: [Document any AI assistance used]
 Handles combat mechanics
 """
 
+import os
+import random
+from types import MappingProxyType
+
+import game_data
 from custom_exceptions import (
+    InvalidDataFormatError,
     InvalidTargetError,
     CombatNotActiveError,
     CharacterDeadError,
@@ -20,160 +26,442 @@ from custom_exceptions import (
 # ENEMY DEFINITIONS
 # ============================================================================
 
+# Next to this module, so enemies spawn whatever the working directory is
+ENEMY_DATA_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "enemies.txt")
+
+# Fields a spawned enemy carries (plus max_health)
+ENEMY_STAT_FIELDS = ["name", "health", "strength", "magic", "xp_reward", "gold_reward"]
+
+# Filled by load_enemy_templates() on first use
+_enemy_templates = None
+_enemy_level_table = ()
+
+def load_enemy_templates(filename=ENEMY_DATA_FILE, use_cache=False):
+    """
+    Load enemy templates from a data file and build the level table
+    
+    Each template is frozen as a read-only mapping holding exactly the
+    fields of a spawned enemy, so create_enemy only has to copy it. The
+    level table has one entry per level up to the highest MIN_LEVEL: the
+    templates of the highest MIN_LEVEL at or below that level. Levels past
+    the end use the last entry; levels below every MIN_LEVEL the first.
+    
+    Runs automatically with the default file the first time an enemy is
+    spawned; call it again to switch to another file.
+    
+    Returns: Read-only mapping {enemy_id: template}
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    global _enemy_templates, _enemy_level_table
+    
+    records = game_data.load_enemies(filename, use_cache=use_cache)
+    if not records:
+        raise InvalidDataFormatError(f"{filename}: no enemies defined")
+    templates = {}
+    tiers = {}
+    for enemy_id, record in records.items():
+        enemy = {field: record[field] for field in ENEMY_STAT_FIELDS}
+        enemy['max_health'] = enemy['health']
+        templates[enemy_id] = MappingProxyType(enemy)
+        tiers.setdefault(record['min_level'], []).append(templates[enemy_id])
+    table = [tuple(tiers[min(tiers)])]
+    for level in range(1, max(tiers) + 1):
+        table.append(tuple(tiers[level]) if level in tiers else table[-1])
+    
+    _enemy_templates = MappingProxyType(templates)
+    _enemy_level_table = tuple(table)
+    return _enemy_templates
+
+def get_enemy_types():
+    """
+    IDs of every loaded enemy template, in data file order
+    
+    Returns: List of enemy type strings accepted by create_enemy
+    """
+    if _enemy_templates is None:
+        load_enemy_templates()
+    return list(_enemy_templates)
+
 def create_enemy(enemy_type):
-    enemy_types = {
-        "goblin": {"name": "Goblin", "health": 50, "strength": 8, "magic": 2, "xp_reward": 25, "gold_reward": 10},
-        "orc": {"name": "Orc", "health": 80, "strength": 12, "magic": 5, "xp_reward": 50, "gold_reward": 25},
-        "dragon": {"name": "Dragon", "health": 200, "strength": 25, "magic": 15, "xp_reward": 200, "gold_reward": 100}
-    }
+    """
+    Spawn a new enemy from its template
+    
+    Returns: Enemy dictionary (a fresh shallow copy the caller may modify)
+    Raises: InvalidTargetError if enemy_type is unknown
+    """
+    if _enemy_templates is None:
+        load_enemy_templates()
+    try:
+        return _enemy_templates[enemy_type].copy()
+    except KeyError:
+        raise InvalidTargetError(f"Unknown enemy type: {enemy_type}") from None
 
-    if enemy_type not in enemy_types:
-        raise InvalidTargetError(f"Unknown enemy type: {enemy_type}")
-    enemy = enemy_types[enemy_type]
-    enemy['max_health'] = enemy['health']
-    return enemy
-
-def get_random_enemy_for_level(character_level):
-    if character_level <= 2:
-        return create_enemy("goblin")  
-    elif 3 <= character_level <= 5:
-        return create_enemy("orc")
-    else:
-        return create_enemy("dragon")
+def get_random_enemy_for_level(character_level, rng=random):
+    """
+    Spawn an enemy suited to a character level
+    
+    The level is looked up in the precomputed level table; when several
+    enemies share a tier, rng picks one of them.
     
+    Returns: Enemy dictionary
+    """
+    if _enemy_templates is None:
+        load_enemy_templates()
+    table = _enemy_level_table
+    tier = table[min(max(character_level, 0), len(table) - 1)]
+    template = tier[0] if len(tier) == 1 else rng.choice(tier)
+    return template.copy()
+
 # ============================================================================
-# COMBAT SYSTEM
+# BATTLE ENGINE
 # ============================================================================
 
-class SimpleBattle:
+BATTLE_ACTIONS = ["attack", "ability", "flee"]
+ABILITY_COOLDOWN = 3
+MAX_BATTLE_TURNS = 1000
+
+class BattleEngine:
     """
-    Simple turn-based combat system
+    Headless turn-based combat between a character and an enemy
     
-    Manages combat between character and enemy
-    """
+    Player actions come from a policy: any object with a
+    choose_action(engine) method returning one of BATTLE_ACTIONS. Nothing
+    is printed; every step is reported as an event dict with at least
+    'type', 'turn' and 'message' keys, appended to self.events (when
+    record_events is true) and passed to on_event (when given).
     
-    def __init__(self, character, enemy):
+    Event types: 'battle_start', 'attack' (actor, target, damage),
+    'ability' (actor, damage, healed), 'cooldown', 'escape' (success),
+    'battle_end' (winner).
+    
+    rng supplies random() for escape rolls and critical strikes; pass a
+    seeded random.Random for reproducible battles. A battle that reaches
+    max_turns ends in a draw.
+    """
+
+    def __init__(self, character, enemy, policy, rng=None, on_event=None,
+                 record_events=True, max_turns=MAX_BATTLE_TURNS):
         self.character = character
         self.enemy = enemy
+        self.policy = policy
+        self.rng = rng if rng is not None else random
+        self.on_event = on_event
+        self.events = [] if record_events else None
+        self.max_turns = max_turns
         self.combat_active = False
+        self.escaped = False
         self.turn_counter = 0
-    
-    def start_battle(self):
+
+    def run(self):
+        """
+        Fight until one side is at 0 health, the player escapes or
+        max_turns is reached
+        
+        Returns: {'winner': 'player' | 'enemy' | 'draw', 'xp_gained',
+                  'gold_gained', 'turns', 'character_health',
+                  'enemy_health', 'escaped'}
+        Raises: CharacterDeadError if the character starts at 0 health
+        """
         if self.character['health'] <= 0:
             raise CharacterDeadError(f"{self.character['name']} is dead and cannot fight!")
         self.combat_active = True
         self.turn_counter = 1
+        self.emit('battle_start', f"{self.character['name']} engages {self.enemy['name']}!")
         while self.combat_active:
-            self.display_combat_stats(self.character, self.enemy)
             self.player_turn()
             if self.check_battle_end():
                 break
             self.enemy_turn()
             if self.check_battle_end():
                 break
+            if self.turn_counter >= self.max_turns:
+                self.combat_active = False
+                break
             self.turn_counter += 1
+        self.character.pop('ability_ready', None)
+        self.character.pop('ability_cooldown', None)
+        result = self.result()
+        self.emit('battle_end', f"Battle over after {result['turns']} turns: {result['winner']}",
+                  winner=result['winner'])
+        return result
+
+    def result(self):
         if self.enemy['health'] <= 0:
-            xp_gained = self.enemy['xp_reward']
-            gold_gained = self.enemy['gold_reward']
-            return {'winner': 'player', 'xp_gained': xp_gained, 'gold_gained': gold_gained}
+            winner = 'player'
+        elif self.character['health'] <= 0 or self.escaped:
+            winner = 'enemy'
         else:
-            return {'winner': 'enemy', 'xp_gained': 0, 'gold_gained': 0}
-    
+            winner = 'draw'
+        won = winner == 'player'
+        return {
+            'winner': winner,
+            'xp_gained': self.enemy['xp_reward'] if won else 0,
+            'gold_gained': self.enemy['gold_reward'] if won else 0,
+            'turns': self.turn_counter,
+            'character_health': self.character['health'],
+            'enemy_health': self.enemy['health'],
+            'escaped': self.escaped
+        }
+
+    def emit(self, event_type, message, **fields):
+        if self.events is None and self.on_event is None:
+            return
+        event = {'type': event_type, 'turn': self.turn_counter, 'message': message}
+        event.update(fields)
+        if self.events is not None:
+            self.events.append(event)
+        if self.on_event is not None:
+            self.on_event(event)
+
     def player_turn(self):
         if not self.combat_active:
             raise CombatNotActiveError("Cannot take player turn: combat is not active")
-        print("\nYour turn! Choose an action:")
-        print("1. Basic Attack")
-        print("2. Special Ability")
-        print("3. Try to Run")
-        choice = input("Enter choice (1-3): ")
-        if choice == '1':
-            calculate_damage = self.calculate_damage(self.character, self.enemy)
-            self.apply_damage(self.enemy, calculate_damage)
-            self.display_battle_log(f"{self.character['name']} attacks {self.enemy['name']} for {calculate_damage} damage!")
-        elif choice == '2':
+        tick_ability_cooldown(self.character)
+        action = self.policy.choose_action(self)
+        if action == "attack":
+            damage = self.calculate_damage(self.character, self.enemy)
+            self.apply_damage(self.enemy, damage)
+            self.emit('attack', f"{self.character['name']} attacks {self.enemy['name']} for {damage} damage!",
+                      actor='player', target='enemy', damage=damage)
+        elif action == "ability":
+            enemy_health = self.enemy['health']
+            character_health = self.character['health']
             try:
-                ability_result = use_special_ability(self.character, self.enemy)
-                self.display_battle_log(ability_result)
+                message = use_special_ability(self.character, self.enemy, self.rng)
             except AbilityOnCooldownError as e:
-                self.display_battle_log(str(e))
-        elif choice == '3':
+                self.emit('cooldown', str(e))
+            else:
+                self.emit('ability', message, actor='player',
+                          damage=enemy_health - self.enemy['health'],
+                          healed=self.character['health'] - character_health)
+        elif action == "flee":
             if self.attempt_escape():
-                self.display_battle_log(f"{self.character['name']} successfully escaped!")
+                self.emit('escape', f"{self.character['name']} successfully escaped!", success=True)
             else:
-                self.display_battle_log(f"{self.character['name']} failed to escape!")
-    
+                self.emit('escape', f"{self.character['name']} failed to escape!", success=False)
+        else:
+            raise ValueError(f"Unknown battle action: {action}")
+
     def enemy_turn(self):
         if not self.combat_active:
             raise CombatNotActiveError("Cannot take enemy turn: combat is not active")
-        calculate_damage = self.calculate_damage(self.enemy, self.character)
-        self.apply_damage(self.character, calculate_damage)
-        self.display_battle_log(f"{self.enemy['name']} attacks {self.character['name']} for {calculate_damage} damage!")
-    
+        damage = self.calculate_damage(self.enemy, self.character)
+        self.apply_damage(self.character, damage)
+        self.emit('attack', f"{self.enemy['name']} attacks {self.character['name']} for {damage} damage!",
+                  actor='enemy', target='player', damage=damage)
+
     def calculate_damage(self, attacker, defender):
-        damage = attacker['strength'] - (defender['strength'] // 4)
-        if damage < 1:
-            damage = 1
-        return damage
-    
+        return calculate_damage(attacker, defender)
+
     def apply_damage(self, target, damage):
         target['health'] -= damage
         if target['health'] < 0:
             target['health'] = 0
-    
+
     def check_battle_end(self):
         if self.enemy['health'] <= 0 or self.character['health'] <= 0:
             self.combat_active = False
             return True
-        return False
-    
+        return not self.combat_active
+
     def attempt_escape(self):
-        import random
-        random_chance = random.random()
-        if random_chance < 0.5:
+        if self.rng.random() < 0.5:
             self.combat_active = False
+            self.escaped = True
             return True
         return False
 
+def calculate_damage(attacker, defender):
+    """Basic attack damage: attacker strength minus a quarter of the defender's, at least 1"""
+    damage = attacker['strength'] - (defender['strength'] // 4)
+    if damage < 1:
+        damage = 1
+    return damage
+
+# ============================================================================
+# BATTLE POLICIES
+# ============================================================================
+
+class AttackPolicy:
+    """Basic attack every turn"""
+
+    def choose_action(self, engine):
+        return "attack"
+
+class AbilityPolicy:
+    """Use the special ability whenever it is ready, otherwise attack"""
+
+    def choose_action(self, engine):
+        if engine.character.get('ability_ready', True):
+            return "ability"
+        return "attack"
+
+class RandomPolicy:
+    """Pick a uniformly random action (from the engine's rng)"""
+
+    def choose_action(self, engine):
+        return BATTLE_ACTIONS[int(engine.rng.random() * len(BATTLE_ACTIONS))]
+
+class InteractivePolicy:
+    """Show the combat stats and ask the player for an action"""
+
+    CHOICES = {'1': "attack", '2': "ability", '3': "flee"}
+
+    def choose_action(self, engine):
+        display_combat_stats(engine.character, engine.enemy)
+        print("\nYour turn! Choose an action:")
+        print("1. Basic Attack")
+        print("2. Special Ability")
+        print("3. Try to Run")
+        while True:
+            choice = input("Enter choice (1-3): ").strip()
+            if choice in self.CHOICES:
+                return self.CHOICES[choice]
+            print("Invalid choice.")
+
+POLICIES = {"attack": AttackPolicy, "ability": AbilityPolicy, "random": RandomPolicy}
+
+# ============================================================================
+# AUTO-RESOLVE
+# ============================================================================
+
+def auto_resolve(character, enemy, max_turns=MAX_BATTLE_TURNS):
+    """
+    Resolve an attack-every-turn battle without simulating it
+    
+    Basic attacks are deterministic, so with d = calculate_damage the enemy
+    falls on turn ceil(enemy_hp / d_player) and the character after the
+    enemy's ceil(character_hp / d_enemy)-th attack. The player strikes
+    first each turn, so the player wins ties. Updates both health values
+    and returns exactly what BattleEngine(..., AttackPolicy()).run() would.
+    
+    Returns: Result dict as BattleEngine.run
+    Raises: CharacterDeadError if the character starts at 0 health
+    """
+    if character['health'] <= 0:
+        raise CharacterDeadError(f"{character['name']} is dead and cannot fight!")
+    player_damage = calculate_damage(character, enemy)
+    enemy_damage = calculate_damage(enemy, character)
+    turns_to_win = max(-(-enemy['health'] // player_damage), 1)
+    turns_to_lose = -(-character['health'] // enemy_damage)
+    if turns_to_win <= turns_to_lose and turns_to_win <= max_turns:
+        winner, turns = 'player', turns_to_win
+        character['health'] -= (turns - 1) * enemy_damage
+        enemy['health'] = 0
+    elif turns_to_lose < turns_to_win and turns_to_lose <= max_turns:
+        winner, turns = 'enemy', turns_to_lose
+        character['health'] = 0
+        enemy['health'] -= turns * player_damage
+    else:
+        winner, turns = 'draw', max_turns
+        character['health'] -= turns * enemy_damage
+        enemy['health'] -= turns * player_damage
+    won = winner == 'player'
+    return {
+        'winner': winner,
+        'xp_gained': enemy['xp_reward'] if won else 0,
+        'gold_gained': enemy['gold_reward'] if won else 0,
+        'turns': turns,
+        'character_health': character['health'],
+        'enemy_health': enemy['health'],
+        'escaped': False
+    }
+
+def resolve_battle(character, enemy, policy=None, rng=None, max_turns=MAX_BATTLE_TURNS):
+    """
+    Fight a headless battle, taking the closed-form path when possible
+    
+    With no policy or an AttackPolicy nothing is random, so auto_resolve
+    answers in O(1); any other policy is simulated by a BattleEngine.
+    
+    Returns: Result dict as BattleEngine.run
+    """
+    if policy is None or type(policy) is AttackPolicy:
+        return auto_resolve(character, enemy, max_turns)
+    return BattleEngine(character, enemy, policy, rng=rng, record_events=False, max_turns=max_turns).run()
+
+# ============================================================================
+# COMBAT SYSTEM
+# ============================================================================
+
+class SimpleBattle(BattleEngine):
+    """
+    Simple turn-based combat system
+    
+    Interactive BattleEngine: actions are read from the keyboard and
+    each event is printed as a battle log line.
+    """
+    
+    def __init__(self, character, enemy):
+        super().__init__(character, enemy, InteractivePolicy(),
+                         on_event=lambda event: display_battle_log(event['message']),
+                         record_events=False)
+    
+    def start_battle(self):
+        return self.run()
+
 # ============================================================================
 # SPECIAL ABILITIES
 # ============================================================================
 
-def use_special_ability(character, enemy):
+def use_special_ability(character, enemy, rng=random):
+    """
+    Use the character's class ability, which then goes on cooldown for
+    ABILITY_COOLDOWN turns (see tick_ability_cooldown)
+    
+    Returns: Battle log message
+    Raises: AbilityOnCooldownError if the ability is not ready
+    """
     if not character.get('ability_ready', True):
         raise AbilityOnCooldownError(f"{character['name']}'s ability is on cooldown!")
     if character['class'] == "Warrior":
-        return warrior_power_strike(character, enemy)
+        message = warrior_power_strike(character, enemy)
     elif character['class'] == "Mage":
-        return mage_fireball(character, enemy)
+        message = mage_fireball(character, enemy)
     elif character['class'] == "Rogue":
-        return rogue_critical_strike(character, enemy)
+        message = rogue_critical_strike(character, enemy, rng)
     elif character['class'] == "Cleric":
-        return cleric_heal(character)
-    cooldown = 3  # Example cooldown duration
+        message = cleric_heal(character)
+    else:
+        message = "Ability used!"
     character['ability_ready'] = False
-    character['ability_cooldown'] = cooldown
-    return "Ability used!"
+    character['ability_cooldown'] = ABILITY_COOLDOWN
+    return message
+
+def tick_ability_cooldown(character):
+    """Count down one turn of ability cooldown; the ability is ready at 0"""
+    if character.get('ability_cooldown', 0) > 0:
+        character['ability_cooldown'] -= 1
+        if character['ability_cooldown'] == 0:
+            character['ability_ready'] = True
+
+def _hit(enemy, damage):
+    enemy['health'] -= damage
+    if enemy['health'] < 0:
+        enemy['health'] = 0
 
 def warrior_power_strike(character, enemy):
     damage = character['strength'] * 2 - (enemy['strength'] // 4)
     if damage < 1:
         damage = 1
+    _hit(enemy, damage)
     return f"{character['name']} uses Power Strike for {damage} damage!"
 
 def mage_fireball(character, enemy):
     damage = character['magic'] * 2 - (enemy['magic'] // 4)
     if damage < 1:
         damage = 1
+    _hit(enemy, damage)
     return f"{character['name']} casts Fireball for {damage} damage!"
 
-def rogue_critical_strike(character, enemy):
-    import random
-    if random.random() < 0.5:
+def rogue_critical_strike(character, enemy, rng=random):
+    if rng.random() < 0.5:
         damage = character['strength'] * 3 - (enemy['strength'] // 4)
         if damage < 1:
             damage = 1
+        _hit(enemy, damage)
         return f"{character['name']} lands a Critical Strike for {damage} damage!"
+    return f"{character['name']}'s Critical Strike misses!"
 
 def cleric_heal(character):
     heal_amount = 30
@@ -10,17 +10,115 @@ This module handles loading and validating game data from text files.
 """
 
 import os
+import glob
+import hashlib
+import mmap
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+from array import array
+from collections.abc import Mapping
 from custom_exceptions import (
     InvalidDataFormatError,
     MissingDataFileError,
     CorruptedDataError
 )
 
+# ============================================================================
+# DATA FORMAT
+# ============================================================================
+
+# Field names in the order they appear in a block, and which must be integers
+QUEST_FIELDS = ["quest_id", "title", "description", "reward_xp",
+                "reward_gold", "required_level", "prerequisite"]
+QUEST_NUMERIC_FIELDS = ["reward_xp", "reward_gold", "required_level"]
+
+ITEM_FIELDS = ["item_id", "name", "type", "effect", "cost", "description"]
+ITEM_NUMERIC_FIELDS = ["cost"]
+VALID_ITEM_TYPES = ["weapon", "armor", "consumable"]
+
+ENEMY_FIELDS = ["enemy_id", "name", "health", "strength", "magic",
+                "xp_reward", "gold_reward", "min_level"]
+ENEMY_NUMERIC_FIELDS = ["health", "strength", "magic", "xp_reward",
+                        "gold_reward", "min_level"]
+
+# Compiled cache files live next to the source file (quests.txt.cache).
+# Bump CACHE_VERSION whenever the parsed record layout changes.
+CACHE_SUFFIX = ".cache"
+CACHE_VERSION = 1
+
+DEFAULT_QUESTS = """QUEST_ID: first_steps
+TITLE: First Steps
+DESCRIPTION: Begin your adventure by defeating your first enemy
+REWARD_XP: 50
+REWARD_GOLD: 25
+REQUIRED_LEVEL: 1
+PREREQUISITE: NONE
+
+QUEST_ID: goblin_hunter
+TITLE: Goblin Hunter
+DESCRIPTION: Defeat 3 goblins to protect the townsfolk
+REWARD_XP: 100
+REWARD_GOLD: 75
+REQUIRED_LEVEL: 2
+PREREQUISITE: first_steps
+"""
+
+DEFAULT_ITEMS = """ITEM_ID: health_potion
+NAME: Health Potion
+TYPE: consumable
+EFFECT: health:20
+COST: 25
+DESCRIPTION: Restores 20 health points
+
+ITEM_ID: iron_sword
+NAME: Iron Sword
+TYPE: weapon
+EFFECT: strength:5
+COST: 100
+DESCRIPTION: A sturdy iron sword that increases strength
+
+ITEM_ID: leather_armor
+NAME: Leather Armor
+TYPE: armor
+EFFECT: max_health:10
+COST: 75
+DESCRIPTION: Basic leather armor that increases max health
+"""
+
+DEFAULT_ENEMIES = """ENEMY_ID: goblin
+NAME: Goblin
+HEALTH: 50
+STRENGTH: 8
+MAGIC: 2
+XP_REWARD: 25
+GOLD_REWARD: 10
+MIN_LEVEL: 1
+
+ENEMY_ID: orc
+NAME: Orc
+HEALTH: 80
+STRENGTH: 12
+MAGIC: 5
+XP_REWARD: 50
+GOLD_REWARD: 25
+MIN_LEVEL: 3
+
+ENEMY_ID: dragon
+NAME: Dragon
+HEALTH: 200
+STRENGTH: 25
+MAGIC: 15
+XP_REWARD: 200
+GOLD_REWARD: 100
+MIN_LEVEL: 6
+"""
+
 # ============================================================================
 # DATA LOADING FUNCTIONS
 # ============================================================================
 
-def load_quests(filename="data/quests.txt"):
+def load_quests(filename="data/quests.txt", use_cache=False, max_workers=None, timings=None):
     """
     Load quest data from file
     
@@ -33,17 +131,31 @@ def load_quests(filename="data/quests.txt"):
     REQUIRED_LEVEL: 1
     PREREQUISITE: previous_quest_id (or NONE)
     
+    Built on iter_quests(), so the file is never held in memory at once.
+    With use_cache=True the parsed result is read from / written to a
+    compiled sidecar file (see load_cached).
+    
+    filename may also be a directory (every *.txt inside) or a glob
+    pattern; the files are then parsed in parallel and merged (see
+    load_many). timings, if given, is a list that receives one
+    (path, record_count, seconds) tuple per file.
+    
     Returns: Dictionary of quests {quest_id: quest_data_dict}
     Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
     """
-    # TODO: Implement this function
-    # Must handle:
-    # - FileNotFoundError → raise MissingDataFileError
-    # - Invalid format → raise InvalidDataFormatError
-    # - Corrupted/unreadable data → raise CorruptedDataError
-    pass
+    sources = _expand_sources(filename)
+    if sources is not None:
+        return load_many(sources, "quests", use_cache, max_workers, timings)
+    start = time.perf_counter()
+    if use_cache:
+        records = load_cached(filename, "quests", load_quests)
+    else:
+        records = _collect_records(iter_quests(filename), "quest_id", filename)
+    if timings is not None:
+        timings.append((filename, len(records), time.perf_counter() - start))
+    return records
 
-def load_items(filename="data/items.txt"):
+def load_items(filename="data/items.txt", use_cache=False, max_workers=None, timings=None):
     """
     Load item data from file
     
@@ -55,12 +167,101 @@ def load_items(filename="data/items.txt"):
     COST: 100
     DESCRIPTION: Item description
     
+    Built on iter_items(), so the file is never held in memory at once.
+    With use_cache=True the parsed result is read from / written to a
+    compiled sidecar file (see load_cached).
+    
+    filename may also be a directory (every *.txt inside) or a glob
+    pattern; the files are then parsed in parallel and merged (see
+    load_many). timings, if given, is a list that receives one
+    (path, record_count, seconds) tuple per file.
+    
     Returns: Dictionary of items {item_id: item_data_dict}
     Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
     """
-    # TODO: Implement this function
-    # Must handle same exceptions as load_quests
-    pass
+    sources = _expand_sources(filename)
+    if sources is not None:
+        return load_many(sources, "items", use_cache, max_workers, timings)
+    start = time.perf_counter()
+    if use_cache:
+        records = load_cached(filename, "items", load_items)
+    else:
+        records = _collect_records(iter_items(filename), "item_id", filename)
+    if timings is not None:
+        timings.append((filename, len(records), time.perf_counter() - start))
+    return records
+
+def load_enemies(filename="data/enemies.txt", use_cache=False, max_workers=None, timings=None):
+    """
+    Load enemy templates from file
+    
+    Expected format per enemy (separated by blank lines):
+    ENEMY_ID: unique_enemy_name
+    NAME: Enemy Display Name
+    HEALTH: 50
+    STRENGTH: 8
+    MAGIC: 2
+    XP_REWARD: 25
+    GOLD_REWARD: 10
+    MIN_LEVEL: 1
+    
+    MIN_LEVEL is the lowest character level the enemy is spawned for by
+    combat_system.get_random_enemy_for_level. Caching and multi-file
+    loading work as for load_quests.
+    
+    Returns: Dictionary of enemies {enemy_id: enemy_data_dict}
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    sources = _expand_sources(filename)
+    if sources is not None:
+        return load_many(sources, "enemies", use_cache, max_workers, timings)
+    start = time.perf_counter()
+    if use_cache:
+        records = load_cached(filename, "enemies", load_enemies)
+    else:
+        records = _collect_records(iter_enemies(filename), "enemy_id", filename)
+    if timings is not None:
+        timings.append((filename, len(records), time.perf_counter() - start))
+    return records
+
+def iter_quests(filename="data/quests.txt"):
+    """
+    Stream quests from file one validated record at a time
+    
+    Only the block currently being parsed is kept in memory, so this
+    works for content packs of any size.
+    
+    Yields: quest_data_dict for each quest, in file order
+    Raises: MissingDataFileError, InvalidDataFormatError (with line number),
+            CorruptedDataError
+    """
+    for first_line, lines in _iter_blocks(filename):
+        yield _parse_and_validate(lines, first_line, filename,
+                                  parse_quest_block, validate_quest_data)
+
+def iter_items(filename="data/items.txt"):
+    """
+    Stream items from file one validated record at a time
+    
+    Yields: item_data_dict for each item, in file order
+    Raises: MissingDataFileError, InvalidDataFormatError (with line number),
+            CorruptedDataError
+    """
+    for first_line, lines in _iter_blocks(filename):
+        yield _parse_and_validate(lines, first_line, filename,
+                                  parse_item_block, validate_item_data)
+
+def iter_enemies(filename="data/enemies.txt"):
+    """
+    Stream enemies from file one validated record at a time
+    
+    Yields: enemy_data_dict for each enemy, in file order
+    Raises: MissingDataFileError, InvalidDataFormatError (with line number),
+            CorruptedDataError
+    """
+    for first_line, lines in _iter_blocks(filename):
+        yield _parse_and_validate(lines, first_line, filename,
+                                  parse_enemy_block, validate_enemy_data)
 
 def validate_quest_data(quest_dict):
     """
@@ -72,10 +273,13 @@ def validate_quest_data(quest_dict):
     Returns: True if valid
     Raises: InvalidDataFormatError if missing required fields
     """
-    # TODO: Implement validation
-    # Check that all required keys exist
-    # Check that numeric values are actually numbers
-    pass
+    for field in QUEST_FIELDS:
+        if field not in quest_dict:
+            raise InvalidDataFormatError(f"Quest is missing field: {field}")
+    for field in QUEST_NUMERIC_FIELDS:
+        if not isinstance(quest_dict[field], int):
+            raise InvalidDataFormatError(f"Quest field {field} must be a number")
+    return True
 
 def validate_item_data(item_dict):
     """
@@ -87,52 +291,464 @@ def validate_item_data(item_dict):
     Returns: True if valid
     Raises: InvalidDataFormatError if missing required fields or invalid type
     """
-    # TODO: Implement validation
-    pass
+    for field in ITEM_FIELDS:
+        if field not in item_dict:
+            raise InvalidDataFormatError(f"Item is missing field: {field}")
+    if item_dict["type"] not in VALID_ITEM_TYPES:
+        raise InvalidDataFormatError(f"Invalid item type: {item_dict['type']}")
+    for field in ITEM_NUMERIC_FIELDS:
+        if not isinstance(item_dict[field], int):
+            raise InvalidDataFormatError(f"Item field {field} must be a number")
+    stat_name, _, value = item_dict["effect"].partition(":")
+    if not stat_name or not value.strip().lstrip("-").isdigit():
+        raise InvalidDataFormatError(f"Invalid item effect: {item_dict['effect']}")
+    return True
+
+def validate_enemy_data(enemy_dict):
+    """
+    Validate that enemy dictionary has all required fields
+    
+    Required fields: enemy_id, name, health, strength, magic, xp_reward,
+                    gold_reward, min_level
+    
+    Returns: True if valid
+    Raises: InvalidDataFormatError if missing required fields or bad stats
+    """
+    for field in ENEMY_FIELDS:
+        if field not in enemy_dict:
+            raise InvalidDataFormatError(f"Enemy is missing field: {field}")
+    for field in ENEMY_NUMERIC_FIELDS:
+        if not isinstance(enemy_dict[field], int):
+            raise InvalidDataFormatError(f"Enemy field {field} must be a number")
+    if enemy_dict["health"] <= 0:
+        raise InvalidDataFormatError("Enemy health must be positive")
+    if enemy_dict["min_level"] < 1:
+        raise InvalidDataFormatError("Enemy min_level must be at least 1")
+    return True
 
 def create_default_data_files():
     """
     Create default data files if they don't exist
     This helps with initial setup and testing
+    
+    Raises: CorruptedDataError if the files cannot be written
+    """
+    defaults = [("data/quests.txt", DEFAULT_QUESTS), ("data/items.txt", DEFAULT_ITEMS),
+                ("data/enemies.txt", DEFAULT_ENEMIES)]
+    try:
+        os.makedirs("data", exist_ok=True)
+        for filename, contents in defaults:
+            if not os.path.exists(filename):
+                with open(filename, "w", encoding="utf-8") as file:
+                    file.write(contents)
+    except OSError as e:
+        raise CorruptedDataError(f"Could not create default data files: {e}") from e
+
+# ============================================================================
+# COMPILED CACHE
+# ============================================================================
+
+def load_cached(filename, kind, loader):
+    """
+    Load parsed data through a compiled sidecar cache
+    
+    The cache (filename + CACHE_SUFFIX) holds a header pickle followed by
+    the data pickle. The header records the source file's mtime, size and
+    SHA-1 so a stale cache is never used:
+    - mtime and size match → use the cache without reading the source
+    - otherwise the source is hashed; if the hash still matches, the cache
+      is re-stamped and used
+    - otherwise the source is parsed with loader(filename) and re-cached
+    
+    Data read from the cache was validated when the cache was written, so
+    validate_quest_data / validate_item_data are skipped.
+    
+    Args:
+        filename: Source text file
+        kind: "quests", "items" or "enemies" (guards against mixing up caches)
+        loader: Function that parses the source, e.g. load_quests
+    
+    Returns: The parsed dictionary
+    Raises: Same exceptions as loader
     """
-    # TODO: Implement this function
-    # Create data/ directory if it doesn't exist
-    # Create default quests.txt and items.txt files
-    # Handle any file permission errors appropriately
-    pass
+    try:
+        source_stat = os.stat(filename)
+    except FileNotFoundError:
+        raise MissingDataFileError(f"Data file not found: {filename}")
+    cache_path = filename + CACHE_SUFFIX
+
+    header, data = _read_cache(cache_path, kind)
+    if header is not None:
+        if (header["mtime_ns"] == source_stat.st_mtime_ns
+                and header["size"] == source_stat.st_size):
+            return data
+    # Stat and hash before parsing: if the file is edited mid-parse, the
+    # cache then describes the older file and is rebuilt on the next load.
+    sha1 = _hash_file(filename)
+    if header is not None and header["sha1"] == sha1:
+        _write_cache(cache_path, kind, source_stat, sha1, data)
+        return data
+
+    data = loader(filename)
+    _write_cache(cache_path, kind, source_stat, sha1, data)
+    return data
+
+def _read_cache(cache_path, kind):
+    """Return (header, data) from a cache file, or (None, None) if unusable"""
+    try:
+        with open(cache_path, "rb") as file:
+            header = pickle.load(file)
+            if (not isinstance(header, dict)
+                    or header.get("version") != CACHE_VERSION
+                    or header.get("kind") != kind):
+                return None, None
+            return header, pickle.load(file)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError,
+            ValueError, TypeError):
+        return None, None
+
+def _write_cache(cache_path, kind, source_stat, sha1, data):
+    """
+    Write a cache file; failure to write is not an error
+    
+    source_stat and sha1 must describe the source as it was before data
+    was parsed from it.
+    """
+    try:
+        header = {
+            "version": CACHE_VERSION,
+            "kind": kind,
+            "mtime_ns": source_stat.st_mtime_ns,
+            "size": source_stat.st_size,
+            "sha1": sha1,
+        }
+        temp_path = cache_path + ".tmp"
+        with open(temp_path, "wb") as file:
+            pickle.dump(header, file, pickle.HIGHEST_PROTOCOL)
+            pickle.dump(data, file, pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+    except OSError:
+        pass
+
+def _hash_file(filename):
+    """SHA-1 of a file's contents, read in chunks"""
+    digest = hashlib.sha1()
+    try:
+        with open(filename, "rb") as file:
+            for chunk in iter(lambda: file.read(1 << 16), b""):
+                digest.update(chunk)
+    except FileNotFoundError:
+        raise MissingDataFileError(f"Data file not found: {filename}")
+    except OSError as e:
+        raise CorruptedDataError(f"Could not read data file {filename}: {e}") from e
+    return digest.hexdigest()
+
+# ============================================================================
+# MULTI-FILE LOADING
+# ============================================================================
+
+def load_many(paths, kind, use_cache=False, max_workers=None, timings=None):
+    """
+    Parse several quest or item files in parallel and merge the results
+    
+    Files are parsed in a ProcessPoolExecutor (in-process for a single
+    file or max_workers=1) and merged in the order given, so when two
+    files define the same ID the error always names the same pair.
+    
+    Args:
+        paths: List of data files
+        kind: "quests", "items" or "enemies"
+        use_cache: Use each file's compiled cache (see load_cached)
+        max_workers: Pool size (default: one per CPU)
+        timings: Optional list that receives (path, record_count, seconds)
+    
+    Returns: Merged dictionary {id: data_dict}
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+    if kind not in _LOADERS:
+        raise ValueError(f"Unknown data kind: {kind}")
+    jobs = [(kind, path, use_cache) for path in paths]
+    if len(jobs) <= 1 or max_workers == 1:
+        results = [_load_source(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(_load_source, jobs))
+
+    merged = {}
+    origin = {}
+    for path, records, seconds in results:
+        for record_id, record in records.items():
+            if record_id in merged:
+                raise InvalidDataFormatError(
+                    f"Duplicate id {record_id!r} in {origin[record_id]} and {path}")
+            merged[record_id] = record
+            origin[record_id] = path
+        if timings is not None:
+            timings.append((path, len(records), seconds))
+    return merged
+
+def _load_source(job):
+    """Worker: load one file; returns (path, records, seconds)"""
+    kind, path, use_cache = job
+    start = time.perf_counter()
+    records = _LOADERS[kind](path, use_cache=use_cache)
+    return path, records, time.perf_counter() - start
+
+def _expand_sources(filename):
+    """
+    Return the sorted list of files named by a directory or glob pattern,
+    or None if filename is a plain file path
+    """
+    if os.path.isdir(filename):
+        paths = glob.glob(os.path.join(filename, "*.txt"))
+    elif any(char in filename for char in "*?["):
+        paths = [path for path in glob.glob(filename) if os.path.isfile(path)]
+    else:
+        return None
+    if not paths:
+        raise MissingDataFileError(f"No data files match: {filename}")
+    return sorted(paths)
+
+# ============================================================================
+# LAZY ITEM CATALOG
+# ============================================================================
+
+class ItemCatalog(Mapping):
+    """
+    Read-only {item_id: item_data_dict} mapping backed by a memory-mapped file
+    
+    Opening the catalog only records where each blank-line separated block
+    starts and ends, and the ITEM_ID it contains (the same block rules as
+    load_items, wherever the ITEM_ID line sits in the block). An item's
+    block is parsed and validated the first time it is looked up, so a
+    session that touches a handful of items never builds dictionaries for
+    the rest of the file.
+    
+    Usable anywhere the all_items dict is (inventory_system.use_item,
+    purchase_item, display_inventory, ...).
+    
+    Raises: MissingDataFileError, InvalidDataFormatError, CorruptedDataError
+    """
+
+    def __init__(self, filename="data/items.txt"):
+        self.filename = filename
+        self._decoded = {}
+        try:
+            self._file = open(filename, "rb")
+        except FileNotFoundError:
+            raise MissingDataFileError(f"Data file not found: {filename}")
+        except OSError as e:
+            raise CorruptedDataError(f"Could not read data file {filename}: {e}") from e
+        try:
+            if os.fstat(self._file.fileno()).st_size == 0:
+                self._map = b""
+            else:
+                self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._starts, self._ends, self._index = self._build_index()
+        except BaseException:
+            self.close()
+            raise
+
+    def _build_index(self):
+        """
+        Find every blank-line separated block and its ITEM_ID
+        
+        Returns: (block start offsets, block end offsets, {item_id: position})
+        """
+        starts = array("Q")
+        ends = array("Q")
+        index = {}
+        data = self._map
+        size = len(data)
+        block_start = None
+        item_id = None
+
+        def close_block(block_end):
+            if item_id is None:
+                raise InvalidDataFormatError(
+                    f"{self.filename}: block at byte {block_start} has no ITEM_ID")
+            if item_id in index:
+                raise InvalidDataFormatError(f"{self.filename}: duplicate item_id {item_id!r}")
+            index[item_id] = len(starts)
+            starts.append(block_start)
+            ends.append(block_end)
+
+        position = 0
+        while position < size:
+            line_end = data.find(b"\n", position)
+            if line_end == -1:
+                line_end = size
+            line = data[position:line_end].strip()
+            if line:
+                if block_start is None:
+                    block_start, item_id = position, None
+                key, _, value = line.partition(b":")
+                if key.strip().lower() == b"item_id":
+                    try:
+                        item_id = value.decode("utf-8").strip()
+                    except UnicodeDecodeError:
+                        raise CorruptedDataError(f"{self.filename}: unreadable ITEM_ID at byte {position}")
+            elif block_start is not None:
+                close_block(position)
+                block_start = None
+            position = line_end + 1
+        if block_start is not None:
+            close_block(size)
+        return starts, ends, index
+
+    def __getitem__(self, item_id):
+        record = self._decoded.get(item_id)
+        if record is not None:
+            return record
+        position = self._index[item_id]
+        start = self._starts[position]
+        end = self._ends[position]
+        try:
+            text = self._map[start:end].decode("utf-8")
+        except UnicodeDecodeError as e:
+            raise CorruptedDataError(f"{self.filename}: item {item_id!r} is unreadable") from e
+        lines = [line for line in text.splitlines() if line.strip()]
+        try:
+            record = parse_item_block(lines)
+            validate_item_data(record)
+        except InvalidDataFormatError as e:
+            raise InvalidDataFormatError(f"{self.filename}, item {item_id!r}: {e}") from None
+        self._decoded[item_id] = record
+        return record
+
+    def __contains__(self, item_id):
+        return item_id in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def close(self):
+        """Release the memory map and file handle"""
+        if isinstance(getattr(self, "_map", None), mmap.mmap):
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
-def parse_quest_block(lines):
+def parse_quest_block(lines, first_line=None):
     """
     Parse a block of lines into a quest dictionary
     
     Args:
         lines: List of strings representing one quest
+        first_line: Line number of lines[0] in the source file (for errors)
     
     Returns: Dictionary with quest data
     Raises: InvalidDataFormatError if parsing fails
     """
-    # TODO: Implement parsing logic
-    # Split each line on ": " to get key-value pairs
-    # Convert numeric strings to integers
-    # Handle parsing errors gracefully
-    pass
+    return _parse_block(lines, QUEST_NUMERIC_FIELDS, first_line)
 
-def parse_item_block(lines):
+def parse_item_block(lines, first_line=None):
     """
     Parse a block of lines into an item dictionary
     
     Args:
         lines: List of strings representing one item
+        first_line: Line number of lines[0] in the source file (for errors)
     
     Returns: Dictionary with item data
     Raises: InvalidDataFormatError if parsing fails
     """
-    # TODO: Implement parsing logic
-    pass
+    return _parse_block(lines, ITEM_NUMERIC_FIELDS, first_line)
+
+def parse_enemy_block(lines, first_line=None):
+    """
+    Parse a block of lines into an enemy dictionary
+    
+    Args:
+        lines: List of strings representing one enemy
+        first_line: Line number of lines[0] in the source file (for errors)
+    
+    Returns: Dictionary with enemy data
+    Raises: InvalidDataFormatError if parsing fails
+    """
+    return _parse_block(lines, ENEMY_NUMERIC_FIELDS, first_line)
+
+def _parse_block(lines, numeric_fields, first_line=None):
+    """Split "KEY: value" lines into a dict, converting numeric fields"""
+    record = {}
+    for offset, line in enumerate(lines):
+        where = f"line {first_line + offset}" if first_line else f"block line {offset + 1}"
+        line = line.strip()
+        if ":" not in line:
+            raise InvalidDataFormatError(f"{where}: expected 'KEY: value', got {line!r}")
+        key, value = line.split(":", 1)
+        key = key.strip().lower()
+        value = value.strip()
+        if not key:
+            raise InvalidDataFormatError(f"{where}: missing field name")
+        if key in numeric_fields:
+            try:
+                value = int(value)
+            except ValueError:
+                raise InvalidDataFormatError(f"{where}: {key} must be a number, got {value!r}")
+        record[key] = value
+    return record
+
+def _iter_blocks(filename):
+    """
+    Yield (first_line_number, lines) for each blank-line separated block
+    
+    Reads the file line by line so memory use is bounded by one block.
+    """
+    try:
+        with open(filename, "r", encoding="utf-8") as file:
+            block = []
+            first_line = 0
+            for line_number, line in enumerate(file, 1):
+                if line.strip():
+                    if not block:
+                        first_line = line_number
+                    block.append(line)
+                elif block:
+                    yield first_line, block
+                    block = []
+            if block:
+                yield first_line, block
+    except FileNotFoundError:
+        raise MissingDataFileError(f"Data file not found: {filename}")
+    except (UnicodeDecodeError, OSError) as e:
+        raise CorruptedDataError(f"Could not read data file {filename}: {e}") from e
+
+def _parse_and_validate(lines, first_line, filename, parse, validate):
+    """Parse one block and validate it, tagging errors with file and line"""
+    try:
+        record = parse(lines, first_line)
+        validate(record)
+    except InvalidDataFormatError as e:
+        message = str(e)
+        if not message.startswith("line "):
+            message = f"block starting at line {first_line}: {message}"
+        raise InvalidDataFormatError(f"{filename}, {message}") from None
+    return record
+
+def _collect_records(records, id_field, filename):
+    """Build an {id: record} dict from a record stream, rejecting duplicates"""
+    collected = {}
+    for record in records:
+        record_id = record[id_field]
+        if record_id in collected:
+            raise InvalidDataFormatError(f"{filename}: duplicate {id_field} {record_id!r}")
+        collected[record_id] = record
+    return collected
+
+_LOADERS = {"quests": load_quests, "items": load_items, "enemies": load_enemies}
 
 # ============================================================================
 # TESTING
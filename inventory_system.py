@@ -9,6 +9,10 @@ AI Usage: [Document any AI assistance used]
 This module handles inventory management, item usage, and equipment.
 """
 
+from collections import Counter
+
+from character_manager import StackedInventory
+from game_data import ItemCatalog
 from custom_exceptions import (
     InventoryFullError,
     ItemNotFoundError,
@@ -34,10 +38,10 @@ def add_item_to_inventory(character, item_id):
     Returns: True if added successfully
     Raises: InventoryFullError if inventory is at max capacity
     """
-    # TODO: Implement adding items
-    # Check if inventory is full (>= MAX_INVENTORY_SIZE)
-    # Add item_id to character['inventory'] list
-    pass
+    if len(character['inventory']) >= MAX_INVENTORY_SIZE:
+        raise InventoryFullError(f"Inventory is full ({MAX_INVENTORY_SIZE} items)")
+    character['inventory'].append(item_id)
+    return True
 
 def remove_item_from_inventory(character, item_id):
     """
@@ -50,10 +54,10 @@ def remove_item_from_inventory(character, item_id):
     Returns: True if removed successfully
     Raises: ItemNotFoundError if item not in inventory
     """
-    # TODO: Implement item removal
-    # Check if item exists in inventory
-    # Remove item from list
-    pass
+    if item_id not in character['inventory']:
+        raise ItemNotFoundError(f"Item not in inventory: {item_id}")
+    character['inventory'].remove(item_id)
+    return True
 
 def has_item(character, item_id):
     """
@@ -61,18 +65,17 @@ def has_item(character, item_id):
     
     Returns: True if item in inventory, False otherwise
     """
-    # TODO: Implement item check
-    pass
+    return item_id in character['inventory']
 
 def count_item(character, item_id):
     """
     Count how many of a specific item the character has
     
+    O(1) for a StackedInventory; plain lists fall back to list.count().
+    
     Returns: Integer count of item
     """
-    # TODO: Implement item counting
-    # Use list.count() method
-    pass
+    return character['inventory'].count(item_id)
 
 def get_inventory_space_remaining(character):
     """
@@ -80,8 +83,7 @@ def get_inventory_space_remaining(character):
     
     Returns: Integer representing available slots
     """
-    # TODO: Implement space calculation
-    pass
+    return MAX_INVENTORY_SIZE - len(character['inventory'])
 
 def clear_inventory(character):
     """
@@ -89,10 +91,9 @@ def clear_inventory(character):
     
     Returns: List of removed items
     """
-    # TODO: Implement inventory clearing
-    # Save current inventory before clearing
-    # Clear character's inventory list
-    pass
+    removed_items = list(character['inventory'])
+    character['inventory'].clear()
+    return removed_items
 
 # ============================================================================
 # ITEM USAGE
@@ -106,6 +107,7 @@ def use_item(character, item_id, item_data):
         character: Character dictionary
         item_id: Item to use
         item_data: Item information dictionary from game_data
+                   (or a game_data.ItemCatalog containing item_id)
     
     Item types and effects:
     - consumable: Apply effect and remove from inventory
@@ -116,13 +118,15 @@ def use_item(character, item_id, item_data):
         ItemNotFoundError if item not in inventory
         InvalidItemTypeError if item type is not 'consumable'
     """
-    # TODO: Implement item usage
-    # Check if character has the item
-    # Check if item type is 'consumable'
-    # Parse effect (format: "stat_name:value" e.g., "health:20")
-    # Apply effect to character
-    # Remove item from inventory
-    pass
+    item_data = _get_item_record(item_id, item_data)
+    if not has_item(character, item_id):
+        raise ItemNotFoundError(f"Item not in inventory: {item_id}")
+    if item_data['type'] != 'consumable':
+        raise InvalidItemTypeError(f"{item_id} is a {item_data['type']}, not a consumable")
+    stat_name, value = parse_item_effect(item_data['effect'])
+    apply_stat_effect(character, stat_name, value)
+    remove_item_from_inventory(character, item_id)
+    return f"Used {item_data.get('name', item_id)}: {stat_name} {value:+d}"
 
 def equip_weapon(character, item_id, item_data):
     """
@@ -144,13 +148,7 @@ def equip_weapon(character, item_id, item_data):
         ItemNotFoundError if item not in inventory
         InvalidItemTypeError if item type is not 'weapon'
     """
-    # TODO: Implement weapon equipping
-    # Check item exists and is type 'weapon'
-    # Handle unequipping current weapon if exists
-    # Parse effect and apply to character stats
-    # Store equipped_weapon in character dictionary
-    # Remove item from inventory
-    pass
+    return _equip(character, item_id, item_data, 'weapon')
 
 def equip_armor(character, item_id, item_data):
     """
@@ -172,9 +170,7 @@ def equip_armor(character, item_id, item_data):
         ItemNotFoundError if item not in inventory
         InvalidItemTypeError if item type is not 'armor'
     """
-    # TODO: Implement armor equipping
-    # Similar to equip_weapon but for armor
-    pass
+    return _equip(character, item_id, item_data, 'armor')
 
 def unequip_weapon(character):
     """
@@ -183,12 +179,7 @@ def unequip_weapon(character):
     Returns: Item ID that was unequipped, or None if no weapon equipped
     Raises: InventoryFullError if inventory is full
     """
-    # TODO: Implement weapon unequipping
-    # Check if weapon is equipped
-    # Remove stat bonuses
-    # Add weapon back to inventory
-    # Clear equipped_weapon from character
-    pass
+    return _unequip(character, 'weapon')
 
 def unequip_armor(character):
     """
@@ -197,8 +188,7 @@ def unequip_armor(character):
     Returns: Item ID that was unequipped, or None if no armor equipped
     Raises: InventoryFullError if inventory is full
     """
-    # TODO: Implement armor unequipping
-    pass
+    return _unequip(character, 'armor')
 
 # ============================================================================
 # SHOP SYSTEM
@@ -212,18 +202,22 @@ def purchase_item(character, item_id, item_data):
         character: Character dictionary
         item_id: Item to purchase
         item_data: Item information with 'cost' field
+                   (or a game_data.ItemCatalog containing item_id)
     
     Returns: True if purchased successfully
     Raises:
         InsufficientResourcesError if not enough gold
         InventoryFullError if inventory is full
     """
-    # TODO: Implement purchasing
-    # Check if character has enough gold
-    # Check if inventory has space
-    # Subtract gold from character
-    # Add item to inventory
-    pass
+    item_data = _get_item_record(item_id, item_data)
+    if character['gold'] < item_data['cost']:
+        raise InsufficientResourcesError(
+            f"Not enough gold: {item_id} costs {item_data['cost']}, you have {character['gold']}")
+    if len(character['inventory']) >= MAX_INVENTORY_SIZE:
+        raise InventoryFullError(f"Inventory is full ({MAX_INVENTORY_SIZE} items)")
+    character['gold'] -= item_data['cost']
+    add_item_to_inventory(character, item_id)
+    return True
 
 def sell_item(character, item_id, item_data):
     """
@@ -233,16 +227,18 @@ def sell_item(character, item_id, item_data):
         character: Character dictionary
         item_id: Item to sell
         item_data: Item information with 'cost' field
+                   (or a game_data.ItemCatalog containing item_id)
     
     Returns: Amount of gold received
     Raises: ItemNotFoundError if item not in inventory
     """
-    # TODO: Implement selling
-    # Check if character has item
-    # Calculate sell price (cost // 2)
-    # Remove item from inventory
-    # Add gold to character
-    pass
+    item_data = _get_item_record(item_id, item_data)
+    if not has_item(character, item_id):
+        raise ItemNotFoundError(f"Item not in inventory: {item_id}")
+    sell_price = item_data['cost'] // 2
+    remove_item_from_inventory(character, item_id)
+    character['gold'] += sell_price
+    return sell_price
 
 # ============================================================================
 # HELPER FUNCTIONS
@@ -258,10 +254,11 @@ def parse_item_effect(effect_string):
     Returns: Tuple of (stat_name, value)
     Example: "health:20" → ("health", 20)
     """
-    # TODO: Implement effect parsing
-    # Split on ":"
-    # Convert value to integer
-    pass
+    stat_name, separator, value = effect_string.partition(":")
+    try:
+        return stat_name.strip(), int(value)
+    except ValueError:
+        raise InvalidItemTypeError(f"Invalid item effect: {effect_string}")
 
 def apply_stat_effect(character, stat_name, value):
     """
@@ -271,10 +268,9 @@ def apply_stat_effect(character, stat_name, value):
     
     Note: health cannot exceed max_health
     """
-    # TODO: Implement stat application
-    # Add value to character[stat_name]
-    # If stat is health, ensure it doesn't exceed max_health
-    pass
+    character[stat_name] += value
+    if character['health'] > character['max_health']:
+        character['health'] = character['max_health']
 
 def display_inventory(character, item_data_dict):
     """
@@ -282,14 +278,68 @@ def display_inventory(character, item_data_dict):
     
     Args:
         character: Character dictionary
-        item_data_dict: Dictionary of all item data
+        item_data_dict: Dictionary of all item data, or any mapping
+                        such as game_data.ItemCatalog
     
     Shows item names, types, and quantities
     """
-    # TODO: Implement inventory display
-    # Count items (some may appear multiple times)
-    # Display with item names from item_data_dict
-    pass
+    inventory = character['inventory']
+    if not inventory:
+        print("Inventory is empty.")
+        return
+    print(f"\n=== INVENTORY ({len(inventory)}/{MAX_INVENTORY_SIZE}) ===")
+    if isinstance(inventory, StackedInventory):
+        stacks = inventory.stacks()
+    else:
+        stacks = Counter(inventory).items()
+    for item_id, quantity in stacks:
+        item = item_data_dict.get(item_id)
+        if item is None:
+            print(f"  {item_id} x{quantity}")
+        else:
+            print(f"  {item['name']} ({item['type']}) x{quantity}")
+
+def _get_item_record(item_id, item_data):
+    """
+    Return the record for item_id
+    
+    item_data is that item's own dictionary, or a game_data.ItemCatalog
+    to look item_id up in. Any other mapping is taken as the item itself.
+    """
+    if isinstance(item_data, ItemCatalog):
+        return item_data[item_id]
+    return item_data
+
+def _equip(character, item_id, item_data, slot):
+    """Equip a weapon or armor in its slot, swapping out any current item"""
+    item_data = _get_item_record(item_id, item_data)
+    if not has_item(character, item_id):
+        raise ItemNotFoundError(f"Item not in inventory: {item_id}")
+    if item_data['type'] != slot:
+        raise InvalidItemTypeError(f"{item_id} is a {item_data['type']}, not a {slot}")
+    remove_item_from_inventory(character, item_id)
+    previous = _unequip(character, slot)
+    stat_name, value = parse_item_effect(item_data['effect'])
+    apply_stat_effect(character, stat_name, value)
+    character[f'equipped_{slot}'] = item_id
+    character[f'equipped_{slot}_effect'] = item_data['effect']
+    if previous:
+        return f"Equipped {item_id} (replaced {previous})"
+    return f"Equipped {item_id}"
+
+def _unequip(character, slot):
+    """Remove the item in a slot, undo its bonus and return it to inventory"""
+    item_id = character.get(f'equipped_{slot}')
+    if item_id is None:
+        return None
+    if len(character['inventory']) >= MAX_INVENTORY_SIZE:
+        raise InventoryFullError(f"No room to unequip {item_id}")
+    stat_name, value = parse_item_effect(character[f'equipped_{slot}_effect'])
+    apply_stat_effect(character, stat_name, -value)
+    character['inventory'].append(item_id)
+    del character[f'equipped_{slot}']
+    del character[f'equipped_{slot}_effect']
+    return item_id
 
 # ============================================================================
 # TESTING
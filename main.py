@@ -28,6 +28,12 @@ all_quests = {}
 all_items = {}
 game_running = False
 
+# Gold needed to revive after death
+REVIVE_COST = 50
+
+# Background writer used by save_game(), created on first save
+save_queue = None
+
 # ============================================================================
 # MAIN MENU
 # ============================================================================
@@ -43,12 +49,11 @@ def main_menu():
     
     Returns: Integer choice (1-3)
     """
-    # TODO: Implement main menu display
-    # Show options
-    # Get user input
-    # Validate input (1-3)
-    # Return choice
-    pass
+    print("\n=== MAIN MENU ===")
+    print("1. New Game")
+    print("2. Load Game")
+    print("3. Exit")
+    return get_menu_choice("Enter choice (1-3): ", 3)
 
 def new_game():
     """
@@ -62,14 +67,19 @@ def new_game():
     """
     global current_character
     
-    # TODO: Implement new game creation
-    # Get character name from user
-    # Get character class from user
-    # Try to create character with character_manager.create_character()
-    # Handle InvalidCharacterClassError
-    # Save character
-    # Start game loop
-    pass
+    name = input("Enter your character's name: ").strip()
+    if not name:
+        print("Name cannot be empty.")
+        return
+    character_class = input("Choose a class (Warrior, Mage, Rogue, Cleric): ").strip().capitalize()
+    try:
+        current_character = character_manager.create_character(name, character_class)
+    except InvalidCharacterClassError as e:
+        print(f"Could not create character: {e}")
+        return
+    print(f"\nWelcome, {name} the {character_class}!")
+    save_game()
+    game_loop()
 
 def load_game():
     """
@@ -80,14 +90,26 @@ def load_game():
     """
     global current_character
     
-    # TODO: Implement game loading
-    # Get list of saved characters
-    # Display them to user
-    # Get user choice
-    # Try to load character with character_manager.load_character()
-    # Handle CharacterNotFoundError and SaveFileCorruptedError
-    # Start game loop
-    pass
+    saved = character_manager.list_character_summaries(sort_by="name")
+    if not saved:
+        print("No saved games found.")
+        return
+    print("\n=== SAVED GAMES ===")
+    for number, summary in enumerate(saved, 1):
+        print(f"{number}. {summary['name']} - Level {summary['level']} {summary['class']}")
+    choice = get_menu_choice(f"Choose a character (1-{len(saved)}): ", len(saved))
+    if choice is None:
+        return
+    try:
+        current_character = character_manager.load_character(saved[choice - 1]['name'])
+    except CharacterNotFoundError:
+        print("That save no longer exists.")
+        return
+    except (SaveFileCorruptedError, InvalidSaveDataError) as e:
+        print(f"Could not load save: {e}")
+        return
+    print(f"\nWelcome back, {current_character['name']}!")
+    game_loop()
 
 # ============================================================================
 # GAME LOOP
@@ -96,18 +118,36 @@ def load_game():
 def game_loop():
     """
     Main game loop - shows game menu and processes actions
+    
+    The game is saved after every action. Saves are deltas (only changed
+    fields are written), so autosaving this often stays cheap.
     """
     global game_running, current_character
     
     game_running = True
+    actions = {
+        1: view_character_stats,
+        2: view_inventory,
+        3: quest_menu,
+        4: explore,
+        5: shop,
+    }
     
-    # TODO: Implement game loop
-    # While game_running:
-    #   Display game menu
-    #   Get player choice
-    #   Execute chosen action
-    #   Save game after each action
-    pass
+    while game_running:
+        choice = game_menu()
+        if choice == 6:
+            save_game()
+            flush_saves()
+            print("Game saved. Goodbye!")
+            game_running = False
+            break
+        action = actions.get(choice)
+        if action is None:
+            # get_menu_choice has already told the player what is valid
+            continue
+        action()
+        if game_running:
+            save_game()
 
 def game_menu():
     """
@@ -123,8 +163,14 @@ def game_menu():
     
     Returns: Integer choice (1-6)
     """
-    # TODO: Implement game menu
-    pass
+    print("\n=== GAME MENU ===")
+    print("1. View Character Stats")
+    print("2. View Inventory")
+    print("3. Quest Menu")
+    print("4. Explore (Find Battles)")
+    print("5. Shop")
+    print("6. Save and Quit")
+    return get_menu_choice("Enter choice (1-6): ", 6)
 
 # ============================================================================
 # GAME ACTIONS
@@ -134,94 +180,205 @@ def view_character_stats():
     """Display character information"""
     global current_character
     
-    # TODO: Implement stats display
-    # Show: name, class, level, health, stats, gold, etc.
-    # Use character_manager functions
-    # Show quest progress using quest_handler
-    pass
+    character = current_character
+    print(f"\n=== {character['name']} the {character['class']} ===")
+    print(f"Level: {character['level']}  (XP {character['experience']}/{character['level'] * 100})")
+    print(f"Health: {character['health']}/{character['max_health']}")
+    print(f"Strength: {character['strength']}  Magic: {character['magic']}")
+    print(f"Gold: {character['gold']}")
+    print(f"Weapon: {character.get('equipped_weapon', 'None')}  Armor: {character.get('equipped_armor', 'None')}")
+    quest_handler.display_character_quest_progress(character, all_quests)
 
 def view_inventory():
     """Display and manage inventory"""
     global current_character, all_items
     
-    # TODO: Implement inventory menu
-    # Show current inventory
-    # Options: Use item, Equip weapon/armor, Drop item
-    # Handle exceptions from inventory_system
-    pass
+    inventory_system.display_inventory(current_character, all_items)
+    if not current_character['inventory']:
+        return
+    print("\n1. Use item")
+    print("2. Equip weapon/armor")
+    print("3. Drop item")
+    print("4. Back")
+    choice = get_menu_choice("Enter choice (1-4): ", 4)
+    if choice in (None, 4):
+        return
+    item_id = input("Item ID: ").strip()
+    if item_id not in all_items:
+        print(f"Unknown item: {item_id}")
+        return
+    item = all_items[item_id]
+    try:
+        if choice == 1:
+            print(inventory_system.use_item(current_character, item_id, item))
+        elif choice == 2 and item['type'] == 'weapon':
+            print(inventory_system.equip_weapon(current_character, item_id, item))
+        elif choice == 2:
+            print(inventory_system.equip_armor(current_character, item_id, item))
+        else:
+            inventory_system.remove_item_from_inventory(current_character, item_id)
+            print(f"Dropped {item['name']}.")
+    except InventoryError as e:
+        print(f"Cannot do that: {e}")
 
 def quest_menu():
     """Quest management menu"""
     global current_character, all_quests
     
-    # TODO: Implement quest menu
-    # Show:
-    #   1. View Active Quests
-    #   2. View Available Quests
-    #   3. View Completed Quests
-    #   4. Accept Quest
-    #   5. Abandon Quest
-    #   6. Complete Quest (for testing)
-    #   7. Back
-    # Handle exceptions from quest_handler
-    pass
+    print("\n=== QUESTS ===")
+    print("1. View Active Quests")
+    print("2. View Available Quests")
+    print("3. View Completed Quests")
+    print("4. Accept Quest")
+    print("5. Abandon Quest")
+    print("6. Complete Quest (for testing)")
+    print("7. Back")
+    choice = get_menu_choice("Enter choice (1-7): ", 7)
+    try:
+        if choice == 1:
+            quest_handler.display_quest_list(quest_handler.get_active_quests(current_character, all_quests))
+        elif choice == 2:
+            quest_handler.display_quest_list(quest_handler.get_available_quests(current_character, all_quests))
+        elif choice == 3:
+            quest_handler.display_quest_list(quest_handler.get_completed_quests(current_character, all_quests))
+        elif choice == 4:
+            quest_id = input("Quest ID to accept: ").strip()
+            quest_handler.accept_quest(current_character, quest_id, all_quests)
+            print(f"Accepted {all_quests[quest_id]['title']}!")
+        elif choice == 5:
+            quest_id = input("Quest ID to abandon: ").strip()
+            quest_handler.abandon_quest(current_character, quest_id)
+            print("Quest abandoned.")
+        elif choice == 6:
+            quest_id = input("Quest ID to complete: ").strip()
+            rewards = quest_handler.complete_quest(current_character, quest_id, all_quests)
+            print(f"Quest complete! +{rewards['xp']} XP, +{rewards['gold']} gold")
+    except (QuestError, CharacterError) as e:
+        print(f"Cannot do that: {e}")
 
 def explore():
     """Find and fight random enemies"""
     global current_character
     
-    # TODO: Implement exploration
-    # Generate random enemy based on character level
-    # Start combat with combat_system.SimpleBattle
-    # Handle combat results (XP, gold, death)
-    # Handle exceptions
-    pass
+    enemy = combat_system.get_random_enemy_for_level(current_character['level'])
+    print(f"\nA wild {enemy['name']} appears!")
+    try:
+        result = combat_system.SimpleBattle(current_character, enemy).start_battle()
+    except CharacterDeadError as e:
+        print(e)
+        handle_character_death()
+        return
+    if result['winner'] == 'player':
+        print(f"Victory! +{result['xp_gained']} XP, +{result['gold_gained']} gold")
+        levels = character_manager.gain_experience(current_character, result['xp_gained'])
+        character_manager.add_gold(current_character, result['gold_gained'])
+        if levels:
+            print(f"Level up! You are now level {current_character['level']}.")
+    elif character_manager.is_character_dead(current_character):
+        handle_character_death()
 
 def shop():
     """Shop menu for buying/selling items"""
     global current_character, all_items
     
-    # TODO: Implement shop
-    # Show available items for purchase
-    # Show current gold
-    # Options: Buy item, Sell item, Back
-    # Handle exceptions from inventory_system
-    pass
+    print(f"\n=== SHOP === (Gold: {current_character['gold']})")
+    for item_id, item in all_items.items():
+        print(f"- {item['name']} [{item_id}] ({item['type']}): {item['cost']} gold")
+    print("\n1. Buy item")
+    print("2. Sell item")
+    print("3. Back")
+    choice = get_menu_choice("Enter choice (1-3): ", 3)
+    if choice in (None, 3):
+        return
+    item_id = input("Item ID: ").strip()
+    if item_id not in all_items:
+        print(f"Unknown item: {item_id}")
+        return
+    try:
+        if choice == 1:
+            inventory_system.purchase_item(current_character, item_id, all_items[item_id])
+            print(f"Bought {all_items[item_id]['name']}.")
+        else:
+            gold = inventory_system.sell_item(current_character, item_id, all_items[item_id])
+            print(f"Sold for {gold} gold.")
+    except InventoryError as e:
+        print(f"Cannot do that: {e}")
 
 # ============================================================================
 # HELPER FUNCTIONS
 # ============================================================================
 
+def get_menu_choice(prompt, highest):
+    """
+    Read a menu number from the player
+    
+    Returns: Integer between 1 and highest, or None if the input is invalid
+    """
+    choice = input(prompt).strip()
+    if not choice.isdigit() or not 1 <= int(choice) <= highest:
+        print(f"Please enter a number from 1 to {highest}.")
+        return None
+    return int(choice)
+
 def save_game():
-    """Save current game state"""
-    global current_character
+    """
+    Save current game state
+    
+    Returns immediately: the save is written by a background thread
+    (only the fields changed since the last save). Write errors are
+    reported when they happen. Use flush_saves() to wait for the disk.
+    
+    Returns: concurrent.futures.Future for the save, or None
+    """
+    global current_character, save_queue
     
-    # TODO: Implement save
-    # Use character_manager.save_character()
-    # Handle any file I/O exceptions
-    pass
+    if current_character is None:
+        return None
+    if save_queue is None:
+        save_queue = character_manager.SaveQueue(delta=True)
+    return save_queue.submit(current_character, callback=report_save_error)
+
+def report_save_error(future):
+    """Print a warning if a background save failed"""
+    error = future.exception()
+    if error is not None:
+        print(f"\nWarning: could not save game: {error}")
+
+def flush_saves():
+    """Block until every queued save has been written"""
+    if save_queue is not None:
+        save_queue.flush()
 
 def load_game_data():
-    """Load all quest and item data from files"""
+    """Load all quest, item and enemy data from files"""
     global all_quests, all_items
     
-    # TODO: Implement data loading
-    # Try to load quests with game_data.load_quests()
-    # Try to load items with game_data.load_items()
-    # Handle MissingDataFileError, InvalidDataFormatError
-    # If files missing, create defaults with game_data.create_default_data_files()
-    pass
+    # Parsed data is cached next to the text files, so only the first
+    # startup after an edit pays for parsing and validation.
+    # MissingDataFileError / InvalidDataFormatError propagate to main(),
+    # which creates default files or reports the error.
+    all_quests = game_data.load_quests("data/quests.txt", use_cache=True)
+    all_items = game_data.load_items("data/items.txt", use_cache=True)
+    combat_system.load_enemy_templates("data/enemies.txt", use_cache=True)
 
 def handle_character_death():
     """Handle character death"""
     global current_character, game_running
     
-    # TODO: Implement death handling
-    # Display death message
-    # Offer: Revive (costs gold) or Quit
-    # If revive: use character_manager.revive_character()
-    # If quit: set game_running = False
-    pass
+    print(f"\n{current_character['name']} has fallen in battle!")
+    print(f"1. Revive ({REVIVE_COST} gold)")
+    print("2. Quit")
+    choice = get_menu_choice("Enter choice (1-2): ", 2)
+    if choice == 1 and current_character['gold'] >= REVIVE_COST:
+        character_manager.add_gold(current_character, -REVIVE_COST)
+        character_manager.revive_character(current_character)
+        print(f"You are revived with {current_character['health']} health.")
+        return
+    if choice == 1:
+        print("Not enough gold to revive.")
+    save_game()
+    flush_saves()
+    game_running = False
 
 def display_welcome():
     """Display welcome message"""
@@ -264,10 +421,9 @@ def main():
         elif choice == 2:
             load_game()
         elif choice == 3:
+            flush_saves()
             print("\nThanks for playing Quest Chronicles!")
             break
-        else:
-            print("Invalid choice. Please select 1-3.")
 
 if __name__ == "__main__":
     main()
@@ -9,6 +9,10 @@ AI Usage: [Document any AI assistance used]
 This module handles quest management, dependencies, and completion.
 """
 
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+
+import character_manager
 from custom_exceptions import (
     QuestNotFoundError,
     QuestRequirementsNotMetError,
@@ -43,14 +47,22 @@ def accept_quest(character, quest_id, quest_data_dict):
         QuestRequirementsNotMetError if prerequisite not completed
         QuestAlreadyCompletedError if quest already done
     """
-    # TODO: Implement quest acceptance
-    # Check quest exists
-    # Check level requirement
-    # Check prerequisite (if not "NONE")
-    # Check not already completed
-    # Check not already active
-    # Add to character['active_quests']
-    pass
+    if quest_id not in quest_data_dict:
+        raise QuestNotFoundError(f"Quest not found: {quest_id}")
+    quest = quest_data_dict[quest_id]
+    if character['level'] < quest['required_level']:
+        raise InsufficientLevelError(
+            f"Level {quest['required_level']} required for {quest_id} (you are level {character['level']})")
+    prerequisite = quest.get('prerequisite', 'NONE')
+    if prerequisite != 'NONE' and not is_quest_completed(character, prerequisite):
+        raise QuestRequirementsNotMetError(f"Complete {prerequisite} before starting {quest_id}")
+    if is_quest_completed(character, quest_id):
+        raise QuestAlreadyCompletedError(f"Quest already completed: {quest_id}")
+    if is_quest_active(character, quest_id):
+        raise QuestRequirementsNotMetError(f"Quest already active: {quest_id}")
+    character['active_quests'].append(quest_id)
+    _notify_availability(character, quest_data_dict, 'on_accept', quest_id)
+    return True
 
 def complete_quest(character, quest_id, quest_data_dict):
     """
@@ -70,14 +82,22 @@ def complete_quest(character, quest_id, quest_data_dict):
         QuestNotFoundError if quest_id not in quest_data_dict
         QuestNotActiveError if quest not in active_quests
     """
-    # TODO: Implement quest completion
-    # Check quest exists
-    # Check quest is active
-    # Remove from active_quests
-    # Add to completed_quests
-    # Grant rewards (use character_manager.gain_experience and add_gold)
-    # Return reward summary
-    pass
+    if quest_id not in quest_data_dict:
+        raise QuestNotFoundError(f"Quest not found: {quest_id}")
+    if not is_quest_active(character, quest_id):
+        raise QuestNotActiveError(f"Quest is not active: {quest_id}")
+    quest = quest_data_dict[quest_id]
+    character['active_quests'].remove(quest_id)
+    character['completed_quests'].append(quest_id)
+    level_ups = character_manager.gain_experience(character, quest['reward_xp'])
+    character_manager.add_gold(character, quest['reward_gold'])
+    _notify_availability(character, quest_data_dict, 'on_complete', quest_id)
+    return {
+        'quest_id': quest_id,
+        'xp': quest['reward_xp'],
+        'gold': quest['reward_gold'],
+        'level_ups': level_ups
+    }
 
 def abandon_quest(character, quest_id):
     """
@@ -86,8 +106,11 @@ def abandon_quest(character, quest_id):
     Returns: True if abandoned
     Raises: QuestNotActiveError if quest not active
     """
-    # TODO: Implement quest abandonment
-    pass
+    if not is_quest_active(character, quest_id):
+        raise QuestNotActiveError(f"Quest is not active: {quest_id}")
+    character['active_quests'].remove(quest_id)
+    _notify_availability(character, None, 'on_abandon', quest_id)
+    return True
 
 def get_active_quests(character, quest_data_dict):
     """
@@ -95,10 +118,8 @@ def get_active_quests(character, quest_data_dict):
     
     Returns: List of quest dictionaries for active quests
     """
-    # TODO: Implement active quest retrieval
-    # Look up each quest_id in character['active_quests']
-    # Return list of full quest data dictionaries
-    pass
+    return [quest_data_dict[quest_id] for quest_id in character['active_quests']
+            if quest_id in quest_data_dict]
 
 def get_completed_quests(character, quest_data_dict):
     """
@@ -106,8 +127,8 @@ def get_completed_quests(character, quest_data_dict):
     
     Returns: List of quest dictionaries for completed quests
     """
-    # TODO: Implement completed quest retrieval
-    pass
+    return [quest_data_dict[quest_id] for quest_id in character['completed_quests']
+            if quest_id in quest_data_dict]
 
 def get_available_quests(character, quest_data_dict):
     """
@@ -115,11 +136,13 @@ def get_available_quests(character, quest_data_dict):
     
     Available = meets level req + prerequisite done + not completed + not active
     
+    Served from the character's QuestAvailability index, which is kept
+    up to date incrementally instead of rescanning the catalog.
+    
     Returns: List of quest dictionaries
     """
-    # TODO: Implement available quest search
-    # Filter all quests by requirements
-    pass
+    availability = get_quest_availability(character, quest_data_dict)
+    return [quest_data_dict[quest_id] for quest_id in availability.quest_ids(character)]
 
 # ============================================================================
 # QUEST TRACKING
@@ -131,8 +154,7 @@ def is_quest_completed(character, quest_id):
     
     Returns: True if completed, False otherwise
     """
-    # TODO: Implement completion check
-    pass
+    return quest_id in character['completed_quests']
 
 def is_quest_active(character, quest_id):
     """
@@ -140,8 +162,7 @@ def is_quest_active(character, quest_id):
     
     Returns: True if active, False otherwise
     """
-    # TODO: Implement active check
-    pass
+    return quest_id in character['active_quests']
 
 def can_accept_quest(character, quest_id, quest_data_dict):
     """
@@ -150,9 +171,14 @@ def can_accept_quest(character, quest_id, quest_data_dict):
     Returns: True if can accept, False otherwise
     Does NOT raise exceptions - just returns boolean
     """
-    # TODO: Implement requirement checking
-    # Check all requirements without raising exceptions
-    pass
+    quest = quest_data_dict.get(quest_id)
+    if quest is None:
+        return False
+    prerequisite = quest.get('prerequisite', 'NONE')
+    return (character['level'] >= quest['required_level']
+            and (prerequisite == 'NONE' or is_quest_completed(character, prerequisite))
+            and not is_quest_completed(character, quest_id)
+            and not is_quest_active(character, quest_id))
 
 def get_quest_prerequisite_chain(quest_id, quest_data_dict):
     """
@@ -164,10 +190,7 @@ def get_quest_prerequisite_chain(quest_id, quest_data_dict):
     
     Raises: QuestNotFoundError if quest doesn't exist
     """
-    # TODO: Implement prerequisite chain tracing
-    # Follow prerequisite links backwards
-    # Build list in reverse order
-    pass
+    return list(get_quest_graph(quest_data_dict).prerequisite_chain(quest_id))
 
 # ============================================================================
 # QUEST STATISTICS
@@ -179,11 +202,11 @@ def get_quest_completion_percentage(character, quest_data_dict):
     
     Returns: Float between 0 and 100
     """
-    # TODO: Implement percentage calculation
-    # total_quests = len(quest_data_dict)
-    # completed_quests = len(character['completed_quests'])
-    # percentage = (completed / total) * 100
-    pass
+    total_quests = len(quest_data_dict)
+    if total_quests == 0:
+        return 0.0
+    completed = sum(1 for quest_id in character['completed_quests'] if quest_id in quest_data_dict)
+    return (completed / total_quests) * 100
 
 def get_total_quest_rewards_earned(character, quest_data_dict):
     """
@@ -191,18 +214,23 @@ def get_total_quest_rewards_earned(character, quest_data_dict):
     
     Returns: Dictionary with 'total_xp' and 'total_gold'
     """
-    # TODO: Implement reward calculation
-    # Sum up reward_xp and reward_gold for all completed quests
-    pass
+    total_xp = 0
+    total_gold = 0
+    for quest in get_completed_quests(character, quest_data_dict):
+        total_xp += quest['reward_xp']
+        total_gold += quest['reward_gold']
+    return {'total_xp': total_xp, 'total_gold': total_gold}
 
 def get_quests_by_level(quest_data_dict, min_level, max_level):
     """
     Get all quests within a level range
     
-    Returns: List of quest dictionaries
+    Uses the catalog's sorted level index: O(log n + k).
+    
+    Returns: List of quest dictionaries, ordered by required level
     """
-    # TODO: Implement level filtering
-    pass
+    graph = get_quest_graph(quest_data_dict)
+    return [quest_data_dict[quest_id] for quest_id in graph.quests_in_level_range(min_level, max_level)]
 
 # ============================================================================
 # DISPLAY FUNCTIONS
@@ -214,11 +242,12 @@ def display_quest_info(quest_data):
     
     Shows: Title, Description, Rewards, Requirements
     """
-    # TODO: Implement quest display
     print(f"\n=== {quest_data['title']} ===")
     print(f"Description: {quest_data['description']}")
-    # ... etc
-    pass
+    print(f"Rewards: {quest_data['reward_xp']} XP, {quest_data['reward_gold']} gold")
+    print(f"Required Level: {quest_data['required_level']}")
+    if quest_data.get('prerequisite', 'NONE') != 'NONE':
+        print(f"Prerequisite: {quest_data['prerequisite']}")
 
 def display_quest_list(quest_list):
     """
@@ -226,8 +255,12 @@ def display_quest_list(quest_list):
     
     Shows: Title, Required Level, Rewards
     """
-    # TODO: Implement quest list display
-    pass
+    if not quest_list:
+        print("No quests.")
+        return
+    for quest in quest_list:
+        print(f"- {quest['title']} [{quest['quest_id']}] (Level {quest['required_level']}): "
+              f"{quest['reward_xp']} XP, {quest['reward_gold']} gold")
 
 def display_character_quest_progress(character, quest_data_dict):
     """
@@ -239,8 +272,12 @@ def display_character_quest_progress(character, quest_data_dict):
     - Completion percentage
     - Total rewards earned
     """
-    # TODO: Implement progress display
-    pass
+    rewards = get_total_quest_rewards_earned(character, quest_data_dict)
+    print("\n=== QUEST PROGRESS ===")
+    print(f"Active quests: {len(character['active_quests'])}")
+    print(f"Completed quests: {len(character['completed_quests'])}")
+    print(f"Completion: {get_quest_completion_percentage(character, quest_data_dict):.1f}%")
+    print(f"Rewards earned: {rewards['total_xp']} XP, {rewards['total_gold']} gold")
 
 # ============================================================================
 # VALIDATION
@@ -255,11 +292,286 @@ def validate_quest_prerequisites(quest_data_dict):
     Returns: True if all valid
     Raises: QuestNotFoundError if invalid prerequisite found
     """
-    # TODO: Implement prerequisite validation
-    # Check each quest's prerequisite
-    # Ensure prerequisite exists in quest_data_dict
-    pass
+    graph = get_quest_graph(quest_data_dict)
+    for quest_id, prerequisite in graph.missing.items():
+        raise QuestNotFoundError(f"{quest_id} requires unknown quest {prerequisite}")
+    if graph.cyclic:
+        raise QuestRequirementsNotMetError(
+            f"Circular prerequisites among: {', '.join(sorted(graph.cyclic))}")
+    return True
+
+# ============================================================================
+# PREREQUISITE GRAPH
+# ============================================================================
+
+class QuestGraph:
+    """
+    Prerequisite index built once per quest catalog
+    
+    Each quest has at most one prerequisite, so the catalog is a forest:
+    - roots: quests with prerequisite NONE
+    - children: {quest_id: [quests that require it]}
+    - position: {quest_id: index in catalog order} (for stable output)
+    - depth: {quest_id: number of prerequisites above it}
+    - topological_order: every quest appears after its prerequisite
+    - missing: {quest_id: prerequisite} for prerequisites not in the catalog
+    - cyclic: quests on (or below) a prerequisite cycle
+    
+    Level index (sorted by required_level, then catalog order) for
+    bisect range queries:
+    - level_keys / quests_by_level: every quest
+    - root_level_keys / roots_by_level: quests with no prerequisite
+    """
+
+    def __init__(self, quest_data_dict):
+        self.quest_data_dict = quest_data_dict
+        self.size = len(quest_data_dict)
+        self.position = {}
+        self.parent = {}
+        self.children = {}
+        self.roots = []
+        self.missing = {}
+        for index, (quest_id, quest) in enumerate(quest_data_dict.items()):
+            self.position[quest_id] = index
+            self.children.setdefault(quest_id, [])
+            prerequisite = quest.get('prerequisite', 'NONE')
+            if prerequisite == 'NONE':
+                self.roots.append(quest_id)
+            elif prerequisite not in quest_data_dict:
+                self.missing[quest_id] = prerequisite
+            else:
+                self.parent[quest_id] = prerequisite
+                self.children.setdefault(prerequisite, []).append(quest_id)
+
+        # Breadth-first from every quest whose chain starts in the catalog
+        # (or at a missing prerequisite); anything unreached is on a cycle.
+        self.depth = {}
+        self.topological_order = []
+        queue = deque()
+        for quest_id in self.roots + list(self.missing):
+            self.depth[quest_id] = 0
+            queue.append(quest_id)
+        while queue:
+            quest_id = queue.popleft()
+            self.topological_order.append(quest_id)
+            for child in self.children[quest_id]:
+                self.depth[child] = self.depth[quest_id] + 1
+                queue.append(child)
+        self.cyclic = set(quest_data_dict) - set(self.depth)
+        self._chains = {}
+
+        self.quests_by_level = sorted(quest_data_dict, key=self._level_key)
+        self.level_keys = [quest_data_dict[q]['required_level'] for q in self.quests_by_level]
+        self.roots_by_level = sorted(self.roots, key=self._level_key)
+        self.root_level_keys = [quest_data_dict[q]['required_level'] for q in self.roots_by_level]
+        self.root_set = set(self.roots)
+
+    def _level_key(self, quest_id):
+        return self.quest_data_dict[quest_id]['required_level'], self.position[quest_id]
+
+    def quests_in_level_range(self, min_level, max_level):
+        """Quest IDs with min_level <= required_level <= max_level"""
+        low = bisect_left(self.level_keys, min_level)
+        high = bisect_right(self.level_keys, max_level)
+        return self.quests_by_level[low:high]
+
+    def roots_in_level_range(self, above_level, max_level):
+        """Root quest IDs with above_level < required_level <= max_level"""
+        low = bisect_right(self.root_level_keys, above_level)
+        high = bisect_right(self.root_level_keys, max_level)
+        return self.roots_by_level[low:high]
+
+    def prerequisite_chain(self, quest_id):
+        """
+        Tuple of quest IDs from the earliest prerequisite down to quest_id
+        
+        Walks parent links (O(chain length)) and memoizes the result;
+        a walk stops early at any ancestor whose chain is already known.
+        
+        Raises: QuestNotFoundError if quest_id or an ancestor is missing
+                QuestRequirementsNotMetError if the chain is circular
+        """
+        chain = self._chains.get(quest_id)
+        if chain is not None:
+            return chain
+        if quest_id not in self.position:
+            raise QuestNotFoundError(f"Quest not found: {quest_id}")
+        if quest_id in self.cyclic:
+            raise QuestRequirementsNotMetError(f"Circular prerequisites for {quest_id}")
+        walked = []
+        current = quest_id
+        prefix = ()
+        while current is not None:
+            if current in self._chains:
+                prefix = self._chains[current]
+                break
+            if current in self.missing:
+                raise QuestNotFoundError(f"{current} requires unknown quest {self.missing[current]}")
+            walked.append(current)
+            current = self.parent.get(current)
+        chain = prefix + tuple(reversed(walked))
+        self._chains[quest_id] = chain
+        return chain
+
+    def is_current(self, quest_data_dict):
+        """True if this graph was built from quest_data_dict as it is now"""
+        return self.quest_data_dict is quest_data_dict and self.size == len(quest_data_dict)
+
+# ============================================================================
+# INCREMENTAL AVAILABILITY
+# ============================================================================
+
+class QuestAvailability:
+    """
+    Per-character set of quests that can currently be accepted
+    
+    Built once from the QuestGraph, then updated only for the quests an
+    event touches. Root quests come straight from the graph's level index;
+    only quests unlocked by a completion wait in per-character level buckets.
+    Events:
+    - accept_quest: the quest leaves the set
+    - abandon_quest: the quest returns to the set
+    - complete_quest: the quest's children are unlocked
+    - level change: quests waiting in level buckets between the old and
+      new level move into the set
+    
+    Level changes (gain_experience, or any other edit of character['level'])
+    are picked up lazily on the next event or query. If the quest lists
+    were edited directly (replaced, resized, or for IndexedList, mutated
+    more often than the event accounts for) the index rebuilds itself
+    from scratch.
+    
+    The index lives on Character.quest_availability, outside the
+    character's keys, so it is never saved, copied or compared.
+    """
+
+    def __init__(self, character, quest_data_dict):
+        self.graph = get_quest_graph(quest_data_dict)
+        self.rebuild(character)
+
+    def rebuild(self, character):
+        """Recompute the index from the character's current state"""
+        self.available = set()
+        self.locked = {}
+        self.locked_levels = []
+        self.level = character['level']
+        candidates = self.graph.roots_in_level_range(float('-inf'), self.level)
+        for quest_id in character['completed_quests']:
+            candidates.extend(self.graph.children.get(quest_id, ()))
+        for quest_id in candidates:
+            if not is_quest_completed(character, quest_id) and not is_quest_active(character, quest_id):
+                self._place(character, quest_id)
+        self._remember_lists(character)
+
+    def quest_ids(self, character):
+        """Available quest IDs in catalog order"""
+        self._sync(character)
+        return sorted(self.available, key=self.graph.position.__getitem__)
+
+    def on_accept(self, character, quest_id):
+        self._sync(character, expected_change=(1, 0))
+        self.available.discard(quest_id)
+
+    def on_abandon(self, character, quest_id):
+        self._sync(character, expected_change=(-1, 0))
+        if quest_id in self.graph.position:
+            self._place(character, quest_id)
+
+    def on_complete(self, character, quest_id):
+        self._sync(character, expected_change=(-1, 1))
+        for child in self.graph.children.get(quest_id, ()):
+            if not is_quest_completed(character, child) and not is_quest_active(character, child):
+                self._place(character, child)
 
+    def _place(self, character, quest_id):
+        """Put a quest in the set, or in its level bucket, if its prerequisite is done"""
+        prerequisite = self.graph.parent.get(quest_id)
+        if prerequisite is not None and not is_quest_completed(character, prerequisite):
+            return
+        required_level = self.graph.quest_data_dict[quest_id]['required_level']
+        if required_level <= self.level:
+            self.available.add(quest_id)
+        elif quest_id not in self.graph.root_set:
+            if required_level not in self.locked:
+                self.locked[required_level] = set()
+                insort(self.locked_levels, required_level)
+            self.locked[required_level].add(quest_id)
+
+    def _sync(self, character, expected_change=(0, 0)):
+        """Catch up with level changes and detect outside edits of the lists"""
+        expected = [(list_id, size + change, None if version is None else version + abs(change))
+                     for (list_id, size, version), change in zip(self._list_states, expected_change)]
+        if self._current_lists(character) != expected:
+            self.rebuild(character)
+            return
+        self._list_states = expected
+        new_level = character['level']
+        if new_level > self.level:
+            for quest_id in self.graph.roots_in_level_range(self.level, new_level):
+                if not is_quest_completed(character, quest_id) and not is_quest_active(character, quest_id):
+                    self.available.add(quest_id)
+            high = bisect_right(self.locked_levels, new_level)
+            for required_level in self.locked_levels[:high]:
+                self.available.update(self.locked.pop(required_level))
+            del self.locked_levels[:high]
+            self.level = new_level
+        elif new_level < self.level:
+            self.level = new_level
+            for quest_id in [q for q in self.available
+                             if self.graph.quest_data_dict[q]['required_level'] > new_level]:
+                self.available.discard(quest_id)
+                self._place(character, quest_id)
+
+    def _remember_lists(self, character):
+        self._list_states = self._current_lists(character)
+
+    @staticmethod
+    def _current_lists(character):
+        """(id, length, mutation count or None) of the active and completed lists"""
+        return [(id(quests), len(quests), getattr(quests, 'version', None))
+                for quests in (character['active_quests'], character['completed_quests'])]
+
+def get_quest_availability(character, quest_data_dict):
+    """
+    Return the character's QuestAvailability for this catalog, creating it if needed
+    
+    The index is kept on Character records; a plain dictionary character
+    gets a fresh one on every call.
+    """
+    availability = getattr(character, 'quest_availability', None)
+    if availability is None or not availability.graph.is_current(quest_data_dict):
+        availability = QuestAvailability(character, quest_data_dict)
+        if isinstance(character, character_manager.Character):
+            character.quest_availability = availability
+    return availability
+
+def _notify_availability(character, quest_data_dict, event, quest_id):
+    """Forward a quest state change to the character's index, if it has one"""
+    availability = getattr(character, 'quest_availability', None)
+    if availability is not None and (quest_data_dict is None
+                                     or availability.graph.is_current(quest_data_dict)):
+        getattr(availability, event)(character, quest_id)
+
+# A few recently used graphs, keyed by id() of their catalog. Each graph
+# holds a reference to its catalog, so the id cannot be reused while cached.
+_GRAPH_CACHE_SIZE = 8
+_graph_cache = {}
+
+def get_quest_graph(quest_data_dict):
+    """
+    Return the QuestGraph for a quest catalog, building it on first use
+    
+    Catalogs are treated as read-only once loaded; a catalog whose size
+    has changed gets a fresh graph.
+    """
+    graph = _graph_cache.get(id(quest_data_dict))
+    if graph is None or not graph.is_current(quest_data_dict):
+        graph = QuestGraph(quest_data_dict)
+        _graph_cache.pop(id(quest_data_dict), None)
+        if len(_graph_cache) >= _GRAPH_CACHE_SIZE:
+            del _graph_cache[next(iter(_graph_cache))]
+        _graph_cache[id(quest_data_dict)] = graph
+    return graph
 
 # ============================================================================
 # TESTING
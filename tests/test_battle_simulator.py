@@ -0,0 +1,82 @@
+"""
+Test Battle Simulator
+Tests the vectorized Monte Carlo battles against the BattleEngine rules
+"""
+
+import pytest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+np = pytest.importorskip("numpy")
+
+import battle_simulator
+import character_manager
+import combat_system
+
+def engine_result(character, enemy_type, policy):
+    engine = combat_system.BattleEngine(dict(character), combat_system.create_enemy(enemy_type),
+                                        combat_system.POLICIES[policy](), rng=random.Random(0))
+    return engine.run()
+
+# ============================================================================
+# SIMULATION TESTS
+# ============================================================================
+
+@pytest.mark.parametrize("character_class", battle_simulator.CHARACTER_CLASSES)
+@pytest.mark.parametrize("policy", ["attack", "ability"])
+def test_deterministic_battles_match_engine(character_class, policy):
+    """Test that battles without random rolls end exactly like BattleEngine"""
+    if character_class == "Rogue" and policy == "ability":
+        pytest.skip("critical strikes are random")
+    character = character_manager.create_character_at_level(character_class, character_class, 4)
+
+    for enemy_type in combat_system.get_enemy_types():
+        expected = engine_result(character, enemy_type, policy)
+        outcomes = battle_simulator.simulate_battles(
+            character, combat_system.create_enemy(enemy_type), 50, policy, rng=1)
+
+        assert outcomes['player_won'].all() == (expected['winner'] == 'player')
+        assert (outcomes['turns'] == expected['turns']).all()
+        assert (outcomes['character_health'] == expected['character_health']).all()
+
+def test_random_rolls_follow_probabilities():
+    """Test critical strikes and escapes with a fixed seed"""
+    rogue = character_manager.create_character_at_level("Rogue", "Rogue", 5)
+    dragon = combat_system.create_enemy("dragon")
+
+    fights = battle_simulator.simulate_battles(rogue, dragon, 20000, "ability", rng=3)
+    runs = battle_simulator.simulate_battles(rogue, dragon, 20000, "random", rng=3)
+
+    assert 0 < fights['player_won'].mean() < 1
+    assert runs['escaped'].mean() > 0.5
+    assert not (runs['escaped'] & runs['player_won']).any()
+    assert dragon['health'] == 200
+
+def test_simulation_is_reproducible():
+    """Test that the same seed gives the same battles"""
+    mage = character_manager.create_character_at_level("Mage", "Mage", 3)
+    first = battle_simulator.simulate_battles(mage, combat_system.create_enemy("orc"), 500, "random", rng=9)
+    second = battle_simulator.simulate_battles(mage, combat_system.create_enemy("orc"), 500, "random", rng=9)
+
+    assert all((first[key] == second[key]).all() for key in first)
+
+# ============================================================================
+# SWEEP TESTS
+# ============================================================================
+
+def test_balance_sweep_table():
+    """Test one summary row per cell and the rendered table"""
+    rows = battle_simulator.balance_sweep(levels=[1, 2], classes=["Warrior", "Cleric"], battles=100)
+
+    assert len(rows) == 2 * 2 * len(combat_system.get_enemy_types())
+    assert rows[0]['class'] == "Warrior" and rows[0]['enemy'] == "goblin"
+    assert rows[0]['win_rate'] == 1.0
+    table = battle_simulator.format_summary_table(rows).splitlines()
+    assert len(table) == len(rows) + 1
+    assert table[0].split() == battle_simulator.SUMMARY_COLUMNS
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,821 @@
+"""
+Test Character Storage
+Tests character data structures and save/load behaviour
+"""
+
+import pytest
+import sys
+import os
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom_exceptions import CharacterNotFoundError, InvalidSaveDataError, SaveFileCorruptedError
+import character_manager
+import inventory_system
+import quest_handler
+
+# ============================================================================
+# CHARACTER RECORD TESTS
+# ============================================================================
+
+def test_character_behaves_like_dict():
+    """Test mapping access on the slotted Character record"""
+    char = character_manager.create_character("SlotTest", "Rogue")
+
+    assert isinstance(char, character_manager.Character)
+    assert not hasattr(char, '__dict__')
+    assert list(char) == character_manager.CHARACTER_FIELDS
+    assert char['class'] == "Rogue"
+    assert 'equipped_weapon' not in char
+
+    char['equipped_weapon'] = 'iron_sword'
+    assert char.get('equipped_weapon') == 'iron_sword'
+    del char['equipped_weapon']
+    assert char.get('equipped_weapon') is None
+    with pytest.raises(KeyError):
+        char['missing']
+
+def test_character_copies_are_independent():
+    """Test that deep copies do not share lists with the original"""
+    import copy
+    char = character_manager.create_character("CopyTest", "Mage")
+    duplicate = copy.deepcopy(char)
+    assert duplicate == char
+
+    duplicate['inventory'].append('health_potion')
+
+    assert 'health_potion' not in char['inventory']
+
+# ============================================================================
+# INDEXED LIST TESTS
+# ============================================================================
+
+def test_indexed_list_membership_stays_in_sync():
+    """Test that every list mutator keeps the membership index correct"""
+    items = character_manager.IndexedList(['a', 'b', 'a'])
+    assert items.count('a') == 2
+
+    items.remove('a')
+    items.append('c')
+    items.insert(0, 'd')
+    items[1] = 'e'
+    del items[-1]
+    items.extend(['f'])
+    items += ['g']
+
+    assert items == ['d', 'e', 'a', 'f', 'g']
+    for item in ['d', 'e', 'a', 'f', 'g']:
+        assert item in items
+    assert 'b' not in items and 'c' not in items
+
+    items.pop()
+    items[0:2] = ['h']
+    assert 'g' not in items and 'd' not in items and 'h' in items
+    items.clear()
+    assert 'a' not in items
+
+def test_indexed_list_survives_rejected_slice_assignment():
+    """Test that a failed extended-slice assignment leaves the index intact"""
+    items = character_manager.IndexedList(['a', 'b', 'c'])
+
+    with pytest.raises(ValueError):
+        items[::2] = ['x']
+
+    assert items == ['a', 'b', 'c']
+    assert 'a' in items and 'c' in items and 'x' not in items
+    items[::2] = ['x', 'y']
+    assert 'a' not in items and items.count('x') == 1 and 'y' in items
+
+def test_character_lists_are_indexed():
+    """Test that created and loaded characters use indexed lists"""
+    char = character_manager.create_character("IndexTest", "Cleric")
+    quest_handler.accept_quest(char, 'q', {'q': {'quest_id': 'q', 'required_level': 1, 'prerequisite': 'NONE'}})
+    inventory_system.add_item_to_inventory(char, 'health_potion')
+    assert isinstance(char['completed_quests'], character_manager.IndexedList)
+
+    character_manager.save_character(char)
+    try:
+        loaded = character_manager.load_character("IndexTest")
+    finally:
+        character_manager.delete_character("IndexTest")
+
+    for field in ['active_quests', 'completed_quests']:
+        assert isinstance(loaded[field], character_manager.IndexedList)
+        assert loaded[field] == char[field]
+    assert loaded['inventory'] == char['inventory']
+    assert quest_handler.is_quest_active(loaded, 'q')
+    assert inventory_system.has_item(loaded, 'health_potion')
+
+# ============================================================================
+# STACKED INVENTORY TESTS
+# ============================================================================
+
+def test_stacked_inventory_counts_and_slots():
+    """Test stack counts, slot usage and the list view"""
+    inventory = character_manager.StackedInventory(['potion', 'sword', 'potion'])
+
+    assert len(inventory) == 3
+    assert inventory.count('potion') == 2
+    assert list(inventory) == ['potion', 'potion', 'sword']
+    assert inventory[2] == 'sword'
+
+    inventory.remove('potion')
+    assert inventory.count('potion') == 1
+    with pytest.raises(ValueError):
+        inventory.remove('shield')
+
+def test_stacked_inventory_order_is_grouped_by_stack():
+    """Test that insert joins the item's stack and reordering is refused"""
+    inventory = character_manager.StackedInventory(['potion', 'sword'])
+
+    inventory.insert(0, 'sword')
+    assert list(inventory) == ['potion', 'sword', 'sword']
+    with pytest.raises(TypeError):
+        inventory.reverse()
+    with pytest.raises(TypeError):
+        inventory.sort()
+
+def test_inventory_system_uses_stacks():
+    """Test that inventory_system functions work on a stacked inventory"""
+    char = character_manager.create_character("StackTest", "Warrior")
+    for _ in range(3):
+        inventory_system.add_item_to_inventory(char, 'health_potion')
+
+    assert inventory_system.count_item(char, 'health_potion') == 3
+    assert inventory_system.get_inventory_space_remaining(char) == inventory_system.MAX_INVENTORY_SIZE - 3
+    assert inventory_system.clear_inventory(char) == ['health_potion'] * 3
+    assert len(char['inventory']) == 0
+
+def test_stacked_inventory_save_round_trip():
+    """Test that the save file still lists one entry per item"""
+    char = character_manager.create_character("StackSaveTest", "Mage")
+    char['inventory'].add('health_potion', 2)
+    character_manager.save_character(char)
+    try:
+        with open("data/save_games/StackSaveTest_save.txt") as f:
+            assert "INVENTORY: health_potion,health_potion\n" in f.read()
+        loaded = character_manager.load_character("StackSaveTest")
+    finally:
+        character_manager.delete_character("StackSaveTest")
+
+    assert loaded['inventory'].count('health_potion') == 2
+
+# ============================================================================
+# BINARY SAVE FORMAT TESTS
+# ============================================================================
+
+def make_veteran(name="Veteran"):
+    char = character_manager.create_character(name, "Cleric")
+    char['gold'] = 5000
+    char['inventory'].add('health_potion', 3)
+    char['inventory'].add('iron_sword')
+    char['completed_quests'].extend(['first_steps', 'goblin_hunter'])
+    char['active_quests'].append('orc_menace')
+    return char
+
+def test_binary_encoding_round_trip():
+    """Test that the binary encoding preserves every field"""
+    char = make_veteran()
+
+    data = character_manager.encode_character_binary(char)
+
+    assert data.startswith(character_manager.BINARY_SAVE_MAGIC)
+    assert character_manager.decode_character_binary(data) == char
+
+def test_binary_backend_reads_legacy_text(tmp_path):
+    """Test that a binary-format backend still loads text saves"""
+    directory = str(tmp_path)
+    char = make_veteran()
+    character_manager.FileSaveBackend("text").save(char, directory)
+    binary_backend = character_manager.FileSaveBackend("binary")
+
+    assert binary_backend.load("Veteran", directory) == char
+    binary_backend.save(char, directory)
+    assert binary_backend.path("Veteran", directory).endswith("Veteran_save.bin")
+    assert not os.path.exists(os.path.join(directory, "Veteran_save.txt"))
+    with open(binary_backend.path("Veteran", directory), "rb") as f:
+        assert f.read(4) == character_manager.BINARY_SAVE_MAGIC
+    assert binary_backend.load("Veteran", directory) == char
+    assert binary_backend.list(directory) == ["Veteran"]
+
+def test_binary_saves_use_bin_extension(tmp_path):
+    """Test that binary saves are .bin files, while old binary .txt saves still load"""
+    directory = str(tmp_path)
+    char = make_veteran()
+    with open(os.path.join(directory, "Veteran_save.txt"), "wb") as f:
+        f.write(character_manager.encode_character_binary(char))
+    text_backend = character_manager.FileSaveBackend("text", manifest=False)
+
+    assert text_backend.load("Veteran", directory) == char
+    binary_backend = character_manager.FileSaveBackend("binary", manifest=False)
+    binary_backend.save(char, directory)
+    assert sorted(os.listdir(directory)) == ["Veteran_save.bin"]
+
+    assert binary_backend.migrate_to_sharded(directory) == 1
+    assert list(text_backend.iter_names(directory)) == ["Veteran"]
+    assert text_backend.path("Veteran", directory).endswith("Veteran_save.bin")
+    text_backend.save(char, directory)
+    assert text_backend.path("Veteran", directory).endswith("Veteran_save.txt")
+    assert text_backend.load("Veteran", directory) == char
+    text_backend.delete("Veteran", directory)
+    assert list(text_backend.iter_names(directory)) == []
+
+def test_truncated_binary_save_is_corrupted():
+    """Test that a cut-off binary save raises SaveFileCorruptedError"""
+    data = character_manager.encode_character_binary(make_veteran())
+
+    with pytest.raises(SaveFileCorruptedError):
+        character_manager.decode_save_data(data[:-3])
+
+# ============================================================================
+# DELTA SAVE TESTS
+# ============================================================================
+
+def test_changed_fields_tracks_assignments_and_lists():
+    """Test that change tracking sees field writes and list mutations"""
+    char = make_veteran()
+    assert char.changed_fields() is None
+
+    char.mark_clean()
+    char['gold'] += 10
+    char['completed_quests'].append('orc_menace')
+
+    assert char.changed_fields() == ['gold', 'completed_quests']
+
+def test_delta_save_appends_journal_and_replays(tmp_path):
+    """Test that delta saves only append changes and load replays them"""
+    directory = str(tmp_path)
+    backend = character_manager.FileSaveBackend("binary")
+    char = make_veteran()
+    backend.save(char, directory)
+    snapshot = open(backend.path("Veteran", directory), "rb").read()
+
+    char['gold'] = 1
+    backend.save_delta(char, directory)
+    char['inventory'].add('steel_sword')
+    backend.save_delta(char, directory)
+
+    assert open(backend.path("Veteran", directory), "rb").read() == snapshot
+    with open(backend.journal_path("Veteran", directory)) as f:
+        assert f.read() == "GOLD: 1\nEND\nINVENTORY: health_potion,health_potion,health_potion,iron_sword,steel_sword\nEND\n"
+    assert backend.load("Veteran", directory) == char
+
+def test_journal_compaction_and_torn_entry(tmp_path):
+    """Test that a full journal is folded into the snapshot and torn entries are ignored"""
+    directory = str(tmp_path)
+    backend = character_manager.FileSaveBackend(journal_limit=40)
+    char = make_veteran()
+    backend.save(char, directory)
+    journal = backend.journal_path("Veteran", directory)
+
+    for gold in range(5):
+        char['gold'] = gold
+        backend.save_delta(char, directory)
+    assert not os.path.exists(journal)
+    assert backend.load("Veteran", directory)['gold'] == 4
+
+    char['gold'] = 5
+    backend.save_delta(char, directory)
+    with open(journal, "a") as f:
+        f.write("GOLD: 999\n")
+    assert backend.load("Veteran", directory)['gold'] == 5
+
+# ============================================================================
+# ATOMIC SAVE TESTS
+# ============================================================================
+
+def test_failed_save_keeps_previous_file(tmp_path, monkeypatch):
+    """Test that a save interrupted before the rename leaves the old save intact"""
+    directory = str(tmp_path)
+    backend = character_manager.FileSaveBackend()
+    char = make_veteran()
+    backend.save(char, directory)
+
+    def crash(*args):
+        raise OSError("disk full")
+    monkeypatch.setattr(os, "replace", crash)
+    char['gold'] = 1
+    with pytest.raises(OSError):
+        backend.save(char, directory)
+    monkeypatch.undo()
+
+    assert backend.load("Veteran", directory)['gold'] == 5000
+    assert not [name for name in os.listdir(directory) if name.endswith(".tmp")]
+
+def test_durable_save_fsyncs_file_and_directory(tmp_path, monkeypatch):
+    """Test per-save fsync versus one directory fsync for a group commit"""
+    directory = str(tmp_path)
+    backend = character_manager.FileSaveBackend(durable=True, manifest=False)
+    calls = []
+    real_fsync = os.fsync
+    monkeypatch.setattr(os, "fsync", lambda fd: calls.append(fd) or real_fsync(fd))
+
+    for i in range(3):
+        backend.save(make_veteran(f"Solo{i}"), directory)
+    assert len(calls) == 6
+
+    calls.clear()
+    with backend.group_commit():
+        for i in range(3):
+            backend.save(make_veteran(f"Group{i}"), directory)
+        assert len(calls) == 0
+    assert len(calls) == 4
+
+def test_group_commit_publishes_saves_at_end(tmp_path):
+    """Test that staged saves are invisible until the batch commits"""
+    directory = str(tmp_path)
+    backend = character_manager.FileSaveBackend()
+    char = make_veteran()
+    backend.save(char, directory)
+
+    with backend.group_commit():
+        char['gold'] = 7
+        backend.save_delta(char, directory)
+        char['gold'] = 8
+        backend.save_delta(char, directory)
+        backend.save(make_veteran("Newcomer"), directory)
+        assert backend.load("Veteran", directory)['gold'] == 5000
+        assert backend.list(directory) == ["Veteran"]
+
+    assert backend.load("Veteran", directory)['gold'] == 8
+    assert sorted(backend.list(directory)) == ["Newcomer", "Veteran"]
+    assert not [name for name in os.listdir(directory) if name.endswith(".tmp")]
+
+# ============================================================================
+# BACKGROUND SAVE TESTS
+# ============================================================================
+
+def test_save_queue_writes_in_background(tmp_path):
+    """Test that queued saves reach disk by flush() and resolve their futures"""
+    queue = character_manager.SaveQueue(str(tmp_path))
+    char = make_veteran()
+    try:
+        future = queue.submit(char)
+        char['gold'] = 42
+        second = queue.submit(char)
+        assert queue.flush(timeout=5)
+    finally:
+        queue.close()
+
+    assert future.result() == True and second.result() == True
+    assert character_manager.load_character("Veteran", str(tmp_path))['gold'] == 42
+
+def test_save_queue_coalesces_pending_saves(tmp_path):
+    """Test that saves of the same character waiting in the queue are merged"""
+    queue = character_manager.SaveQueue(str(tmp_path))
+    char = make_veteran()
+    try:
+        with queue._condition:
+            first = queue.submit(char)
+            char['gold'] = 7
+            second = queue.submit(char)
+            assert len(queue._pending) == 1
+        queue.flush(timeout=5)
+    finally:
+        queue.close()
+
+    assert first is second
+    assert character_manager.load_character("Veteran", str(tmp_path))['gold'] == 7
+
+def test_save_queue_reports_errors_through_future(tmp_path):
+    """Test that a failed write is delivered to the future and callback"""
+    blocker = tmp_path / "not_a_directory"
+    blocker.write_text("")
+    errors = []
+    queue = character_manager.SaveQueue(str(blocker))
+    try:
+        future = queue.submit(make_veteran(), callback=lambda f: errors.append(f.exception()))
+        queue.flush(timeout=5)
+    finally:
+        queue.close()
+
+    assert isinstance(future.exception(), OSError)
+    assert errors == [future.exception()]
+
+def test_save_queue_failed_delta_upgrades_queued_save(tmp_path, monkeypatch):
+    """Test that a save queued behind a failed delta writes the lost fields too"""
+    queue = character_manager.SaveQueue(str(tmp_path))
+    char = make_veteran()
+    backend = character_manager._save_backend
+    real_save_delta = backend.save_delta
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def failing_once(character, save_directory, changed=None):
+        calls.append(changed)
+        if len(calls) == 1:
+            started.set()
+            release.wait(5)
+            raise OSError("disk full")
+        return real_save_delta(character, save_directory, changed)
+
+    try:
+        queue.submit(char)
+        assert queue.flush(timeout=5)
+        monkeypatch.setattr(backend, "save_delta", failing_once)
+        char['gold'] = 999
+        first = queue.submit(char)
+        assert started.wait(5)
+        char['level'] = 4
+        second = queue.submit(char)
+        release.set()
+        assert queue.flush(timeout=5)
+    finally:
+        release.set()
+        queue.close()
+
+    assert isinstance(first.exception(), OSError)
+    assert second.result() == True
+    assert calls == [['gold']]
+    loaded = character_manager.load_character("Veteran", str(tmp_path))
+    assert loaded['gold'] == 999 and loaded['level'] == 4
+
+# ============================================================================
+# BULK OPERATION TESTS
+# ============================================================================
+
+def test_bulk_save_and_load(tmp_path):
+    """Test saving and loading many characters on the thread pool"""
+    directory = str(tmp_path)
+    characters = [character_manager.create_character(f"Bulk{i}", "Rogue") for i in range(20)]
+
+    saved = dict(character_manager.save_characters(characters, directory, max_workers=4))
+    loaded = dict(character_manager.load_characters([c['name'] for c in characters], directory, max_workers=4))
+
+    assert saved == {c['name']: True for c in characters}
+    assert loaded == {c['name']: c for c in characters}
+
+def test_bulk_load_collects_failures(tmp_path):
+    """Test that bad saves are reported per item without stopping the batch"""
+    directory = str(tmp_path)
+    character_manager.save_character(character_manager.create_character("Good", "Mage"), directory)
+    with open(os.path.join(directory, "Broken_save.txt"), "w") as f:
+        f.write("LEVEL: not a number\n")
+
+    results = dict(character_manager.iter_all_characters(directory, max_workers=2))
+
+    assert results['Good']['name'] == "Good"
+    assert isinstance(results['Broken'], InvalidSaveDataError)
+    missing = dict(character_manager.load_characters(["Nobody"], directory))
+    assert isinstance(missing['Nobody'], CharacterNotFoundError)
+
+# ============================================================================
+# CHARACTER CACHE TESTS
+# ============================================================================
+
+@pytest.fixture
+def character_cache():
+    cache = character_manager.enable_character_cache(maxsize=2)
+    yield cache
+    character_manager.disable_character_cache()
+
+def test_cache_hits_return_private_copies(tmp_path, character_cache):
+    """Test that repeated loads hit the cache and cannot corrupt it"""
+    directory = str(tmp_path)
+    character_manager.save_character(make_veteran(), directory)
+
+    first = character_manager.load_character("Veteran", directory)
+    first['gold'] = 0
+    first['inventory'].clear()
+    second = character_manager.load_character("Veteran", directory)
+
+    assert second['gold'] == 5000
+    assert second['inventory'].count('health_potion') == 3
+    stats = character_manager.character_cache_stats()
+    assert (stats['hits'], stats['misses']) == (1, 1)
+
+def test_cache_invalidated_by_save_and_file_change(tmp_path, character_cache):
+    """Test invalidation through save_character and through outside edits"""
+    directory = str(tmp_path)
+    char = make_veteran()
+    character_manager.save_character(char, directory)
+    character_manager.load_character("Veteran", directory)
+
+    char['gold'] = 1
+    character_manager.save_character(char, directory)
+    assert character_manager.load_character("Veteran", directory)['gold'] == 1
+
+    path = os.path.join(directory, "Veteran_save.txt")
+    with open(path) as f:
+        text = f.read()
+    with open(path, "w") as f:
+        f.write(text.replace("GOLD: 1\n", "GOLD: 22\n"))
+    assert character_manager.load_character("Veteran", directory)['gold'] == 22
+
+def test_cache_evicts_least_recently_used(tmp_path, character_cache):
+    """Test that the cache stays within maxsize"""
+    directory = str(tmp_path)
+    for name in ["A", "B", "C"]:
+        character_manager.save_character(character_manager.create_character(name, "Mage"), directory)
+        character_manager.load_character(name, directory)
+
+    stats = character_manager.character_cache_stats()
+    assert stats['size'] == 2
+    assert stats['evictions'] == 1
+
+def test_cache_skips_load_that_raced_with_a_save(tmp_path, character_cache, sqlite_backend, monkeypatch):
+    """Test that a load overtaken by a save is not cached (SQLite has no stamp)"""
+    directory = str(tmp_path)
+    char = make_veteran()
+    character_manager.save_character(char, directory)
+    real_load = sqlite_backend.load
+
+    def load_then_save(name, save_directory):
+        loaded = real_load(name, save_directory)
+        char['gold'] = 7
+        character_manager.save_character(char, save_directory)
+        return loaded
+
+    monkeypatch.setattr(sqlite_backend, "load", load_then_save)
+    assert character_manager.load_character("Veteran", directory)['gold'] == 5000
+    monkeypatch.setattr(sqlite_backend, "load", real_load)
+    assert character_manager.load_character("Veteran", directory)['gold'] == 7
+
+# ============================================================================
+# ARCHIVE TESTS
+# ============================================================================
+
+@pytest.mark.parametrize("codec", ["zlib", "lzma"])
+def test_export_import_round_trip(tmp_path, codec):
+    """Test that every character survives an archive round trip"""
+    source = str(tmp_path / "source")
+    target = str(tmp_path / "target")
+    archive = str(tmp_path / "saves.qca")
+    characters = [make_veteran(f"Hero{i}") for i in range(7)]
+    list(character_manager.save_characters(characters, source, max_workers=2))
+    progress = []
+
+    exported = character_manager.export_characters(archive, source, codec, chunk_size=3, max_workers=2,
+                                                   progress=lambda done, size: progress.append(done))
+    imported = character_manager.import_characters(archive, target, max_workers=2)
+
+    assert exported == imported == 7
+    assert progress == [3, 6, 7]
+    for char in characters:
+        assert character_manager.load_character(char['name'], target) == char
+
+def test_truncated_archive_is_corrupted(tmp_path):
+    """Test that a cut-off archive raises SaveFileCorruptedError"""
+    directory = str(tmp_path / "saves")
+    archive = str(tmp_path / "saves.qca")
+    character_manager.save_character(make_veteran(), directory)
+    character_manager.export_characters(archive, directory)
+    with open(archive, "rb") as f:
+        data = f.read()
+    with open(archive, "wb") as f:
+        f.write(data[:-20])
+
+    with pytest.raises(SaveFileCorruptedError):
+        character_manager.import_characters(archive, str(tmp_path / "restored"))
+
+# ============================================================================
+# SAVE BACKEND TESTS
+# ============================================================================
+
+@pytest.fixture
+def sqlite_backend():
+    backend = character_manager.SqliteSaveBackend()
+    previous = character_manager.set_save_backend(backend)
+    yield backend
+    character_manager.set_save_backend(previous)
+    backend.close()
+
+def test_sqlite_backend_round_trip(tmp_path, sqlite_backend):
+    """Test save, load, list and delete through the SQLite backend"""
+    directory = str(tmp_path)
+    char = character_manager.create_character("SqlHero", "Warrior")
+    char['inventory'].add('health_potion', 2)
+    char['completed_quests'].append('first_steps')
+
+    assert character_manager.save_character(char, directory) == True
+    assert os.path.exists(os.path.join(directory, "saves.db"))
+    loaded = character_manager.load_character("SqlHero", directory)
+
+    assert loaded == char
+    loaded['gold'] = 7
+    character_manager.save_character(loaded, directory, delta=True)
+    assert character_manager.load_character("SqlHero", directory)['gold'] == 7
+    assert character_manager.list_saved_characters(directory) == ["SqlHero"]
+    character_manager.delete_character("SqlHero", directory)
+    with pytest.raises(CharacterNotFoundError):
+        character_manager.load_character("SqlHero", directory)
+
+def test_sqlite_group_commit(tmp_path, sqlite_backend):
+    """Test that saves in a group commit share one transaction"""
+    directory = str(tmp_path)
+
+    with character_manager.group_commit():
+        for name in ["Ann", "Ben"]:
+            character_manager.save_character(character_manager.create_character(name, "Rogue"), directory)
+        assert sqlite_backend._connect(directory).in_transaction
+
+    assert not sqlite_backend._connect(directory).in_transaction
+    assert character_manager.list_saved_characters(directory) == ["Ann", "Ben"]
+
+def test_sqlite_backend_paged_listing(tmp_path, sqlite_backend):
+    """Test listing one page of characters at a time"""
+    directory = str(tmp_path)
+    for level, name in enumerate(["Cara", "Abe", "Dot", "Bo"], 1):
+        char = character_manager.create_character(name, "Mage")
+        char['level'] = level
+        character_manager.save_character(char, directory)
+
+    assert character_manager.list_saved_characters(directory, offset=1, limit=2) == ["Bo", "Cara"]
+    assert character_manager.list_saved_characters(directory, offset=3) == ["Dot"]
+    assert character_manager.list_saved_characters(directory, limit=2, sort_by="level", descending=True) == ["Bo", "Dot"]
+
+# ============================================================================
+# SHARDED LAYOUT TESTS
+# ============================================================================
+
+def test_sharded_backend_nests_saves(tmp_path):
+    """Test that sharded saves go two hashed directories down"""
+    directory = str(tmp_path)
+    backend = character_manager.FileSaveBackend(sharded=True)
+    char = make_veteran()
+
+    backend.save(char, directory)
+    char['gold'] = 3
+    backend.save_delta(char, directory)
+
+    shard = backend.shard_directory("Veteran", directory)
+    assert os.path.relpath(shard, directory).count(os.sep) == 1
+    assert sorted(os.listdir(shard)) == ["Veteran_save.journal", "Veteran_save.txt"]
+    assert character_manager.FileSaveBackend().load("Veteran", directory) == char
+    assert list(backend.iter_names(directory)) == ["Veteran"]
+
+def test_migrate_flat_directory_to_sharded(tmp_path):
+    """Test moving flat saves (with and without a journal) into shards"""
+    directory = str(tmp_path)
+    backend = character_manager.FileSaveBackend()
+    plain = make_veteran("Plain")
+    journaled = make_veteran("Journaled")
+    backend.save(plain, directory)
+    backend.save(journaled, directory)
+    journaled['gold'] = 12
+    backend.save_delta(journaled, directory)
+    progress = []
+
+    moved = backend.migrate_to_sharded(directory, lambda count, name: progress.append(name))
+
+    assert moved == 2 and sorted(progress) == ["Journaled", "Plain"]
+    assert not any(name.endswith(("_save.txt", "_save.journal")) for name in os.listdir(directory))
+    assert backend.load("Plain", directory) == plain
+    assert backend.load("Journaled", directory) == journaled
+    assert backend.path("Journaled", directory).startswith(backend.shard_directory("Journaled", directory))
+    assert not os.path.exists(backend.journal_path("Journaled", directory))
+
+def test_load_during_migration_finds_moved_save(tmp_path, monkeypatch):
+    """Test loads that race with a character being moved into its shard"""
+    directory = str(tmp_path)
+    backend = character_manager.FileSaveBackend()
+    plain = make_veteran("Plain")
+    journaled = make_veteran("Journaled")
+    backend.save(plain, directory)
+    backend.save(journaled, directory)
+    journaled['gold'] = 12
+    backend.save_delta(journaled, directory)
+    open(os.path.join(directory, backend.SHARD_MARKER), 'a').close()
+    real_locate = backend._locate
+    real_replay = backend._replay_journal
+    migrating = []
+
+    def locate_then_migrate(name, save_directory):
+        found = real_locate(name, save_directory)
+        if name == "Plain" and not migrating:
+            migrating.append(name)
+            backend._migrate_one(name, save_directory)
+        return found
+
+    def migrate_then_replay(character, journal):
+        if character['name'] == "Journaled" and not migrating:
+            migrating.append(character['name'])
+            backend._migrate_one("Journaled", directory)
+        real_replay(character, journal)
+
+    monkeypatch.setattr(backend, "_locate", locate_then_migrate)
+    assert backend.load("Plain", directory) == plain
+    migrating.clear()
+    monkeypatch.setattr(backend, "_replay_journal", migrate_then_replay)
+    assert backend.load("Journaled", directory) == journaled
+    assert migrating == ["Journaled"]
+
+def test_migration_skips_save_deleted_meanwhile(tmp_path, monkeypatch):
+    """Test that a save deleted after the scan does not stop the migration"""
+    directory = str(tmp_path)
+    backend = character_manager.FileSaveBackend()
+    for name in ["Gone", "Kept", "Other"]:
+        backend.save(make_veteran(name), directory)
+    real_migrate = backend._migrate_one
+
+    def delete_then_migrate(name, save_directory):
+        if name == "Gone":
+            os.remove(os.path.join(save_directory, "Gone_save.txt"))
+        return real_migrate(name, save_directory)
+
+    monkeypatch.setattr(backend, "_migrate_one", delete_then_migrate)
+    assert backend.migrate_to_sharded(directory) == 2
+    assert sorted(backend.iter_names(directory)) == ["Kept", "Other"]
+
+def test_sharded_directory_still_reads_unmigrated_saves(tmp_path):
+    """Test that flat saves stay reachable once the directory is marked sharded"""
+    directory = str(tmp_path)
+    flat = character_manager.FileSaveBackend()
+    flat.save(make_veteran("Old"), directory)
+    open(os.path.join(directory, flat.SHARD_MARKER), "w").close()
+
+    flat.save(make_veteran("New"), directory)
+
+    assert os.path.exists(os.path.join(directory, "Old_save.txt"))
+    assert not os.path.exists(os.path.join(directory, "New_save.txt"))
+    assert sorted(flat.list(directory)) == ["New", "Old"]
+    assert flat.load("Old", directory)['name'] == "Old"
+    assert len(flat.list(directory, offset=1, limit=5)) == 1
+
+# ============================================================================
+# SAVE MANIFEST TESTS
+# ============================================================================
+
+def save_party(backend, directory):
+    for name, level, gold in [("Cara", 3, 10), ("Abe", 7, 50), ("Dot", 1, 30)]:
+        char = character_manager.create_character(name, "Mage")
+        char['level'] = level
+        char['gold'] = gold
+        backend.save(char, directory)
+
+def test_manifest_serves_sorted_pages(tmp_path, monkeypatch):
+    """Test listing, sorting and summaries come from the manifest alone"""
+    directory = str(tmp_path)
+    backend = character_manager.FileSaveBackend()
+    save_party(backend, directory)
+
+    def fail(*args):
+        raise AssertionError("a save file was read")
+    monkeypatch.setattr(character_manager, "decode_save_data", fail)
+
+    assert backend.list(directory) == ["Cara", "Abe", "Dot"]
+    assert backend.list(directory, sort_by="level", descending=True) == ["Abe", "Cara", "Dot"]
+    assert backend.list(directory, offset=1, limit=1, sort_by="name") == ["Cara"]
+    summary = backend.summaries(directory, limit=1, sort_by="gold")[0]
+    assert summary['name'] == "Cara" and summary['level'] == 3 and summary['mtime'] > 0
+    with pytest.raises(ValueError):
+        backend.list(directory, sort_by="strength")
+
+def test_manifest_follows_delta_saves_and_deletes(tmp_path):
+    """Test that journal saves and deletes update the manifest"""
+    directory = str(tmp_path)
+    backend = character_manager.FileSaveBackend()
+    save_party(backend, directory)
+    char = backend.load("Dot", directory)
+    char['level'] = 9
+
+    backend.save_delta(char, directory)
+    backend.delete("Abe", directory)
+
+    assert backend.list(directory, sort_by="level", descending=True) == ["Dot", "Cara"]
+    reopened = character_manager.FileSaveBackend()
+    assert reopened.list(directory, sort_by="level", descending=True) == ["Dot", "Cara"]
+
+def test_manifest_rebuilds_when_missing_or_stale(tmp_path):
+    """Test that a lost or outdated manifest is rebuilt from the saves"""
+    directory = str(tmp_path)
+    save_party(character_manager.FileSaveBackend(), directory)
+    os.remove(os.path.join(directory, character_manager.SaveManifest.FILENAME))
+
+    assert sorted(character_manager.FileSaveBackend().list(directory)) == ["Abe", "Cara", "Dot"]
+
+    character_manager.FileSaveBackend(manifest=False).save(
+        character_manager.create_character("Eve", "Rogue"), directory)
+    os.remove(os.path.join(directory, "Abe_save.txt"))
+
+    assert sorted(character_manager.FileSaveBackend().list(directory)) == ["Cara", "Dot", "Eve"]
+
+def test_manifest_refreshes_saves_rewritten_in_place(tmp_path, monkeypatch):
+    """Test that a paged listing re-reads a save edited behind the manifest's back"""
+    directory = str(tmp_path)
+    backend = character_manager.FileSaveBackend(sharded=True)
+    save_party(backend, directory)
+    path = backend.path("Dot", directory)
+    with open(path, encoding="utf-8") as file:
+        text = file.read()
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(text.replace("LEVEL: 1\n", "LEVEL: 9\n"))
+    info = os.stat(path)
+    os.utime(path, ns=(info.st_atime_ns, info.st_mtime_ns + 10 ** 9))
+
+    reopened = character_manager.FileSaveBackend()
+    def fail(*args):
+        raise AssertionError("an unpaged listing touched a save file")
+    monkeypatch.setattr(reopened, "stamp", fail)
+    assert reopened.list(directory, sort_by="level", descending=True) == ["Abe", "Cara", "Dot"]
+    monkeypatch.undo()
+
+    summaries = reopened.summaries(directory, limit=3, sort_by="level", descending=True)
+    assert [summary['name'] for summary in summaries] == ["Dot", "Abe", "Cara"]
+    assert summaries[0]['level'] == 9
+    assert reopened.list(directory, limit=1, sort_by="level", descending=True) == ["Dot"]
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
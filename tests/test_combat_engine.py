@@ -0,0 +1,264 @@
+"""
+Test Combat Engine
+Tests the headless battle engine, policies and special abilities
+"""
+
+import pytest
+import random
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom_exceptions import AbilityOnCooldownError, CharacterDeadError, InvalidTargetError
+import character_manager
+import combat_system
+
+class ScriptedPolicy:
+    def __init__(self, actions):
+        self.actions = list(actions)
+
+    def choose_action(self, engine):
+        return self.actions.pop(0) if self.actions else "attack"
+
+# ============================================================================
+# BATTLE ENGINE TESTS
+# ============================================================================
+
+def test_attack_policy_battle_is_deterministic():
+    """Test a basic-attack battle against a goblin"""
+    char = character_manager.create_character("Engine", "Warrior")
+    enemy = combat_system.create_enemy("goblin")
+    engine = combat_system.BattleEngine(char, enemy, combat_system.AttackPolicy())
+
+    result = engine.run()
+
+    # Warrior hits for 15 - 8 // 4 = 13, goblin for 8 - 15 // 4 = 5
+    assert result['winner'] == 'player'
+    assert result['turns'] == 4
+    assert result['character_health'] == 120 - 3 * 5
+    assert result['xp_gained'] == 25 and result['gold_gained'] == 10
+    assert [event['type'] for event in engine.events][:3] == ['battle_start', 'attack', 'attack']
+    assert engine.events[-1] == {'type': 'battle_end', 'turn': 4, 'winner': 'player',
+                                 'message': "Battle over after 4 turns: player"}
+
+def test_escape_uses_engine_rng():
+    """Test that a seeded rng makes escapes reproducible"""
+    outcomes = []
+    for _ in range(2):
+        char = character_manager.create_character("Runner", "Rogue")
+        engine = combat_system.BattleEngine(char, combat_system.create_enemy("dragon"),
+                                            ScriptedPolicy(["flee"] * 10), rng=random.Random(7))
+        outcomes.append(engine.run())
+
+    assert outcomes[0] == outcomes[1]
+    assert outcomes[0]['escaped'] and outcomes[0]['winner'] == 'enemy'
+
+def test_dead_character_cannot_fight():
+    """Test that a battle will not start at 0 health"""
+    char = character_manager.create_character("Fallen", "Mage")
+    char['health'] = 0
+
+    with pytest.raises(CharacterDeadError):
+        combat_system.BattleEngine(char, combat_system.create_enemy("orc"), combat_system.AttackPolicy()).run()
+
+def test_stalemate_ends_in_draw():
+    """Test that max_turns stops a battle nobody can win"""
+    char = character_manager.create_character("Healer", "Cleric")
+    enemy = combat_system.create_enemy("goblin")
+    enemy['strength'] = 0
+    char['strength'] = 0
+    enemy['health'] = 10 ** 6
+
+    result = combat_system.BattleEngine(char, enemy, combat_system.AttackPolicy(),
+                                        record_events=False, max_turns=50).run()
+
+    assert result['winner'] == 'draw' and result['turns'] == 50
+
+# ============================================================================
+# SPECIAL ABILITY TESTS
+# ============================================================================
+
+def test_abilities_damage_the_enemy():
+    """Test that offensive abilities reduce enemy health"""
+    warrior = character_manager.create_character("Strong", "Warrior")
+    enemy = combat_system.create_enemy("orc")
+
+    combat_system.use_special_ability(warrior, enemy)
+
+    assert enemy['health'] == 80 - (15 * 2 - 12 // 4)
+
+def test_ability_cooldown():
+    """Test that an ability is unavailable until its cooldown has passed"""
+    mage = character_manager.create_character("Caster", "Mage")
+    enemy = combat_system.create_enemy("dragon")
+    combat_system.use_special_ability(mage, enemy)
+
+    with pytest.raises(AbilityOnCooldownError):
+        combat_system.use_special_ability(mage, enemy)
+    for _ in range(combat_system.ABILITY_COOLDOWN):
+        combat_system.tick_ability_cooldown(mage)
+    combat_system.use_special_ability(mage, enemy)
+
+def test_ability_policy_events():
+    """Test ability and cooldown events in an engine battle"""
+    char = character_manager.create_character("Caster", "Mage")
+    engine = combat_system.BattleEngine(char, combat_system.create_enemy("dragon"),
+                                        ScriptedPolicy(["ability", "ability"]))
+
+    engine.run()
+
+    assert engine.events[1]['type'] == 'ability' and engine.events[1]['damage'] == 20 * 2 - 15 // 4
+    assert engine.events[3]['type'] == 'cooldown'
+    assert 'ability_cooldown' not in char
+
+def test_rogue_miss_still_reports():
+    """Test that a missed critical strike returns a message"""
+    class AlwaysMiss:
+        def random(self):
+            return 0.9
+
+    rogue = character_manager.create_character("Sneak", "Rogue")
+    enemy = combat_system.create_enemy("goblin")
+
+    assert "misses" in combat_system.rogue_critical_strike(rogue, enemy, AlwaysMiss())
+    assert enemy['health'] == 50
+
+# ============================================================================
+# AUTO-RESOLVE TESTS
+# ============================================================================
+
+@pytest.mark.parametrize("character_class", ["Warrior", "Mage", "Rogue", "Cleric"])
+def test_auto_resolve_matches_engine(character_class):
+    """Test the closed form against simulated attack-only battles"""
+    for level in range(1, 51, 7):
+        for enemy_type in ["goblin", "orc", "dragon"]:
+            template = character_manager.create_character_at_level("Fast", character_class, level)
+            simulated_char, fast_char = dict(template), dict(template)
+            simulated_enemy, fast_enemy = combat_system.create_enemy(enemy_type), combat_system.create_enemy(enemy_type)
+
+            expected = combat_system.BattleEngine(simulated_char, simulated_enemy,
+                                                  combat_system.AttackPolicy(), record_events=False).run()
+
+            assert combat_system.auto_resolve(fast_char, fast_enemy) == expected
+            assert fast_char['health'] == simulated_char['health']
+            assert fast_enemy['health'] == simulated_enemy['health']
+
+def test_auto_resolve_draw_and_edge_cases():
+    """Test max_turns draws, an already-beaten enemy and a dead character"""
+    char = character_manager.create_character("Edge", "Cleric")
+    enemy = combat_system.create_enemy("dragon")
+    enemy['strength'] = 0
+    enemy['health'] = 10 ** 6
+    expected = combat_system.BattleEngine(dict(char), dict(enemy), combat_system.AttackPolicy(),
+                                          max_turns=40).run()
+    assert combat_system.auto_resolve(dict(char), dict(enemy), max_turns=40) == expected
+
+    beaten = combat_system.create_enemy("goblin")
+    beaten['health'] = 0
+    result = combat_system.auto_resolve(dict(char), beaten)
+    assert result['turns'] == 1 and result['character_health'] == char['health']
+
+    char['health'] = 0
+    with pytest.raises(CharacterDeadError):
+        combat_system.auto_resolve(char, combat_system.create_enemy("orc"))
+
+def test_resolve_battle_only_simulates_random_policies(monkeypatch):
+    """Test that resolve_battle skips the engine for attack-only fights"""
+    def fail(*args, **kwargs):
+        raise AssertionError("simulated a deterministic battle")
+    char = character_manager.create_character("Router", "Rogue")
+    monkeypatch.setattr(combat_system.BattleEngine, "run", fail)
+
+    result = combat_system.resolve_battle(dict(char), combat_system.create_enemy("goblin"))
+
+    assert result['winner'] == 'player'
+    with pytest.raises(AssertionError):
+        combat_system.resolve_battle(dict(char), combat_system.create_enemy("goblin"), combat_system.RandomPolicy())
+
+# ============================================================================
+# ENEMY TEMPLATE TESTS
+# ============================================================================
+
+ENEMY_TEXT = """ENEMY_ID: rat
+NAME: Rat
+HEALTH: 10
+STRENGTH: 2
+MAGIC: 0
+XP_REWARD: 5
+GOLD_REWARD: 1
+MIN_LEVEL: 2
+
+ENEMY_ID: wolf
+NAME: Wolf
+HEALTH: 30
+STRENGTH: 6
+MAGIC: 0
+XP_REWARD: 15
+GOLD_REWARD: 5
+MIN_LEVEL: 4
+
+ENEMY_ID: bear
+NAME: Bear
+HEALTH: 60
+STRENGTH: 9
+MAGIC: 0
+XP_REWARD: 30
+GOLD_REWARD: 8
+MIN_LEVEL: 4
+"""
+
+def test_spawned_enemies_are_independent_copies():
+    """Test that create_enemy copies a frozen template"""
+    first = combat_system.create_enemy("dragon")
+    first['health'] = 0
+
+    second = combat_system.create_enemy("dragon")
+    assert second['health'] == second['max_health'] == 200
+    assert second is not first
+    templates = combat_system.load_enemy_templates()
+    with pytest.raises(TypeError):
+        templates['dragon']['health'] = 1
+
+def test_level_table_matches_min_levels(tmp_path, monkeypatch):
+    """Test level lookup, including levels outside the table and shared tiers"""
+    monkeypatch.setattr(combat_system, "_enemy_templates", None)
+    monkeypatch.setattr(combat_system, "_enemy_level_table", ())
+    path = tmp_path / "enemies.txt"
+    path.write_text(ENEMY_TEXT)
+    combat_system.load_enemy_templates(str(path))
+
+    assert [combat_system.get_random_enemy_for_level(level)['name'] for level in range(0, 4)] == ["Rat"] * 4
+    rng = random.Random(3)
+    names = {combat_system.get_random_enemy_for_level(level, rng)['name'] for level in range(4, 40)}
+    assert names == {"Wolf", "Bear"}
+    with pytest.raises(InvalidTargetError):
+        combat_system.create_enemy("goblin")
+
+def test_enemy_templates_load_from_any_directory(tmp_path, monkeypatch):
+    """Test that the default enemy file does not depend on the working directory"""
+    monkeypatch.setattr(combat_system, "_enemy_templates", None)
+    monkeypatch.chdir(tmp_path)
+
+    assert combat_system.create_enemy("goblin")['name'] == "Goblin"
+    assert combat_system.get_enemy_types() == ["goblin", "orc", "dragon"]
+
+# ============================================================================
+# INTERACTIVE WRAPPER TESTS
+# ============================================================================
+
+def test_simple_battle_reads_input(monkeypatch, capsys):
+    """Test that SimpleBattle drives the engine from keyboard input"""
+    char = character_manager.create_character("Typist", "Warrior")
+    answers = iter(["x", "1", "1", "1", "1"])
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+
+    result = combat_system.SimpleBattle(char, combat_system.create_enemy("goblin")).start_battle()
+
+    assert result['winner'] == 'player'
+    output = capsys.readouterr().out
+    assert "Invalid choice." in output
+    assert ">>> Typist attacks Goblin for 13 damage!" in output
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
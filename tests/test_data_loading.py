@@ -0,0 +1,222 @@
+"""
+Test Data Loading
+Tests the streaming parsers and loaders in game_data
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom_exceptions import InvalidDataFormatError, MissingDataFileError
+import game_data
+import inventory_system
+
+QUEST_TEXT = """QUEST_ID: first
+TITLE: First
+DESCRIPTION: The first quest
+REWARD_XP: 50
+REWARD_GOLD: 25
+REQUIRED_LEVEL: 1
+PREREQUISITE: NONE
+
+QUEST_ID: second
+TITLE: Second
+DESCRIPTION: The second quest
+REWARD_XP: 100
+REWARD_GOLD: 50
+REQUIRED_LEVEL: 2
+PREREQUISITE: first
+"""
+
+def write_file(tmp_path, name, text):
+    path = tmp_path / name
+    path.write_text(text)
+    return str(path)
+
+# ============================================================================
+# STREAMING PARSER TESTS
+# ============================================================================
+
+def test_iter_quests_yields_records_in_order(tmp_path):
+    """Test that iter_quests streams validated quests in file order"""
+    path = write_file(tmp_path, "quests.txt", QUEST_TEXT)
+    stream = game_data.iter_quests(path)
+
+    first = next(stream)
+    assert first['quest_id'] == 'first'
+    assert first['reward_xp'] == 50
+    assert [quest['quest_id'] for quest in stream] == ['second']
+
+def test_iter_items_matches_load_items():
+    """Test that load_items is built on the same records as iter_items"""
+    items = game_data.load_items("data/items.txt")
+    streamed = list(game_data.iter_items("data/items.txt"))
+
+    assert list(items) == [item['item_id'] for item in streamed]
+    assert items['health_potion']['cost'] == 25
+
+def test_parse_error_reports_line_number(tmp_path):
+    """Test that bad numeric values are reported with their line number"""
+    path = write_file(tmp_path, "quests.txt", QUEST_TEXT.replace("REWARD_XP: 100", "REWARD_XP: lots"))
+
+    with pytest.raises(InvalidDataFormatError, match="line 12"):
+        game_data.load_quests(path)
+
+def test_duplicate_ids_rejected(tmp_path):
+    """Test that a quest id defined twice is an error"""
+    path = write_file(tmp_path, "quests.txt", QUEST_TEXT.replace("QUEST_ID: second", "QUEST_ID: first"))
+
+    with pytest.raises(InvalidDataFormatError, match="duplicate"):
+        game_data.load_quests(path)
+
+def test_iter_missing_file_raises_on_first_read():
+    """Test that the generator raises MissingDataFileError when consumed"""
+    stream = game_data.iter_quests("nonexistent_file.txt")
+
+    with pytest.raises(MissingDataFileError):
+        next(stream)
+
+# ============================================================================
+# COMPILED CACHE TESTS
+# ============================================================================
+
+def test_cache_is_written_and_reused(tmp_path, monkeypatch):
+    """Test that a warm load reads the cache instead of parsing"""
+    path = write_file(tmp_path, "quests.txt", QUEST_TEXT)
+    quests = game_data.load_quests(path, use_cache=True)
+    assert os.path.exists(path + game_data.CACHE_SUFFIX)
+
+    def fail(*args):
+        raise AssertionError("source was re-parsed")
+    monkeypatch.setattr(game_data, "iter_quests", fail)
+
+    assert game_data.load_quests(path, use_cache=True) == quests
+
+def test_cache_rebuilt_when_source_changes(tmp_path):
+    """Test that editing the source invalidates the cache"""
+    path = write_file(tmp_path, "quests.txt", QUEST_TEXT)
+    game_data.load_quests(path, use_cache=True)
+
+    with open(path, "a") as f:
+        f.write("\nQUEST_ID: third\nTITLE: Third\nDESCRIPTION: More\nREWARD_XP: 1\n"
+                "REWARD_GOLD: 1\nREQUIRED_LEVEL: 3\nPREREQUISITE: second\n")
+
+    assert 'third' in game_data.load_quests(path, use_cache=True)
+
+def test_cache_not_stamped_with_file_edited_during_parse(tmp_path):
+    """Test that data parsed before an edit is not cached as the edited file"""
+    path = write_file(tmp_path, "quests.txt", QUEST_TEXT)
+
+    def parse_then_edit(filename):
+        quests = game_data.load_quests(filename)
+        with open(filename, "a") as f:
+            f.write("\nQUEST_ID: third\nTITLE: Third\nDESCRIPTION: More\nREWARD_XP: 1\n"
+                    "REWARD_GOLD: 1\nREQUIRED_LEVEL: 3\nPREREQUISITE: second\n")
+        return quests
+
+    assert 'third' not in game_data.load_cached(path, "quests", parse_then_edit)
+    assert 'third' in game_data.load_quests(path, use_cache=True)
+
+# ============================================================================
+# MULTI-FILE LOADING TESTS
+# ============================================================================
+
+def test_load_quests_from_directory(tmp_path):
+    """Test that a directory of quest files is parsed in parallel and merged"""
+    second, third = QUEST_TEXT.split("\n\n")
+    write_file(tmp_path, "a_region.txt", second)
+    write_file(tmp_path, "b_region.txt", third)
+    timings = []
+
+    quests = game_data.load_quests(str(tmp_path), max_workers=2, timings=timings)
+
+    assert list(quests) == ['first', 'second']
+    assert [os.path.basename(path) for path, count, seconds in timings] == ['a_region.txt', 'b_region.txt']
+
+def test_duplicate_ids_across_files(tmp_path):
+    """Test that duplicates across files name both files"""
+    write_file(tmp_path, "a.txt", QUEST_TEXT)
+    write_file(tmp_path, "b.txt", QUEST_TEXT)
+
+    with pytest.raises(InvalidDataFormatError, match="a.txt and .*b.txt"):
+        game_data.load_quests(str(tmp_path / "*.txt"), max_workers=1)
+
+# ============================================================================
+# ITEM CATALOG TESTS
+# ============================================================================
+
+def test_item_catalog_matches_load_items():
+    """Test that the lazy catalog exposes the same items as load_items"""
+    items = game_data.load_items("data/items.txt")
+
+    with game_data.ItemCatalog("data/items.txt") as catalog:
+        assert list(catalog) == list(items)
+        assert len(catalog) == len(items)
+        assert 'missing_item' not in catalog
+        assert catalog['steel_armor'] == items['steel_armor']
+
+def test_item_catalog_uses_block_boundaries(tmp_path):
+    """Test that the catalog finds blocks whose ITEM_ID is not the first line"""
+    text = ("ITEM_ID: a\nNAME: A\nTYPE: weapon\nEFFECT: strength:1\nCOST: 1\nDESCRIPTION: first\n\n"
+            "NAME: B\nITEM_ID: b\nTYPE: armor\nEFFECT: max_health:2\nCOST: 2\nDESCRIPTION: second\n")
+    path = write_file(tmp_path, "items.txt", text)
+    items = game_data.load_items(path)
+
+    with game_data.ItemCatalog(path) as catalog:
+        assert list(catalog) == ['a', 'b']
+        assert catalog['a'] == items['a']
+        assert catalog['b'] == items['b']
+
+def test_item_catalog_decodes_on_lookup():
+    """Test that records are only parsed when looked up"""
+    with game_data.ItemCatalog("data/items.txt") as catalog:
+        assert catalog._decoded == {}
+        catalog['iron_sword']
+        assert list(catalog._decoded) == ['iron_sword']
+
+def test_inventory_accepts_item_catalog():
+    """Test that purchase_item and use_item take the catalog as item data"""
+    char = {'inventory': [], 'gold': 100, 'health': 50, 'max_health': 100}
+
+    with game_data.ItemCatalog("data/items.txt") as catalog:
+        inventory_system.purchase_item(char, 'health_potion', catalog)
+        inventory_system.use_item(char, 'health_potion', catalog)
+
+    assert char['gold'] == 75
+    assert char['health'] == 70
+
+def test_inventory_detects_catalog_by_type(tmp_path):
+    """Test that only an ItemCatalog is looked up, even with an item named 'cost'"""
+    text = "ITEM_ID: cost\nNAME: Coin\nTYPE: consumable\nEFFECT: health:5\nCOST: 4\nDESCRIPTION: A coin\n"
+    char = {'inventory': [], 'gold': 10, 'health': 50, 'max_health': 100}
+
+    with game_data.ItemCatalog(write_file(tmp_path, "items.txt", text)) as catalog:
+        inventory_system.purchase_item(char, 'cost', catalog)
+    assert char['gold'] == 6
+
+    record = {'name': 'Odd', 'type': 'consumable', 'effect': 'health:1', 'cost': 2}
+    inventory_system.purchase_item(char, 'name', record)
+    assert char['gold'] == 4
+
+def test_load_enemies_matches_defaults():
+    """Test that data/enemies.txt holds the default enemy stats"""
+    enemies = game_data.load_enemies("data/enemies.txt")
+
+    assert list(enemies) == ['goblin', 'orc', 'dragon']
+    assert enemies['orc']['health'] == 80
+    assert enemies['dragon']['min_level'] == 6
+
+def test_enemy_with_bad_stats_rejected(tmp_path):
+    """Test that enemies need numeric stats and a level of at least 1"""
+    text = game_data.DEFAULT_ENEMIES.replace("MIN_LEVEL: 1", "MIN_LEVEL: 0")
+    with pytest.raises(InvalidDataFormatError, match="min_level"):
+        game_data.load_enemies(write_file(tmp_path, "enemies.txt", text))
+
+    text = game_data.DEFAULT_ENEMIES.replace("HEALTH: 80", "HEALTH: lots")
+    with pytest.raises(InvalidDataFormatError, match="line 12"):
+        game_data.load_enemies(write_file(tmp_path, "enemies.txt", text))
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,115 @@
+"""
+Test Main Menus
+Tests the menus and game actions in main.py with scripted keyboard input
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import character_manager
+import game_data
+import main
+
+@pytest.fixture
+def game(tmp_path, monkeypatch):
+    """A loaded game whose saves go to tmp_path"""
+    monkeypatch.setattr(main, "all_quests", game_data.load_quests("data/quests.txt"))
+    monkeypatch.setattr(main, "all_items", game_data.load_items("data/items.txt"))
+    monkeypatch.setattr(main, "current_character", character_manager.create_character("Hero", "Warrior"))
+    monkeypatch.setattr(main, "game_running", True)
+    queue = character_manager.SaveQueue(str(tmp_path))
+    monkeypatch.setattr(main, "save_queue", queue)
+    yield tmp_path
+    queue.close()
+
+def type_input(monkeypatch, *answers):
+    answers = iter(answers)
+    monkeypatch.setattr("builtins.input", lambda prompt="": next(answers))
+
+# ============================================================================
+# MENU INPUT TESTS
+# ============================================================================
+
+def test_menu_choice_rejects_bad_input(monkeypatch, capsys):
+    """Test that get_menu_choice only accepts numbers in range"""
+    type_input(monkeypatch, "2", "7", "x")
+
+    assert main.get_menu_choice("> ", 3) == 2
+    assert main.get_menu_choice("> ", 3) is None
+    assert main.get_menu_choice("> ", 3) is None
+    assert capsys.readouterr().out.count("Please enter a number from 1 to 3.") == 2
+
+def test_game_loop_reports_bad_choice_once_and_saves(game, monkeypatch, capsys):
+    """Test one message per invalid choice, and a save on quit"""
+    type_input(monkeypatch, "9", "1", "6")
+    main.current_character['gold'] = 321
+
+    main.game_loop()
+
+    output = capsys.readouterr().out
+    assert output.count("Please enter a number from 1 to 6.") == 1
+    assert "Invalid choice" not in output
+    assert "=== Hero the Warrior ===" in output
+    assert character_manager.load_character("Hero", str(game))['gold'] == 321
+
+def test_new_game_rejects_unknown_class(monkeypatch, capsys):
+    """Test that an invalid class is reported without starting a game"""
+    type_input(monkeypatch, "Nobody", "bard")
+
+    main.new_game()
+
+    assert "Could not create character" in capsys.readouterr().out
+
+# ============================================================================
+# GAME ACTION TESTS
+# ============================================================================
+
+def test_shop_buys_item(game, monkeypatch):
+    """Test buying an item through the shop menu"""
+    type_input(monkeypatch, "1", "health_potion")
+
+    main.shop()
+
+    assert main.current_character['gold'] == 75
+    assert 'health_potion' in main.current_character['inventory']
+
+def test_quest_menu_accepts_quest(game, monkeypatch, capsys):
+    """Test accepting a quest, and that quest errors are reported"""
+    type_input(monkeypatch, "4", "first_steps", "4", "goblin_hunter")
+
+    main.quest_menu()
+    main.quest_menu()
+
+    assert main.current_character['active_quests'] == ['first_steps']
+    assert "Cannot do that" in capsys.readouterr().out
+
+def test_explore_awards_victory(game, monkeypatch, capsys):
+    """Test that winning a battle grants its XP and gold"""
+    type_input(monkeypatch, *["1"] * 20)
+
+    main.explore()
+
+    assert "Victory!" in capsys.readouterr().out
+    assert main.current_character['experience'] == 25
+    assert main.current_character['gold'] == 110
+
+def test_death_revives_for_gold_or_ends_game(game, monkeypatch):
+    """Test paying to revive, and quitting when the player cannot pay"""
+    character = main.current_character
+    character['health'] = 0
+    type_input(monkeypatch, "1", "1")
+
+    main.handle_character_death()
+    assert character['health'] == character['max_health'] // 2
+    assert character['gold'] == 100 - main.REVIVE_COST and main.game_running
+
+    character['health'] = 0
+    character['gold'] = 0
+    main.handle_character_death()
+    assert not main.game_running
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,196 @@
+"""
+Test Quest Indexes
+Tests the prerequisite graph and lookup indexes in quest_handler
+"""
+
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from custom_exceptions import QuestNotFoundError, QuestRequirementsNotMetError
+import character_manager
+import quest_handler
+
+def make_quest(quest_id, required_level=1, prerequisite='NONE'):
+    return {
+        'quest_id': quest_id,
+        'title': quest_id.title(),
+        'description': 'Test quest',
+        'reward_xp': 10,
+        'reward_gold': 5,
+        'required_level': required_level,
+        'prerequisite': prerequisite
+    }
+
+def make_catalog():
+    quests = [
+        make_quest('a'),
+        make_quest('b', 1, 'a'),
+        make_quest('c', 3, 'b'),
+        make_quest('d', 2, 'a'),
+        make_quest('e', 5),
+    ]
+    return {quest['quest_id']: quest for quest in quests}
+
+# ============================================================================
+# PREREQUISITE GRAPH TESTS
+# ============================================================================
+
+def test_quest_graph_structure():
+    """Test roots, children, depth and topological order"""
+    graph = quest_handler.QuestGraph(make_catalog())
+
+    assert graph.roots == ['a', 'e']
+    assert graph.children['a'] == ['b', 'd']
+    assert graph.depth['c'] == 2
+    order = graph.topological_order
+    assert order.index('a') < order.index('b') < order.index('c')
+
+def test_prerequisite_chain():
+    """Test that the chain runs from the earliest prerequisite to the quest"""
+    quests = make_catalog()
+
+    assert quest_handler.get_quest_prerequisite_chain('c', quests) == ['a', 'b', 'c']
+    assert quest_handler.get_quest_prerequisite_chain('e', quests) == ['e']
+    with pytest.raises(QuestNotFoundError):
+        quest_handler.get_quest_prerequisite_chain('zzz', quests)
+
+def test_graph_is_built_once_per_catalog():
+    """Test that repeated calls reuse the same graph"""
+    quests = make_catalog()
+
+    assert quest_handler.get_quest_graph(quests) is quest_handler.get_quest_graph(quests)
+
+def test_cycle_detection():
+    """Test that circular prerequisites are reported"""
+    quests = make_catalog()
+    quests['a']['prerequisite'] = 'c'
+
+    with pytest.raises(QuestRequirementsNotMetError):
+        quest_handler.validate_quest_prerequisites(quests)
+    with pytest.raises(QuestRequirementsNotMetError):
+        quest_handler.get_quest_prerequisite_chain('b', quests)
+
+def test_missing_prerequisite_detected():
+    """Test that an unknown prerequisite fails validation"""
+    quests = make_catalog()
+    quests['f'] = make_quest('f', 1, 'nowhere')
+
+    with pytest.raises(QuestNotFoundError):
+        quest_handler.validate_quest_prerequisites(quests)
+
+def test_available_quests_follow_graph():
+    """Test that only quests with satisfied prerequisites are available"""
+    quests = make_catalog()
+    char = character_manager.create_character("GraphTest", "Warrior")
+    char['level'] = 2
+
+    available = quest_handler.get_available_quests(char, quests)
+    assert [quest['quest_id'] for quest in available] == ['a']
+
+    char['completed_quests'].append('a')
+    available = quest_handler.get_available_quests(char, quests)
+    assert [quest['quest_id'] for quest in available] == ['b', 'd']
+
+# ============================================================================
+# LEVEL INDEX TESTS
+# ============================================================================
+
+def test_get_quests_by_level_uses_range():
+    """Test inclusive level range queries ordered by level"""
+    quests = make_catalog()
+
+    in_range = quest_handler.get_quests_by_level(quests, 2, 5)
+
+    assert [quest['quest_id'] for quest in in_range] == ['d', 'c', 'e']
+    assert quest_handler.get_quests_by_level(quests, 6, 10) == []
+
+def test_available_root_quests_follow_level_index():
+    """Test that root quests become available as the character levels"""
+    quests = make_catalog()
+    char = character_manager.create_character("RootTest", "Warrior")
+    assert [q['quest_id'] for q in quest_handler.get_available_quests(char, quests)] == ['a']
+
+    char['level'] = 5
+
+    assert [q['quest_id'] for q in quest_handler.get_available_quests(char, quests)] == ['a', 'e']
+
+# ============================================================================
+# INCREMENTAL AVAILABILITY TESTS
+# ============================================================================
+
+def available_ids(char, quests):
+    return [quest['quest_id'] for quest in quest_handler.get_available_quests(char, quests)]
+
+def test_availability_updates_through_quest_events():
+    """Test accept, complete and abandon update the index in place"""
+    quests = make_catalog()
+    char = character_manager.create_character("EventTest", "Mage")
+    char['level'] = 2
+    assert available_ids(char, quests) == ['a']
+    availability = char.quest_availability
+
+    quest_handler.accept_quest(char, 'a', quests)
+    assert available_ids(char, quests) == []
+    quest_handler.complete_quest(char, 'a', quests)
+    assert available_ids(char, quests) == ['b', 'd']
+    quest_handler.accept_quest(char, 'b', quests)
+    quest_handler.abandon_quest(char, 'b')
+    assert available_ids(char, quests) == ['b', 'd']
+    assert char.quest_availability is availability
+
+def test_availability_unlocks_on_level_up():
+    """Test that gaining levels moves waiting quests into the available set"""
+    quests = make_catalog()
+    char = character_manager.create_character("LevelUpTest", "Rogue")
+    char['completed_quests'].extend(['a', 'b'])
+    assert available_ids(char, quests) == []
+
+    character_manager.gain_experience(char, 100 + 200 + 300 + 400)
+
+    assert char['level'] == 5
+    assert available_ids(char, quests) == ['c', 'd', 'e']
+
+def test_availability_rebuilds_after_direct_list_edit():
+    """Test that editing the quest lists by hand is detected"""
+    quests = make_catalog()
+    char = character_manager.create_character("EditTest", "Cleric")
+    assert available_ids(char, quests) == ['a']
+
+    char['completed_quests'].append('a')
+
+    assert available_ids(char, quests) == ['b']
+
+def test_availability_index_is_not_a_character_key():
+    """Test that the index stays out of the character's keys, equality and pickles"""
+    import pickle
+    quests = make_catalog()
+    char = character_manager.create_character("Twin", "Mage")
+    twin = character_manager.create_character("Twin", "Mage")
+    plain_size = len(pickle.dumps(char))
+
+    available_ids(char, quests)
+
+    assert char.quest_availability is not None
+    assert char == twin
+    assert list(char) == list(twin)
+    assert len(pickle.dumps(char)) == plain_size
+
+def test_abandon_rechecks_prerequisite_after_direct_edit():
+    """Test that an abandoned quest whose prerequisite was removed stays locked"""
+    quests = make_catalog()
+    char = character_manager.create_character("FuzzTest", "Warrior")
+    quest_handler.accept_quest(char, 'a', quests)
+    quest_handler.complete_quest(char, 'a', quests)
+    quest_handler.accept_quest(char, 'b', quests)
+    assert available_ids(char, quests) == []
+
+    char['completed_quests'][0] = 'x'
+    quest_handler.abandon_quest(char, 'b')
+
+    assert 'b' not in available_ids(char, quests)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,89 @@
+"""
+Test Tournament
+Tests the process-pool balance tournament and resuming a sweep
+"""
+
+import json
+import pytest
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tournament
+
+GRID = {'classes': ["Warrior", "Rogue"], 'levels': [1, 6], 'enemy_types': ["goblin", "dragon"],
+        'policies': ["attack", "random"]}
+
+# ============================================================================
+# CELL TESTS
+# ============================================================================
+
+def test_cell_results_are_reproducible():
+    """Test that a cell replays the same battles from its own seed"""
+    cell = ("Rogue", 3, "orc", "random")
+
+    first = tournament.run_cell(cell, 50, seed=4)
+
+    assert first == tournament.run_cell(cell, 50, seed=4)
+    assert first['wins'] + first['losses'] + first['escapes'] + first['draws'] == 50
+    assert tournament.cell_seed(4, cell) != tournament.cell_seed(5, cell)
+    assert tournament.cell_seed(4, cell) != tournament.cell_seed(4, ("Rogue", 3, "orc", "attack"))
+
+def test_deterministic_cell():
+    """Test a cell with no random rolls"""
+    row = tournament.run_cell(("Warrior", 1, "goblin", "attack"), 10, seed=0)
+
+    assert row['win_rate'] == 1.0
+    assert row['mean_turns'] == 4.0
+    assert row['mean_hp_left'] == 105.0
+
+# ============================================================================
+# SWEEP TESTS
+# ============================================================================
+
+def test_tournament_writes_csv_and_json(tmp_path):
+    """Test that every grid cell ends up in both outputs in grid order"""
+    csv_path = str(tmp_path / "matrix.csv")
+    json_path = str(tmp_path / "matrix.json")
+
+    rows = tournament.run_tournament(csv_path, battles=20, json_path=json_path, max_workers=2, **GRID)
+
+    cells = tournament.tournament_cells(**GRID)
+    assert [tournament._cell_key(row) for row in rows] == cells
+    assert tournament.read_results(csv_path) == rows
+    with open(json_path) as f:
+        assert json.load(f) == rows
+
+def test_tournament_resumes_partial_sweep(tmp_path):
+    """Test that a rerun keeps finished rows and fights only the rest"""
+    csv_path = str(tmp_path / "matrix.csv")
+    full = tournament.run_tournament(csv_path, battles=20, max_workers=2, **GRID)
+    with open(csv_path) as f:
+        lines = f.readlines()
+    with open(csv_path, "w") as f:
+        f.writelines(lines[:4])
+        f.write(lines[4][:10])
+    progress = []
+
+    resumed = tournament.run_tournament(csv_path, battles=20, max_workers=2,
+                                        progress=lambda done, total: progress.append(done), **GRID)
+
+    assert progress[0] == 3
+    assert progress[-1] == len(full)
+    assert resumed == full
+
+def test_changed_settings_rerun_every_cell(tmp_path):
+    """Test that rows for a different battle count are not reused"""
+    csv_path = str(tmp_path / "matrix.csv")
+    tournament.run_tournament(csv_path, battles=5, max_workers=1, **GRID)
+    progress = []
+
+    rows = tournament.run_tournament(csv_path, battles=6, max_workers=1,
+                                     progress=lambda done, total: progress.append(done), **GRID)
+
+    assert progress[0] == 0
+    assert all(row['battles'] == 6 for row in rows)
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,212 @@
+"""
+COMP 163 - Project 3: Quest Chronicles
+Tournament Module
+
+Balance matrices from real BattleEngine battles: every (class, level,
+enemy type, policy) cell of a grid is fought many times on a process
+pool, and the results are merged into a CSV (and optionally JSON) table.
+"""
+
+import csv
+import hashlib
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import character_manager
+import combat_system
+
+CHARACTER_CLASSES = ["Warrior", "Mage", "Rogue", "Cleric"]
+POLICY_NAMES = list(combat_system.POLICIES)
+
+TOURNAMENT_FIELDS = ["class", "level", "enemy", "policy", "battles", "seed",
+                     "wins", "losses", "escapes", "draws", "win_rate", "mean_turns", "mean_hp_left"]
+_INTEGER_FIELDS = ["level", "battles", "seed", "wins", "losses", "escapes", "draws"]
+_FLOAT_FIELDS = ["win_rate", "mean_turns", "mean_hp_left"]
+
+CELLS_PER_TASK = 8
+
+# ============================================================================
+# CELLS
+# ============================================================================
+
+def tournament_cells(classes=CHARACTER_CLASSES, levels=range(1, 51),
+                     enemy_types=None, policies=POLICY_NAMES):
+    """
+    Every (class, level, enemy_type, policy) combination, in grid order
+    (enemy_types defaults to every enemy in data/enemies.txt)
+    """
+    if enemy_types is None:
+        enemy_types = combat_system.get_enemy_types()
+    return [(character_class, level, enemy_type, policy)
+            for character_class in classes
+            for level in levels
+            for enemy_type in enemy_types
+            for policy in policies]
+
+def cell_seed(seed, cell):
+    """
+    Seed of one cell's random stream
+
+    Derived from the sweep seed and the cell itself (not from the worker
+    or the order cells finish in), so a cell always replays the same
+    battles and a resumed sweep matches an uninterrupted one.
+    """
+    key = f"{seed}:" + ":".join(str(part) for part in cell)
+    return int.from_bytes(hashlib.sha256(key.encode("utf-8")).digest()[:8], "little")
+
+def run_cell(cell, battles, seed):
+    """
+    Fight one cell's battles with its own random.Random stream
+    (deterministic cells take the combat_system.auto_resolve fast path)
+
+    Returns: Row dict with the TOURNAMENT_FIELDS keys
+    """
+    character_class, level, enemy_type, policy_name = cell
+    stream = cell_seed(seed, cell)
+    rng = random.Random(stream)
+    policy = combat_system.POLICIES[policy_name]()
+    template = dict(character_manager.create_character_at_level(character_class, character_class, level))
+    counts = {'player': 0, 'enemy': 0, 'draw': 0}
+    escapes = 0
+    total_turns = 0
+    total_hp_left = 0
+    for _ in range(battles):
+        result = combat_system.resolve_battle(dict(template), combat_system.create_enemy(enemy_type),
+                                              policy, rng=rng)
+        counts[result['winner']] += 1
+        escapes += result['escaped']
+        if result['winner'] == 'player':
+            total_turns += result['turns']
+            total_hp_left += result['character_health']
+    wins = counts['player']
+    return {
+        'class': character_class,
+        'level': level,
+        'enemy': enemy_type,
+        'policy': policy_name,
+        'battles': battles,
+        'seed': seed,
+        'wins': wins,
+        'losses': counts['enemy'] - escapes,
+        'escapes': escapes,
+        'draws': counts['draw'],
+        'win_rate': wins / battles if battles else 0.0,
+        'mean_turns': total_turns / wins if wins else 0.0,
+        'mean_hp_left': total_hp_left / wins if wins else 0.0,
+    }
+
+def _run_cells(cells, battles, seed):
+    return [run_cell(cell, battles, seed) for cell in cells]
+
+def _cell_key(row):
+    return (row['class'], row['level'], row['enemy'], row['policy'])
+
+# ============================================================================
+# RESUMABLE SWEEPS
+# ============================================================================
+
+def read_results(csv_path):
+    """
+    Rows already written to a tournament CSV
+
+    A missing file gives no rows; a torn or malformed row (e.g. from a
+    sweep that was killed mid-write) is skipped.
+    """
+    rows = []
+    try:
+        with open(csv_path, 'r', newline='', encoding='utf-8') as file:
+            reader = csv.DictReader(file)
+            if reader.fieldnames != TOURNAMENT_FIELDS:
+                return []
+            for record in reader:
+                try:
+                    row = dict(record)
+                    for field in _INTEGER_FIELDS:
+                        row[field] = int(row[field])
+                    for field in _FLOAT_FIELDS:
+                        row[field] = float(row[field])
+                except (TypeError, ValueError):
+                    continue
+                rows.append(row)
+    except FileNotFoundError:
+        pass
+    return rows
+
+def run_tournament(csv_path, classes=CHARACTER_CLASSES, levels=range(1, 51), enemy_types=None,
+                   policies=POLICY_NAMES, battles=200, seed=0, json_path=None,
+                   max_workers=None, progress=None):
+    """
+    Fight every cell of the grid and write the balance matrix
+
+    Cells are sent to a ProcessPoolExecutor in groups of CELLS_PER_TASK.
+    Each finished row is appended to csv_path straight away, so a sweep
+    that is interrupted can be run again with the same arguments: rows
+    already in the file (for the same battles and seed) are kept and only
+    the missing cells are fought. When every cell is done the CSV is
+    rewritten in grid order and, if json_path is given, the same rows are
+    written there as a JSON list.
+
+    progress, if given, is called as progress(cells_done, cells_total).
+
+    Returns: List of row dicts (TOURNAMENT_FIELDS keys) in grid order
+    Raises: ValueError for an unknown policy
+    """
+    for policy in policies:
+        if policy not in combat_system.POLICIES:
+            raise ValueError(f"Unknown policy: {policy}")
+    cells = tournament_cells(classes, levels, enemy_types, policies)
+    wanted = set(cells)
+    done = {}
+    for row in read_results(csv_path):
+        if _cell_key(row) in wanted and row['battles'] == battles and row['seed'] == seed:
+            done[_cell_key(row)] = row
+    remaining = [cell for cell in cells if cell not in done]
+
+    # Start the checkpoint file over from the rows being kept (this also
+    # drops a torn final line), then append new rows as they finish.
+    _write_csv(csv_path, done.values())
+    if progress:
+        progress(len(done), len(cells))
+    if remaining:
+        with open(csv_path, 'a', newline='', encoding='utf-8') as file, \
+                ProcessPoolExecutor(max_workers=max_workers) as executor:
+            writer = csv.DictWriter(file, TOURNAMENT_FIELDS)
+            tasks = [executor.submit(_run_cells, remaining[start:start + CELLS_PER_TASK], battles, seed)
+                     for start in range(0, len(remaining), CELLS_PER_TASK)]
+            for task in as_completed(tasks):
+                for row in task.result():
+                    writer.writerow(row)
+                    done[_cell_key(row)] = row
+                file.flush()
+                if progress:
+                    progress(len(done), len(cells))
+
+    rows = [done[cell] for cell in cells]
+    _write_csv(csv_path, rows)
+    if json_path is not None:
+        temp_path = json_path + ".tmp"
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(rows, file, indent=1)
+        os.replace(temp_path, json_path)
+    return rows
+
+def _write_csv(csv_path, rows):
+    temp_path = csv_path + ".tmp"
+    with open(temp_path, 'w', newline='', encoding='utf-8') as file:
+        writer = csv.DictWriter(file, TOURNAMENT_FIELDS)
+        writer.writeheader()
+        writer.writerows(rows)
+    os.replace(temp_path, csv_path)
+
+# ============================================================================
+# TESTING
+# ============================================================================
+
+if __name__ == "__main__":
+    print("=== TOURNAMENT TEST ===")
+    results = run_tournament("tournament.csv", levels=[1, 5, 10], battles=100,
+                             progress=lambda done, total: print(f"{done}/{total} cells"))
+    for row in results[:10]:
+        print(row)